@@ -1,34 +1,109 @@
 import time
-from ga import GeneticAlgorithm
-from aco import AntColony
+from .ga import GeneticAlgorithm
+from .aco import AntColony
+from .distance_matrix import get_distance_matrix
+from .local_search import LocalSearch
+from .profiling import get_profiler
+from .stopping import StoppingCriteria
 
 class HybridTSP:
-    def __init__(self, cities, logger=None, ga_params=None, aco_params=None):
+    def __init__(self, cities, logger=None, ga_params=None, aco_params=None, dist_matrix=None, local_search=False, progress=None, cancel=None, profiler=None, time_budget=None, budget_split=0.5, stagnation_rounds=None, stagnation_eps=0.0):
         self.cities = cities
+        self.dist_matrix = get_distance_matrix(cities, dist_matrix, dense=True)
         self.logger = logger
         self.ga_params = ga_params or {}
         self.aco_params = aco_params or {}
+        self.local_search = local_search
+        self.progress = progress
+        self.cancel = cancel
+        self.profiler = get_profiler(profiler)
+        self.stopping = StoppingCriteria(time_budget, stagnation_rounds, stagnation_eps)
+        self.budget_split = budget_split
+        self.ga = None
+        self.aco = None
+        self.log_overhead = 0.0
 
+    # ==============
+    # FR: Paramètres d'une phase: budget de temps alloué et critère de stagnation commun, sauf s'ils sont déjà précisés.
+    #
+    # EN: A phase's parameters: allotted time budget and shared stagnation criterion, unless already given.
+    # =========
+    def _phase_params(self, params, time_budget):
+        params = dict(params)
+        if time_budget is not None:
+            params.setdefault("time_budget", time_budget)
+        if self.stopping.stagnation_rounds:
+            params.setdefault("stagnation_rounds", self.stopping.stagnation_rounds)
+            params.setdefault("stagnation_eps", self.stopping.stagnation_eps)
+        return params
+
+    # ==============
+    # FR: Exécute le GA puis l'ACO amorcé par le meilleur chemin du GA; avec un budget de temps, le GA en reçoit la part
+    # budget_split et l'ACO tout le temps restant.
+    #
+    # EN: Runs the GA then the ACO seeded with the GA's best path; with a time budget, the GA gets the budget_split
+    # share and the ACO all the remaining time.
+    # =========
     def run(self):
         start_time = time.time()
+        stopping = self.stopping
+        stopping.start()
+        self.aco = None
+        ga_budget = stopping.time_budget * self.budget_split if stopping.time_budget is not None else None
 
         ga = GeneticAlgorithm(
             self.cities,
             logger=self.logger,
-            **self.ga_params
+            dist_matrix=self.dist_matrix,
+            progress=self.progress,
+            cancel=self.cancel,
+            profiler=self.profiler,
+            **self._phase_params(self.ga_params, ga_budget)
         )
+        self.ga = ga
         best_path_ga, best_distance_ga = ga.run()
+        stopping.reason = ga.stopping.reason
+        if stopping.time_budget is not None and stopping.remaining() <= 0:
+            best_path_aco, best_distance_aco = best_path_ga, best_distance_ga
+            stopping.reason = "budget"
+        else:
+            best_path_aco, best_distance_aco = self._run_aco(best_path_ga, stopping.remaining())
+        # FR: Mode à tout moment: on rend le meilleur tour trouvé, y compris celui du GA si l'ACO ne l'a pas amélioré.
+        # EN: Anytime mode: return the best tour found, including the GA's if the ACO did not improve on it.
+        if best_path_aco is None or best_distance_ga < best_distance_aco:
+            best_path_aco, best_distance_aco = best_path_ga, best_distance_ga
 
-        aco = AntColony(
-            self.cities,
-            initial_path=best_path_ga,
-            logger=self.logger,
-            **self.aco_params
-        )
-        best_path_aco, best_distance_aco = aco.run()
+        if self.local_search and best_path_aco is not None:
+            with self.profiler.phase("local_search"):
+                best_path_aco, best_distance_aco = LocalSearch(self.dist_matrix).improve(best_path_aco)
 
         duration = time.time() - start_time
         if self.logger:
-            self.logger.log("Hybride", best_distance_aco, duration)
+            # FR: Le surcoût d'une exécution hybride est le temps passé à journaliser ses deux phases.
+            # EN: A hybrid run's overhead is the time spent logging its two phases.
+            log_overhead = ga.log_overhead_total + (self.aco.log_overhead_total if self.aco else 0.0)
+            self.log_overhead = self.logger.log("Hybride", best_distance_aco, duration, log_overhead=log_overhead,
+                                                **self.profiler.pop_step())
 
         return best_path_aco, best_distance_aco
+
+    # ==============
+    # FR: Phase ACO amorcée par le chemin du GA, dans le temps restant.
+    #
+    # EN: ACO phase seeded with the GA's path, within the remaining time.
+    # =========
+    def _run_aco(self, best_path_ga, time_budget):
+        aco = AntColony(
+            self.cities,
+            initial_path=best_path_ga,
+            logger=self.logger,
+            dist_matrix=self.dist_matrix,
+            progress=self.progress,
+            cancel=self.cancel,
+            profiler=self.profiler,
+            **self._phase_params(self.aco_params, time_budget)
+        )
+        self.aco = aco
+        result = aco.run()
+        self.stopping.reason = aco.stopping.reason
+        return result
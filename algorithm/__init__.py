@@ -0,0 +1,35 @@
+import importlib
+
+# FR: Exports chargés à la demande: importer le paquet ne charge ni NumPy ni l'interface graphique.
+# EN: Exports loaded on demand: importing the package loads neither NumPy nor the GUI.
+# FR: HybridTSP n'est pas exporté ici (même nom que son module): from algorithm.HybridTSP import HybridTSP.
+# EN: HybridTSP is not exported here (same name as its module): from algorithm.HybridTSP import HybridTSP.
+_EXPORTS = {
+    "GeneticAlgorithm": "ga",
+    "IslandGeneticAlgorithm": "island_ga",
+    "AntColony": "aco",
+    "ClusterTSP": "cluster",
+    "LocalSearch": "local_search",
+    "DistanceMatrix": "distance_matrix",
+    "StatsLogger": "stats_logger",
+    "SolverRunner": "runner",
+    "load_instance": "instances",
+}
+
+__all__ = list(_EXPORTS)
+
+# ==============
+# FR: Importe le module d'un export au premier accès puis le met en cache dans le paquet.
+#
+# EN: Imports an export's module on first access, then caches it in the package.
+# =========
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,9 +1,56 @@
 import random
-import math
+import time
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from .distance_matrix import DistanceMatrix, get_distance_matrix
+from .local_search import LocalSearch
+from .pheromones import PheromoneStore
+from .profiling import get_profiler
+from .construction import construct
+from .stopping import StoppingCriteria
+from .shared_arrays import SharedArray, attach, detach, detach_at_exit
+
+_worker_colonies = {}
+
+# ==============
+# FR: Construit une tranche des fourmis dans un processus de travail, à partir d'un instantané partagé des phéromones.
+#
+# EN: Builds a slice of the ants in a worker process from a shared snapshot of the pheromones.
+# =========
+def _construct_ants(coords_spec, matrix_spec, pheromone_spec, params, count, seed):
+    colony = _worker_colonies.get(pheromone_spec[0])
+    if colony is None:
+        _release_worker()
+        cities = [tuple(city) for city in attach(coords_spec).tolist()]
+        dist_matrix = DistanceMatrix.from_matrix(cities, attach(matrix_spec))
+        colony = AntColony(cities, dist_matrix=dist_matrix, **params)
+        _worker_colonies[pheromone_spec[0]] = colony
+    colony.pheromones = attach(pheromone_spec)
+    random.seed(seed)
+    colony.rng = np.random.default_rng(seed)
+    return colony._construct_solutions(count)
+
+# ==============
+# FR: Initialise un processus de travail: ses segments de mémoire partagée seront fermés à sa sortie.
+#
+# EN: Initializes a worker process: its shared memory segments will be closed at exit.
+# =========
+def _init_worker():
+    detach_at_exit(_release_worker)
+
+# ==============
+# FR: Libère la colonie du processus de travail et ferme les segments de mémoire partagée de l'exécution précédente.
+#
+# EN: Releases the worker process's colony and closes the previous run's shared memory segments.
+# =========
+def _release_worker():
+    _worker_colonies.clear()
+    detach()
 
 class AntColony:
-    def __init__(self, cities, ant_count=20, iterations=50, alpha=1.0, beta=5.0, evap=0.3, initial_path=None, logger=None):
+    def __init__(self, cities, ant_count=20, iterations=50, alpha=1.0, beta=5.0, evap=0.3, initial_path=None, logger=None, dist_matrix=None, vectorized=True, candidates=None, local_search=False, workers=None, progress=None, cancel=None, profiler=None, seed_tour=None, time_budget=None, stagnation_rounds=None, stagnation_eps=0.0, initial_pheromones=None):
         self.cities = cities
+        self.dist_matrix = get_distance_matrix(cities, dist_matrix, dense=True)
         self.ant_count = ant_count
         self.iterations = iterations
         self.alpha = alpha
@@ -11,10 +58,66 @@ class AntColony:
         self.evap = evap
         self.n = len(cities)
         self.logger = logger
-        self.pheromones = [[0.1] * self.n for _ in range(self.n)]
+        self.vectorized = vectorized
+        self.candidates = candidates
+        self.workers = workers
+        self.progress = progress
+        self.cancel = cancel
+        self.profiler = get_profiler(profiler)
+        self.stopping = StoppingCriteria(time_budget, stagnation_rounds, stagnation_eps)
+        self.rng = np.random.default_rng(random.getrandbits(64))
+        self.pheromone_store = PheromoneStore(self.n, initial=0.1, minimum=0.001)
+        self.pheromones = self.pheromone_store.matrix
+        self.heuristic = self._build_heuristic()
+        self.neighbours = self.dist_matrix.neighbours(candidates) if candidates else None
+        self.neighbour_lists = self.neighbours.tolist() if candidates else None
+        self.local_search = LocalSearch(self.dist_matrix) if local_search else None
+        self.log_overhead = 0.0
+        self.log_overhead_total = 0.0
 
-        if initial_path:
+        if initial_pheromones is not None:
+            np.copyto(self.pheromones, initial_pheromones)
+        elif initial_path:
+            # FR: Dépôt historique de 5/L sur le niveau uniforme (phase ACO de l'hybride, reprise à chaud).
+            # EN: Historical 5/L deposit over the flat level (the hybrid's ACO phase, warm restarts).
             self._deposit_pheromones(initial_path, 5.0 / self._total_distance(initial_path))
+        elif seed_tour and self.n > 2:
+            self._seed_pheromones(construct(seed_tour, self.dist_matrix))
+
+    # ==============
+    # FR: Journalise une itération avec le temps passé dans l'appel précédent (celui-ci n'est connu qu'au retour).
+    #
+    # EN: Logs an iteration with the time spent in the previous call (this one's is only known on return).
+    # =========
+    def _log(self, distance, duration, **extra):
+        self.log_overhead = self.logger.log("ACO", distance, duration, log_overhead=self.log_overhead, **extra)
+        self.log_overhead_total += self.log_overhead
+
+    # ==============
+    # FR: Amorce les phéromones à partir d'un tour: niveau uniforme tau0 = fourmis / (evap * L), celui d'une arête
+    # empruntée par toutes les fourmis à l'équilibre, puis un dépôt de tau0 sur les arêtes du tour.
+    #
+    # EN: Seeds the pheromones from a tour: uniform level tau0 = ants / (evap * L), that of an edge every ant uses
+    # at equilibrium, then a tau0 deposit on the tour's edges.
+    # =========
+    def _seed_pheromones(self, path):
+        length = self._total_distance(path)
+        if length <= 0:
+            return
+        tau0 = max(self.ant_count / (self.evap * length), self.pheromone_store.minimum)
+        self.pheromones.fill(tau0)
+        self._deposit_pheromones(path, tau0)
+
+    # ==============
+    # FR: Précalcule la matrice heuristique (1/d)^beta, nulle pour les villes confondues.
+    #
+    # EN: Precomputes the (1/d)^beta heuristic matrix, zero for coincident cities.
+    # =========
+    def _build_heuristic(self):
+        dist = self.dist_matrix.matrix
+        heuristic = np.zeros_like(dist)
+        np.divide(1.0, dist, out=heuristic, where=dist > 0)
+        return heuristic ** self.beta
 
     # ==============
     # FR: Calcule la distance totale d'un chemin donné en visitant chaque ville dans l'ordre.
@@ -22,11 +125,7 @@ class AntColony:
     # EN: Calculates the total distance of a given path visiting each city in sequence.
     # =========
     def _total_distance(self, path):
-        dist = 0
-        for i in range(-1, len(path) - 1):
-            city_a, city_b = self.cities[path[i]], self.cities[path[i+1]]
-            dist += math.dist(city_a, city_b)
-        return dist
+        return self.dist_matrix.tour_length(path)
 
     # ==============
     # FR: Sélectionne la prochaine ville à visiter selon une roulette probabiliste influencée par les phéromones et la distance.
@@ -36,15 +135,22 @@ class AntColony:
     def _select_next(self, current, unvisited):
         probabilities = []
         total = 0.0
+        dist_row = self.dist_matrix.matrix[current]
+        cities = unvisited
+        if self.neighbour_lists:
+            candidates = [city for city in self.neighbour_lists[current] if city in unvisited]
+            if candidates:
+                cities = candidates
 
-        for city in unvisited:
+        for city in cities:
             tau = self.pheromones[current][city] ** self.alpha
-            dist = math.dist(self.cities[current], self.cities[city])
+            dist = dist_row[city]
             inv_dist = (1.0 / dist) ** self.beta if dist else 0
             prob = tau * inv_dist
             probabilities.append((city, prob))
             total += prob
 
+        self.profiler.count("rng_draws")
         if total <= 0:
             return random.choice(list(unvisited))
 
@@ -63,9 +169,7 @@ class AntColony:
     # EN: Evaporates part of the pheromones across all paths.
     # =========
     def _evaporate_pheromones(self):
-        for i in range(self.n):
-            for j in range(self.n):
-                self.pheromones[i][j] = max(self.pheromones[i][j] * (1 - self.evap), 0.001)
+        self.pheromone_store.evaporate(self.evap)
 
     # ==============
     # FR: Dépose une certaine quantité de phéromones sur un chemin parcouru.
@@ -73,10 +177,156 @@ class AntColony:
     # EN: Deposits a specified amount of pheromones along a given path.
     # =========
     def _deposit_pheromones(self, path, amount):
-        for i in range(-1, len(path) - 1):
-            a, b = path[i], path[i+1]
-            self.pheromones[a][b] += amount
-            self.pheromones[b][a] += amount
+        self.pheromone_store.deposit([path], [amount])
+
+    # ==============
+    # FR: Construit le chemin d'une fourmi ville par ville à partir de la ville 0.
+    #
+    # EN: Builds one ant's path city by city starting from city 0.
+    # =========
+    def _construct_path(self):
+        path = [0]
+        unvisited = set(range(1, self.n))
+        current = 0
+
+        while unvisited:
+            next_city = self._select_next(current, unvisited)
+            path.append(next_city)
+            unvisited.remove(next_city)
+            current = next_city
+
+        return path, self._total_distance(path)
+
+    # ==============
+    # FR: Tire une ville par ligne de poids: somme cumulée par ligne puis searchsorted avec une cible dans ]0, total], qui
+    # ne peut tomber sur une ville de poids nul ni dépasser la dernière ville de poids non nul.
+    #
+    # EN: Draws one city per weight row: per-row cumulative sum then searchsorted with a target in ]0, total], which can
+    # neither land on a zero-weight city nor go past the last non-zero-weight city.
+    # =========
+    def _sample_rows(self, weights):
+        rows = len(weights)
+        self.profiler.count("rng_draws", rows)
+        cumul = np.cumsum(weights, axis=1)
+        targets = (1.0 - self.rng.random(rows)) * cumul[:, -1]
+        return np.array([np.searchsorted(row, target) for row, target in zip(cumul, targets)], dtype=np.intp)
+
+    # ==============
+    # FR: Tire la prochaine ville de chaque fourmi parmi toutes ses villes non visitées.
+    #
+    # EN: Draws each ant's next city among all of its unvisited cities.
+    # =========
+    def _sample_unvisited(self, weights, current, visited):
+        rows = weights[current]
+        rows[visited] = 0.0
+        empty = rows.sum(axis=1) <= 0
+        if empty.any():
+            rows[empty] = ~visited[empty]
+        return self._sample_rows(rows)
+
+    # ==============
+    # FR: Tire la prochaine ville parmi les k plus proches voisines non visitées, sinon parmi toutes les non visitées.
+    #
+    # EN: Draws the next city among the unvisited k nearest neighbours, else among all unvisited cities.
+    # =========
+    def _sample_candidates(self, weights, current, visited, ants):
+        candidates = self.neighbours[current]
+        rows = weights[current[:, None], candidates]
+        rows[visited[ants[:, None], candidates]] = 0.0
+        has_candidate = rows.sum(axis=1) > 0
+        next_cities = np.empty(len(current), dtype=np.intp)
+        if has_candidate.any():
+            picks = self._sample_rows(rows[has_candidate])
+            next_cities[has_candidate] = candidates[has_candidate, picks]
+        fallback = ~has_candidate
+        if fallback.any():
+            next_cities[fallback] = self._sample_unvisited(weights, current[fallback], visited[fallback])
+        return next_cities
+
+    # ==============
+    # FR: Construit les chemins de toutes les fourmis en parallèle avec des matrices NumPy masquées.
+    #
+    # EN: Builds every ant's path together using masked NumPy probability rows.
+    # =========
+    def _construct_paths_vectorized(self, ant_count):
+        weights = (self.pheromones ** self.alpha) * self.heuristic
+        paths = np.zeros((ant_count, self.n), dtype=np.intp)
+        visited = np.zeros((ant_count, self.n), dtype=bool)
+        visited[:, 0] = True
+        current = paths[:, 0]
+        ants = np.arange(ant_count)
+
+        for step in range(1, self.n):
+            if self.neighbours is None:
+                current = self._sample_unvisited(weights, current, visited)
+            else:
+                current = self._sample_candidates(weights, current, visited, ants)
+            paths[:, step] = current
+            visited[ants, current] = True
+
+        lengths = self.dist_matrix.tour_lengths(paths)
+        return [(path.tolist(), float(length)) for path, length in zip(paths, lengths)]
+
+    # ==============
+    # FR: Construit les chemins d'un nombre donné de fourmis dans le processus courant.
+    #
+    # EN: Builds the paths of a given number of ants in the current process.
+    # =========
+    def _construct_solutions(self, count):
+        if self.vectorized:
+            return self._construct_paths_vectorized(count)
+        return [self._construct_path() for _ in range(count)]
+
+    # ==============
+    # FR: Ouvre le pool de processus et place villes, distances et phéromones en mémoire partagée.
+    #
+    # EN: Opens the process pool and moves cities, distances and pheromones into shared memory.
+    # =========
+    def _open_workers(self):
+        self._shared = [
+            SharedArray(np.asarray(self.cities, dtype=np.float64).reshape(self.n, 2)),
+            SharedArray(self.dist_matrix.matrix),
+            SharedArray(self.pheromones),
+        ]
+        self._set_pheromone_matrix(self._shared[2].array)
+        self._executor = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker)
+
+    # ==============
+    # FR: Ferme le pool de processus et libère la mémoire partagée.
+    #
+    # EN: Shuts the process pool down and releases the shared memory.
+    # =========
+    def _close_workers(self):
+        self._executor.shutdown()
+        self._set_pheromone_matrix(self.pheromones.copy())
+        for shared in self._shared:
+            shared.close()
+
+    # ==============
+    # FR: Remplace la matrice de phéromones sous-jacente (mémoire privée ou partagée).
+    #
+    # EN: Swaps the underlying pheromone matrix (private or shared memory).
+    # =========
+    def _set_pheromone_matrix(self, matrix):
+        self.pheromone_store.matrix = matrix
+        self.pheromones = matrix
+
+    # ==============
+    # FR: Répartit les fourmis de l'itération entre les processus, sur un instantané en lecture seule des phéromones.
+    #
+    # EN: Spreads the iteration's ants across the worker processes over a read-only pheromone snapshot.
+    # =========
+    def _construct_solutions_parallel(self):
+        coords, matrix, pheromones = self._shared
+        params = {"alpha": self.alpha, "beta": self.beta, "vectorized": self.vectorized, "candidates": self.candidates,
+                  "seed_tour": None}
+        slices = [len(part) for part in np.array_split(np.arange(self.ant_count), self.workers) if len(part)]
+        futures = [
+            self._executor.submit(_construct_ants, coords.spec, matrix.spec, pheromones.spec, params,
+                                  count, random.getrandbits(64))
+            for count in slices
+        ]
+        return [solution for future in futures for solution in future.result()]
 
     # ==============
     # FR: Exécute l'algorithme de colonie de fourmis pour trouver un chemin optimal.
@@ -84,37 +334,69 @@ class AntColony:
     # EN: Executes the ant colony algorithm to find an optimal path.
     # =========
     def run(self):
-        import time
+        self.stopping.start()
+        parallel = bool(self.workers and self.workers > 1)
+        if parallel:
+            self._open_workers()
+        try:
+            return self._run(parallel)
+        finally:
+            if parallel:
+                self._close_workers()
+
+    # ==============
+    # FR: Boucle principale des itérations: construction, recherche locale, évaporation et dépôt.
+    #
+    # EN: Main iteration loop: construction, local search, evaporation and deposit.
+    # =========
+    def _run(self, parallel):
         best_path = None
         best_dist = float('inf')
+        profiler = self.profiler
 
-        for it in range(self.iterations):
+        for it in self.stopping.rounds(0, self.iterations):
+            if self.cancel is not None and self.cancel.is_set():
+                break
+            if self.stopping.should_stop():
+                break
             start_time = time.time()
-            solutions = []
-            for _ in range(self.ant_count):
-                path = [0]
-                unvisited = set(range(1, self.n))
-                current = 0
-
-                while unvisited:
-                    next_city = self._select_next(current, unvisited)
-                    path.append(next_city)
-                    unvisited.remove(next_city)
-                    current = next_city
+            with profiler.phase("ACO"):
+                with profiler.phase("construction"):
+                    if parallel:
+                        solutions = self._construct_solutions_parallel()
+                        # FR: Les processus de travail n'ont pas de profileur: chaque fourmi y tire une ville par pas.
+                        # EN: Worker processes have no profiler: each ant there draws one city per step.
+                        profiler.count("rng_draws", len(solutions) * (self.n - 1))
+                    else:
+                        solutions = self._construct_solutions(self.ant_count)
+                # FR: Tours construits (évalués chacun une fois en entier); les deltas de la recherche locale ne sont pas
+                # comptés, ce compteur ne se compare donc pas à celui du GA.
+                # EN: Tours constructed (each evaluated once in full); the local search's deltas are not counted, so
+                # this counter does not compare with the GA's.
+                profiler.count("distance_evals", len(solutions))
 
-                dist_path = self._total_distance(path)
-                solutions.append((path, dist_path))
+                if self.local_search:
+                    with profiler.phase("local_search"):
+                        best_ant = min(range(len(solutions)), key=lambda k: solutions[k][1])
+                        solutions[best_ant] = self.local_search.improve(solutions[best_ant][0])
 
-                if dist_path < best_dist:
-                    best_path, best_dist = path, dist_path
+                for path, dist_path in solutions:
+                    if dist_path < best_dist:
+                        best_path, best_dist = path, dist_path
 
-            self._evaporate_pheromones()
-            for path, dist_path in solutions:
-                self._deposit_pheromones(path, 1.0 / dist_path)
+                with profiler.phase("evaporation"):
+                    self._evaporate_pheromones()
+                with profiler.phase("deposit"):
+                    self.pheromone_store.deposit([path for path, _ in solutions],
+                                                 [1.0 / dist_path for _, dist_path in solutions])
 
+            self.stopping.update(best_dist)
             duration = time.time() - start_time
+            step = profiler.pop_step()
             if self.logger:
-                self.logger.log("ACO", best_dist, duration, iteration=it)
+                self._log(best_dist, duration, iteration=it, **step)
+            if self.progress:
+                self.progress("ACO", it, best_path, best_dist)
 
         return best_path, best_dist
 
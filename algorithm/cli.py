@@ -0,0 +1,173 @@
+import argparse
+import contextlib
+import io
+import json
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+if __package__ in (None, ""):
+    # FR: Lancé comme script (python cli.py): on rend le paquet "algorithm" importable.
+    # EN: Run as a script (python cli.py): make the "algorithm" package importable.
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    import algorithm
+    __package__ = "algorithm"
+
+from .instances import load_instance, save_tour, tsplib_length
+from .profiling import Profiler
+from .runner import SOLVERS
+
+# ==============
+# FR: Convertit une liste "[ALGO:]cle=valeur" en paramètres d'un algorithme (valeurs JSON, clés pointées pour les sous-paramètres).
+#
+# EN: Converts an "[ALGO:]key=value" list into one algorithm's parameters (JSON values, dotted keys for nested parameters).
+# =========
+def parse_params(items, algo_name):
+    params = {}
+    for item in items or []:
+        key, sep, value = item.partition("=")
+        if not sep:
+            raise ValueError(f"Paramètre invalide (attendu cle=valeur): {item}")
+        prefix, colon, rest = key.partition(":")
+        if colon:
+            if prefix.strip() != algo_name:
+                continue
+            key = rest
+        try:
+            value = json.loads(value)
+        except ValueError:
+            pass
+        target = params
+        *parents, leaf = key.strip().split(".")
+        for parent in parents:
+            target = target.setdefault(parent, {})
+        target[leaf] = value
+    return params
+
+# ==============
+# FR: Retourne les fichiers d'instances (.tsp, .csv) désignés par des chemins de fichiers ou de dossiers.
+#
+# EN: Returns the instance files (.tsp, .csv) designated by file or directory paths.
+# =========
+def collect_instances(paths):
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files.extend(
+                os.path.join(path, name) for name in sorted(os.listdir(path))
+                if name.lower().endswith((".tsp", ".csv"))
+            )
+        else:
+            files.append(path)
+    return files
+
+# ==============
+# FR: Résout une instance avec un algorithme et une graine dans un processus de travail; écrit le tour et retourne les mesures.
+#
+# EN: Solves one instance with one algorithm and seed in a worker process; writes the tour and returns the metrics.
+# =========
+def solve_instance(path, algo_name, seed, params, out_dir, verbose=False, profile=False):
+    name, cities = load_instance(path)
+    random.seed(seed)
+    profiler = Profiler(trace=True) if profile else None
+    start = time.perf_counter()
+    # FR: Chaque solveur construit ses propres distances (pas de matrice n x n pour la décomposition en groupes).
+    # EN: Each solver builds its own distances (no n x n matrix for the cluster decomposition).
+    solver = SOLVERS[algo_name](cities, profiler=profiler, **params)
+    output = None if verbose else io.StringIO()
+    with contextlib.redirect_stdout(output) if output else contextlib.nullcontext():
+        tour, length = solver.run()
+    elapsed = time.perf_counter() - start
+    stem = os.path.join(out_dir, f"{name}_{algo_name}_s{seed}")
+    tour_path = stem + ".tour"
+    extra = {}
+    # FR: Les instances TSPLIB (EUC_2D) sont comparées en longueur arrondie arête par arête (nint), comme les optimums
+    # publiés; "distance" reste la longueur euclidienne non arrondie optimisée par les solveurs.
+    # EN: TSPLIB (EUC_2D) instances are compared with the per-edge rounded (nint) length, like the published optima;
+    # "distance" stays the unrounded Euclidean length optimized by the solvers.
+    if path.lower().endswith(".tsp"):
+        extra["tsplib_distance"] = tsplib_length(cities, tour)
+    save_tour(tour_path, name, tour, extra.get("tsplib_distance", length))
+    if profiler:
+        profiler.export_chrome_trace(stem + ".trace.json")
+        profiler.export_folded(stem + ".folded")
+        extra["profile"] = profiler.summary()
+    return {
+        "instance": name,
+        "file": path,
+        "n": len(cities),
+        "algo": algo_name,
+        "seed": seed,
+        "distance": float(length),
+        "time": elapsed,
+        "tour": tour_path,
+        "params": params,
+        "stop_reason": solver.stopping.reason if hasattr(solver, "stopping") else None,
+        **extra,
+    }
+
+# ==============
+# FR: Construit l'analyseur des arguments de la ligne de commande.
+#
+# EN: Builds the command-line argument parser.
+# =========
+def build_parser():
+    parser = argparse.ArgumentParser(description="Résolution TSP en lot, sans interface graphique.")
+    parser.add_argument("instances", nargs="+", help="fichiers .tsp/.csv ou dossiers d'instances")
+    parser.add_argument("--algo", nargs="+", choices=list(SOLVERS), default=["GA"], help="algorithmes à exécuter")
+    parser.add_argument("--seeds", nargs="+", type=int, default=[0], help="graines aléatoires")
+    parser.add_argument("--param", action="append", default=[], metavar="[ALGO:]CLE=VALEUR",
+                        help="paramètre du solveur (ex. GA:pop_size=100, Hybride:ga_params.max_gen=200)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="nombre de processus")
+    parser.add_argument("--out", default="results", help="dossier de sortie (tours et metrics.jsonl)")
+    parser.add_argument("--verbose", action="store_true", help="affiche la sortie des solveurs")
+    parser.add_argument("--profile", action="store_true",
+                        help="mesure le temps par phase (trace Chrome .trace.json et piles repliées .folded)")
+    return parser
+
+# ==============
+# FR: Point d'entrée: exécute toutes les combinaisons instance x algorithme x graine en parallèle.
+#
+# EN: Entry point: runs every instance x algorithm x seed combination in parallel.
+# =========
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    try:
+        params = {algo_name: parse_params(args.param, algo_name) for algo_name in args.algo}
+    except ValueError as e:
+        print(f"Erreur: {e}")
+        return 2
+    os.makedirs(args.out, exist_ok=True)
+    jobs = [
+        (path, algo_name, seed)
+        for path in collect_instances(args.instances)
+        for algo_name in args.algo
+        for seed in args.seeds
+    ]
+    failures = 0
+    with ProcessPoolExecutor(max_workers=max(1, args.workers)) as executor, \
+            open(os.path.join(args.out, "metrics.jsonl"), "a") as metrics:
+        futures = {
+            executor.submit(solve_instance, path, algo_name, seed, params[algo_name], args.out,
+                            args.verbose, args.profile): (path, algo_name, seed)
+            for path, algo_name, seed in jobs
+        }
+        for future in as_completed(futures):
+            path, algo_name, seed = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                failures += 1
+                print(f"Erreur sur {path} ({algo_name}, graine {seed}): {e}")
+                continue
+            metrics.write(json.dumps(result) + "\n")
+            metrics.flush()
+            rounded = f"  TSPLIB (nint) {result['tsplib_distance']}" if "tsplib_distance" in result else ""
+            print(f"{result['instance']:<20} {algo_name:<8} graine {seed:<4} "
+                  f"distance {result['distance']:.2f} (euclidienne non arrondie){rounded}  temps {result['time']:.2f}s")
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,346 @@
+import contextlib
+import io
+import math
+import multiprocessing
+import os
+import pickle
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, wait
+import numpy as np
+from .ga import GeneticAlgorithm
+from .aco import AntColony
+from .HybridTSP import HybridTSP
+from .construction import greedy_edge
+from .distance_matrix import CoordinateDistance, DistanceMatrix
+from .local_search import LocalSearch
+from .profiling import Profiler, get_profiler
+
+SUB_SOLVERS = {"GA": GeneticAlgorithm, "ACO": AntColony, "Hybride": HybridTSP}
+DEFAULT_SUB_PARAMS = {
+    "GA": {"max_gen": 30},
+    "ACO": {"iterations": 20},
+    "Hybride": {"local_search": True, "ga_params": {"max_gen": 30}, "aco_params": {"iterations": 20}},
+}
+
+# ==============
+# FR: Résout un groupe de villes dans un processus de travail avec le GA, l'ACO ou l'hybride; retourne le tour en indices
+# locaux (None si annulé) et les compteurs mesurés par le sous-solveur (évaluations de distance, mutations...).
+#
+# EN: Solves one group of cities in a worker process with the GA, ACO or hybrid; returns the tour in local indices (None
+# when cancelled) and the counters measured by the sub-solver (distance evaluations, mutations...).
+# =========
+def _solve_cluster(cities, algo_name, params, seed, cancel=None):
+    if len(cities) <= 3:
+        return list(range(len(cities))), {}
+    random.seed(seed)
+    profiler = Profiler()
+    solver = SUB_SOLVERS[algo_name](cities, dist_matrix=DistanceMatrix(cities), cancel=cancel, profiler=profiler,
+                                    **params)
+    with contextlib.redirect_stdout(io.StringIO()):
+        tour, _ = solver.run()
+    return tour, profiler.summary()["counters"]
+
+# ==============
+# FR: Retourne l'événement d'annulation s'il peut être transmis à d'autres processus (Event d'un Manager), sinon None:
+# il n'est alors consulté que par le processus courant.
+#
+# EN: Returns the cancel event if it can be sent to other processes (a Manager's Event), else None: it is then only
+# checked by the current process.
+# =========
+def _shareable(cancel):
+    try:
+        pickle.dumps(cancel)
+    except Exception:
+        return None
+    return cancel
+
+# ==============
+# FR: K-moyennes (initialisation k-means++), affectation par blocs pour borner la mémoire; retourne l'étiquette de chaque point.
+#
+# EN: K-means (k-means++ seeding), with chunked assignment to bound memory; returns each point's label.
+# =========
+def kmeans(coords, k, iterations=20, rng=None, chunk=4096):
+    rng = rng or np.random.default_rng(random.getrandbits(64))
+    n = len(coords)
+    centres = np.empty((k, 2))
+    centres[0] = coords[rng.integers(n)]
+    closest = ((coords - centres[0]) ** 2).sum(axis=1)
+    for c in range(1, k):
+        total = closest.sum()
+        pick = rng.choice(n, p=closest / total) if total > 0 else rng.integers(n)
+        centres[c] = coords[pick]
+        np.minimum(closest, ((coords - centres[c]) ** 2).sum(axis=1), out=closest)
+
+    labels = np.zeros(n, dtype=np.intp)
+    for _ in range(iterations):
+        for start in range(0, n, chunk):
+            block = coords[start:start + chunk]
+            labels[start:start + chunk] = ((block[:, None, :] - centres[None, :, :]) ** 2).sum(axis=2).argmin(axis=1)
+        counts = np.bincount(labels, minlength=k)
+        sums = np.zeros((k, 2))
+        np.add.at(sums, labels, coords)
+        moved = centres.copy()
+        filled = counts > 0
+        moved[filled] = sums[filled] / counts[filled, None]
+        if np.allclose(moved, centres):
+            break
+        centres = moved
+    return labels
+
+class ClusterTSP:
+    POLL_INTERVAL = 0.1
+
+    def __init__(self, cities, cluster_size=150, algo="Hybride", params=None, workers=None, boundary_neighbours=8,
+                 stitch_candidates=8, kmeans_iterations=20, logger=None, dist_matrix=None, progress=None, cancel=None,
+                 profiler=None):
+        self.cities = cities
+        self.n = len(cities)
+        self.coords = np.asarray(cities, dtype=np.float64).reshape(self.n, 2)
+        if dist_matrix is not None and dist_matrix.matches(cities):
+            self.distances = dist_matrix
+        else:
+            self.distances = CoordinateDistance(cities)
+        self.cluster_size = cluster_size
+        if algo not in SUB_SOLVERS:
+            raise ValueError(f"Solveur de groupe inconnu: {algo} (choix: {', '.join(SUB_SOLVERS)})")
+        self.algo = algo
+        self.params = DEFAULT_SUB_PARAMS[algo] if params is None else params
+        # FR: Dans un processus de travail (CLI, interface), un seul processus par défaut: pas de pool imbriqué.
+        # EN: Inside a worker process (CLI, GUI), a single process by default: no nested pool.
+        self.workers = workers or (1 if multiprocessing.parent_process() is not None else os.cpu_count() or 1)
+        self.boundary_neighbours = boundary_neighbours
+        self.stitch_candidates = stitch_candidates
+        self.kmeans_iterations = kmeans_iterations
+        self.logger = logger
+        self.progress = progress
+        self.cancel = cancel
+        self.profiler = get_profiler(profiler)
+        self.clusters = []
+
+    # ==============
+    # FR: Partitionne les villes par k-moyennes; les groupes trop grands (plus de deux fois cluster_size) sont redécoupés.
+    #
+    # EN: Partitions the cities with k-means; oversized groups (more than twice cluster_size) are split again.
+    # =========
+    def _partition(self):
+        pending = [np.arange(self.n)]
+        clusters = []
+        while pending:
+            members = pending.pop()
+            if len(members) <= 2 * self.cluster_size:
+                clusters.append(members)
+                continue
+            k = max(2, math.ceil(len(members) / self.cluster_size))
+            labels = kmeans(self.coords[members], k, self.kmeans_iterations)
+            groups = [members[labels == label] for label in range(k)]
+            groups = [group for group in groups if len(group)]
+            if len(groups) == 1:
+                clusters.append(members)
+                continue
+            pending.extend(groups)
+        return clusters
+
+    # ==============
+    # FR: Résout tous les groupes, en parallèle s'il y a plusieurs processus; retourne leurs tours en indices globaux,
+    # ou None si l'exécution est annulée (les sous-solveurs reçoivent l'annulation et les groupes en attente sont
+    # abandonnés). Les compteurs des sous-solveurs sont ajoutés à ceux du profileur.
+    #
+    # EN: Solves every group, in parallel when there are several processes; returns their tours in global indices, or
+    # None when the run is cancelled (the sub-solvers receive the cancellation and pending groups are dropped). The
+    # sub-solvers' counters are added to the profiler's.
+    # =========
+    def _solve_clusters(self, clusters):
+        jobs = [([tuple(city) for city in self.coords[members].tolist()], random.getrandbits(64)) for members in clusters]
+        if self.workers > 1 and len(clusters) > 1:
+            results = self._solve_parallel(jobs)
+        else:
+            results = []
+            for cities, seed in jobs:
+                if self._cancelled():
+                    return None
+                results.append(_solve_cluster(cities, self.algo, self.params, seed, self.cancel))
+        if results is None or self._cancelled():
+            return None
+        for _, counters in results:
+            for name, amount in counters.items():
+                self.profiler.count(name, amount)
+        return [members[tour].tolist() for members, (tour, _) in zip(clusters, results)]
+
+    # ==============
+    # FR: Répartit les groupes entre les processus; l'annulation est vérifiée périodiquement pendant l'attente, puis le
+    # pool est arrêté sans attendre les groupes en cours.
+    #
+    # EN: Spreads the groups across the processes; cancellation is checked periodically while waiting, then the pool is
+    # shut down without waiting for the running groups.
+    # =========
+    def _solve_parallel(self, jobs):
+        cancel = _shareable(self.cancel)
+        executor = ProcessPoolExecutor(max_workers=min(self.workers, len(jobs)))
+        cancelled = False
+        try:
+            futures = [executor.submit(_solve_cluster, cities, self.algo, self.params, seed, cancel)
+                       for cities, seed in jobs]
+            pending = set(futures)
+            while pending:
+                if self._cancelled():
+                    cancelled = True
+                    return None
+                _, pending = wait(pending, timeout=self.POLL_INTERVAL)
+            return [future.result() for future in futures]
+        finally:
+            executor.shutdown(wait=not cancelled, cancel_futures=True)
+
+    # ==============
+    # FR: Indique si l'exécution a été annulée.
+    #
+    # EN: Tells whether the run was cancelled.
+    # =========
+    def _cancelled(self):
+        return self.cancel is not None and self.cancel.is_set()
+
+    # ==============
+    # FR: Tour grossier des centres de groupes (arêtes gloutonnes puis 2-opt/Or-opt).
+    #
+    # EN: Coarse tour over the group centres (greedy edges then 2-opt/Or-opt).
+    # =========
+    @staticmethod
+    def _coarse_order(centres):
+        if len(centres) <= 3:
+            return list(range(len(centres)))
+        matrix = DistanceMatrix([tuple(centre) for centre in centres.tolist()])
+        tour, _ = LocalSearch(matrix).improve(greedy_edge(matrix))
+        return tour
+
+    # ==============
+    # FR: Arêtes candidates à la coupure dans le tour d'un groupe: les plus proches des groupes précédent et suivant.
+    # Chaque état (entrée, sortie, gain) ouvre le cycle en chemin de l'entrée à la sortie en retirant une arête.
+    #
+    # EN: Candidate edges to cut in a group's tour: those closest to the previous and next groups.
+    # Each state (entry, exit, gain) opens the cycle into a path from entry to exit by removing one edge.
+    # =========
+    def _cut_states(self, tour, prev_centre, next_centre):
+        if len(tour) == 1:
+            return [(0, 0, 0.0)]
+        points = self.coords[tour]
+        following = np.roll(np.arange(len(tour)), -1)
+        lengths = np.sqrt(((points - points[following]) ** 2).sum(axis=1))
+        mids = (points + points[following]) / 2
+        edges = set()
+        for centre in (prev_centre, next_centre):
+            near = np.argsort(((mids - centre) ** 2).sum(axis=1), kind="stable")[:self.stitch_candidates]
+            edges.update(near.tolist())
+        states = []
+        for j in sorted(edges):
+            k = int(following[j])
+            states.append((k, j, float(lengths[j])))
+            states.append((j, k, float(lengths[j])))
+        return states
+
+    # ==============
+    # FR: Ouvre le cycle d'un groupe en chemin de la position entry à la position exit (voisines dans le cycle).
+    #
+    # EN: Opens a group's cycle into a path from position entry to position exit (neighbours in the cycle).
+    # =========
+    @staticmethod
+    def _open_path(tour, entry, exit_):
+        m = len(tour)
+        step = 1 if exit_ == (entry - 1) % m else -1
+        return [tour[(entry + step * i) % m] for i in range(m)]
+
+    # ==============
+    # FR: Recoud les tours des groupes dans l'ordre grossier: programmation dynamique cyclique sur les coupures candidates,
+    # minimisant (arêtes de liaison - arêtes retirées).
+    #
+    # EN: Stitches the group tours in the coarse order: cyclic dynamic programming over the candidate cuts, minimizing
+    # (linking edges - removed edges).
+    # =========
+    def _stitch(self, tours, centres):
+        k = len(tours)
+        if k == 1:
+            return tours[0]
+        states = [self._cut_states(tours[i], centres[i - 1], centres[(i + 1) % k]) for i in range(k)]
+        dist = self.distances.dist
+        best_cost, best_choice = float('inf'), None
+        for first in range(len(states[0])):
+            cost = [float('inf')] * len(states[0])
+            cost[first] = -states[0][first][2]
+            back = []
+            for i in range(1, k):
+                prev_tour, tour = tours[i - 1], tours[i]
+                new_cost, links = [], []
+                for entry, _, gain in states[i]:
+                    city = tour[entry]
+                    options = [
+                        cost[p] + dist(prev_tour[states[i - 1][p][1]], city)
+                        for p in range(len(states[i - 1]))
+                    ]
+                    p = min(range(len(options)), key=options.__getitem__)
+                    new_cost.append(options[p] - gain)
+                    links.append(p)
+                cost = new_cost
+                back.append(links)
+            first_city = tours[0][states[0][first][0]]
+            closing = [cost[s] + dist(tours[-1][states[-1][s][1]], first_city) for s in range(len(cost))]
+            last = min(range(len(closing)), key=closing.__getitem__)
+            if closing[last] < best_cost:
+                choice = [last]
+                for links in reversed(back):
+                    choice.append(links[choice[-1]])
+                best_cost, best_choice = closing[last], choice[::-1]
+        path = []
+        for tour, group_states, s in zip(tours, states, best_choice):
+            entry, exit_, _ = group_states[s]
+            path.extend(self._open_path(tour, entry, exit_))
+        return path
+
+    # ==============
+    # FR: Villes frontières: celles dont un des k plus proches voisins appartient à un autre groupe.
+    #
+    # EN: Boundary cities: those with one of their k nearest neighbours in another group.
+    # =========
+    def _boundary_cities(self, clusters):
+        labels = np.empty(self.n, dtype=np.intp)
+        for label, members in enumerate(clusters):
+            labels[members] = label
+        neighbours = self.distances.neighbours(self.boundary_neighbours)
+        return np.flatnonzero((labels[neighbours] != labels[:, None]).any(axis=1)).tolist()
+
+    # ==============
+    # FR: Décompose, résout les groupes, les ordonne, recoud les sous-tours puis améliore les frontières par recherche locale.
+    #
+    # EN: Decomposes, solves the groups, orders them, stitches the sub-tours, then improves the boundaries by local search.
+    # =========
+    def run(self):
+        start_time = time.time()
+        if self.n <= 3:
+            tour = list(range(self.n))
+            return tour, self.distances.tour_length(tour)
+        profiler = self.profiler
+        with profiler.phase("Cluster"):
+            with profiler.phase("partition"):
+                clusters = self._partition()
+            with profiler.phase("clusters"):
+                tours = self._solve_clusters(clusters)
+            if tours is None:
+                return None, float('inf')
+            with profiler.phase("coarse"):
+                centres = np.array([self.coords[members].mean(axis=0) for members in clusters])
+                order = self._coarse_order(centres)
+                clusters = [clusters[i] for i in order]
+                tours = [tours[i] for i in order]
+            with profiler.phase("stitch"):
+                tour = self._stitch(tours, centres[order])
+            with profiler.phase("local_search"):
+                start = tour.index(0)
+                tour = tour[start:] + tour[:start]
+                tour, distance = LocalSearch(self.distances, candidates=self.boundary_neighbours).improve(
+                    tour, active=self._boundary_cities(clusters))
+        self.clusters = clusters
+
+        duration = time.time() - start_time
+        if self.logger:
+            self.logger.log("Cluster", distance, duration, clusters=len(clusters), **profiler.pop_step())
+        if self.progress:
+            self.progress("Cluster", 0, tour, distance)
+        return tour, distance
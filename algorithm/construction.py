@@ -0,0 +1,215 @@
+import random
+import numpy as np
+from .spatial import SpatialGrid
+
+# ==============
+# FR: Fait tourner un tour pour qu'il commence par la ville 0 (convention des solveurs).
+#
+# EN: Rotates a tour so that it starts at city 0 (the solvers' convention).
+# =========
+def _rotate_to_zero(tour):
+    start = tour.index(0)
+    return tour[start:] + tour[:start]
+
+# ==============
+# FR: Plus proche voisin à partir de la ville 0; la grille spatiale (villes visitées retirées) évite le parcours en O(n²).
+#
+# EN: Nearest neighbour from city 0; the spatial grid (visited cities removed) avoids the O(n²) scan.
+# =========
+def nearest_neighbour(dist_matrix):
+    return randomized_nearest_neighbour(dist_matrix, k=1, noise=0.0, start=0)
+
+# ==============
+# FR: Plus proche voisin randomisé: départ aléatoire, puis la plus proche non visitée, ou avec une probabilité noise
+# une ville tirée parmi les k plus proches.
+#
+# EN: Randomized nearest neighbour: random start, then the closest unvisited city, or with probability noise
+# a city drawn among the k closest ones.
+# =========
+def randomized_nearest_neighbour(dist_matrix, k=3, noise=0.1, start=None):
+    cities = dist_matrix.cities
+    n = len(cities)
+    if n == 0:
+        return []
+    grid = SpatialGrid(cities)
+    current = random.randrange(n) if start is None else start
+    grid.remove(current)
+    tour = [current]
+    for _ in range(n - 1):
+        x, y = cities[current]
+        if noise and random.random() < noise:
+            current = random.choice(grid.k_nearest(x, y, k))
+        else:
+            current = grid.k_nearest(x, y, 1)[0]
+        grid.remove(current)
+        tour.append(current)
+    return _rotate_to_zero(tour)
+
+# ==============
+# FR: Appariement glouton des arêtes: les arêtes candidates (k plus proches voisins) sont ajoutées par longueur
+# croissante tant qu'elles ne créent ni degré 3 ni cycle; les fragments restants sont reliés au plus proche.
+#
+# EN: Greedy edge matching: candidate edges (k nearest neighbours) are added by increasing length as long as they
+# create neither a degree 3 nor a cycle; the remaining fragments are joined to the closest one.
+# =========
+def greedy_edge(dist_matrix, candidates=10):
+    n = dist_matrix.n
+    if n < 3:
+        return list(range(n))
+    neighbours = dist_matrix.neighbours(candidates)
+    starts = np.repeat(np.arange(n), neighbours.shape[1])
+    ends = neighbours.ravel()
+    keep = starts < ends
+    starts, ends = starts[keep], ends[keep]
+    order = np.argsort(dist_matrix.pair_distances(starts, ends), kind="stable")
+
+    adj = [[] for _ in range(n)]
+    parent = list(range(n))
+
+    def find(a):
+        while parent[a] != a:
+            parent[a] = parent[parent[a]]
+            a = parent[a]
+        return a
+
+    for a, b in zip(starts[order].tolist(), ends[order].tolist()):
+        if len(adj[a]) < 2 and len(adj[b]) < 2:
+            root_a, root_b = find(a), find(b)
+            if root_a != root_b:
+                parent[root_a] = root_b
+                adj[a].append(b)
+                adj[b].append(a)
+    return _join_fragments(dist_matrix, _fragments(adj))
+
+# ==============
+# FR: Découpe une adjacence de degré au plus 2 (sans cycle) en chemins, une ville isolée formant un chemin à elle seule.
+#
+# EN: Splits an adjacency of degree at most 2 (without cycles) into paths, an isolated city being a path on its own.
+# =========
+def _fragments(adj):
+    seen = bytearray(len(adj))
+    fragments = []
+    for city, links in enumerate(adj):
+        if seen[city] or len(links) == 2:
+            continue
+        fragment = [city]
+        seen[city] = 1
+        prev, current = None, city
+        while True:
+            following = [nxt for nxt in adj[current] if nxt != prev]
+            if not following:
+                break
+            prev, current = current, following[0]
+            fragment.append(current)
+            seen[current] = 1
+        fragments.append(fragment)
+    return fragments
+
+# ==============
+# FR: Relie les fragments en un tour: depuis l'extrémité courante, on enchaîne le fragment dont une extrémité est la plus proche.
+#
+# EN: Joins the fragments into one tour: from the current end, chains the fragment with the closest endpoint.
+# =========
+def _join_fragments(dist_matrix, fragments):
+    tour = fragments.pop(0)
+    while fragments:
+        heads = np.array([fragment[0] for fragment in fragments])
+        tails = np.array([fragment[-1] for fragment in fragments])
+        to_head = dist_matrix.pair_distances(tour[-1], heads)
+        to_tail = dist_matrix.pair_distances(tour[-1], tails)
+        best = int(np.argmin(np.minimum(to_head, to_tail)))
+        fragment = fragments.pop(best)
+        tour.extend(fragment if to_head[best] <= to_tail[best] else reversed(fragment))
+    return _rotate_to_zero(tour)
+
+# ==============
+# FR: Indices de Hilbert des points (courbe d'ordre donné), calculés niveau par niveau sur tous les points à la fois.
+#
+# EN: Hilbert indices of the points (curve of the given order), computed level by level for all points at once.
+# =========
+def _hilbert_keys(coords, order=16):
+    side = 1 << order
+    mins = coords.min(axis=0)
+    span = max(float((coords.max(axis=0) - mins).max()), 1e-12)
+    scaled = ((coords - mins) / span * (side - 1)).astype(np.int64)
+    x, y = scaled[:, 0].copy(), scaled[:, 1].copy()
+    keys = np.zeros(len(coords), dtype=np.int64)
+    s = side >> 1
+    while s > 0:
+        rx = (x & s) > 0
+        ry = (y & s) > 0
+        keys += s * s * ((3 * rx.astype(np.int64)) ^ ry.astype(np.int64))
+        flip = ~ry & rx
+        x[flip] = side - 1 - x[flip]
+        y[flip] = side - 1 - y[flip]
+        swap = ~ry
+        x[swap], y[swap] = y[swap], x[swap].copy()
+        s >>= 1
+    return keys
+
+# ==============
+# FR: Ordre de la courbe de Hilbert: les villes proches sur la courbe le sont dans le plan (O(n log n)).
+#
+# EN: Hilbert curve order: cities close on the curve are close in the plane (O(n log n)).
+# =========
+def space_filling_curve(dist_matrix):
+    if dist_matrix.n == 0:
+        return []
+    coords = np.asarray(dist_matrix.cities, dtype=np.float64).reshape(dist_matrix.n, 2)
+    return _rotate_to_zero(np.argsort(_hilbert_keys(coords), kind="stable").tolist())
+
+CONSTRUCTORS = {
+    "greedy": greedy_edge,
+    "nn": nearest_neighbour,
+    "hilbert": space_filling_curve,
+    "random_nn": randomized_nearest_neighbour,
+}
+
+# ==============
+# FR: Construit un tour avec l'heuristique correspondant à un nom ("greedy", "nn", "hilbert" ou "random_nn").
+#
+# EN: Builds a tour with the heuristic matching a name ("greedy", "nn", "hilbert" or "random_nn").
+# =========
+def construct(name, dist_matrix):
+    if name not in CONSTRUCTORS:
+        raise ValueError(f"Heuristique de construction inconnue: {name} (choix: {', '.join(CONSTRUCTORS)})")
+    return CONSTRUCTORS[name](dist_matrix)
+
+# ==============
+# FR: Applique un mouvement 2-opt aléatoire (inversion d'un segment) sans déplacer la ville 0.
+#
+# EN: Applies a random 2-opt move (reversal of a segment) without moving city 0.
+# =========
+def _random_two_opt(tour):
+    tour = list(tour)
+    i, j = sorted(random.sample(range(1, len(tour)), 2))
+    tour[i:j + 1] = tour[i:j + 1][::-1]
+    return tour
+
+# ==============
+# FR: Produit jusqu'à count tours d'amorçage distincts: un par heuristique déterministe, puis des plus proches voisins
+# randomisés, puis des variantes par 2-opt aléatoire. Sur de petites instances les heuristiques se répètent souvent, et
+# des copies identiques occuperaient toutes les places d'élite sans rien apporter au croisement.
+#
+# EN: Produces up to count distinct seed tours: one per deterministic heuristic, then randomized nearest neighbours,
+# then random 2-opt variants. On small instances the heuristics often repeat themselves, and identical copies would
+# fill every elite slot without adding anything to crossover.
+# =========
+def seed_tours(dist_matrix, count, attempts=3):
+    tours, seen = [], set()
+
+    def add(tour):
+        if tuple(tour) not in seen:
+            seen.add(tuple(tour))
+            tours.append(tour)
+
+    for name in ("greedy", "nn", "hilbert")[:count]:
+        add(construct(name, dist_matrix))
+    tries = 0
+    while len(tours) < count and tries < attempts * count:
+        add(randomized_nearest_neighbour(dist_matrix))
+        tries += 1
+    while len(tours) < count and dist_matrix.n > 2 and tries < 2 * attempts * count:
+        add(_random_two_opt(random.choice(tours)))
+        tries += 1
+    return tours
@@ -0,0 +1,289 @@
+import random
+import numpy as np
+
+# ==============
+# FR: Croisement ordonné (OX) en O(n): segment de p1, puis gènes manquants dans l'ordre de p2 (tableau d'appartenance).
+#
+# EN: O(n) order crossover (OX): a segment of p1, then the missing genes in p2's order (membership array).
+# =========
+def order_crossover(p1, p2):
+    size = len(p1)
+    child = [0] * size
+    start, end = sorted(random.sample(range(1, size), 2))
+    child[start:end] = p1[start:end]
+    used = bytearray(size)
+    for gene in p1[start:end]:
+        used[gene] = 1
+    used[0] = 1
+    pos = end
+    for gene in p2[1:]:
+        if not used[gene]:
+            if pos >= size:
+                pos = 1
+            child[pos] = gene
+            pos += 1
+    return child
+
+# ==============
+# FR: Croisement ordonné vectorisé: produit tous les enfants d'un lot (une ligne par couple de parents) en un appel.
+#
+# EN: Vectorized order crossover: produces a whole batch of children (one row per parent pair) in one call.
+# =========
+def order_crossover_batch(parents1, parents2, rng):
+    parents1 = np.asarray(parents1)
+    parents2 = np.asarray(parents2)
+    count, size = parents1.shape
+    rows = np.arange(count)[:, None]
+    cuts = np.sort(np.argsort(rng.random((count, size - 1)), axis=1)[:, :2] + 1, axis=1)
+    start, end = cuts[:, :1], cuts[:, 1:]
+    index = np.arange(size)[None, :]
+    segment = (index >= start) & (index < end)
+
+    children = np.zeros_like(parents1)
+    children[segment] = parents1[segment]
+    used = np.zeros((count, size), dtype=bool)
+    used[rows, np.where(segment, parents1, 0)] = True
+
+    tail = parents2[:, 1:]
+    keep = ~used[rows, tail]
+    genes = np.take_along_axis(tail, np.argsort(~keep, axis=1, kind="stable"), axis=1)
+    positions = (np.arange(size - 1)[None, :] + end - 1) % (size - 1) + 1
+    valid = np.arange(size - 1)[None, :] < keep.sum(axis=1, keepdims=True)
+    children[np.broadcast_to(rows, valid.shape)[valid], positions[valid]] = genes[valid]
+    return children
+
+# ==============
+# FR: Croisement PMX en O(n) grâce à un tableau de positions de l'enfant.
+#
+# EN: O(n) partially mapped crossover (PMX) using a position array of the child.
+# =========
+def partially_mapped_crossover(p1, p2):
+    size = len(p1)
+    start, end = sorted(random.sample(range(1, size), 2))
+    child = list(p2)
+    positions = [0] * size
+    for i, gene in enumerate(child):
+        positions[gene] = i
+    for i in range(start, end):
+        gene = p1[i]
+        j = positions[gene]
+        child[i], child[j] = gene, child[i]
+        positions[child[j]] = j
+        positions[gene] = i
+    return child
+
+# ==============
+# FR: Croisement par recombinaison d'arêtes (ERX): suit les arêtes communes aux parents en privilégiant les villes les moins connectées.
+#
+# EN: Edge recombination crossover (ERX): follows the parents' edges, favouring the least connected cities.
+# =========
+def edge_recombination_crossover(p1, p2):
+    size = len(p1)
+    edges = [set() for _ in range(size)]
+    for parent in (p1, p2):
+        for i in range(size):
+            a, b = parent[i - 1], parent[i]
+            edges[a].add(b)
+            edges[b].add(a)
+
+    remaining = list(range(1, size))
+    slot = list(range(-1, size - 1))
+    child = [0]
+    current = 0
+    while remaining:
+        for city in edges[current]:
+            edges[city].discard(current)
+        candidates = edges[current]
+        if candidates:
+            fewest = min(len(edges[city]) for city in candidates)
+            current = random.choice([city for city in candidates if len(edges[city]) == fewest])
+        else:
+            current = random.choice(remaining)
+        last = remaining.pop()
+        if last != current:
+            remaining[slot[current]] = last
+            slot[last] = slot[current]
+        child.append(current)
+    return child
+
+class EAXLite:
+    def __init__(self, dist_matrix, candidates=10):
+        self.draws = 0
+        self.dist = dist_matrix.matrix.item if dist_matrix.matrix is not None else dist_matrix.dist
+        self.neighbour_lists = dist_matrix.neighbours(candidates).tolist()
+
+    # ==============
+    # FR: Croisement EAX simplifié: applique un seul cycle AB de p2 à p1, puis recolle les sous-tours au moindre coût.
+    #
+    # EN: Simplified EAX: applies a single AB-cycle of p2 to p1, then reconnects the sub-tours at least cost.
+    # =========
+    def __call__(self, p1, p2):
+        size = len(p1)
+        adj_a = self._adjacency(p1)
+        adj_b = self._adjacency(p2)
+        only_a = [[c for c in adj_a[v] if c not in adj_b[v]] for v in range(size)]
+        only_b = [[c for c in adj_b[v] if c not in adj_a[v]] for v in range(size)]
+        starts = [v for v in range(size) if only_a[v]]
+        if not starts:
+            self.draws = 0
+            return list(p1)
+
+        cycle, steps = self._ab_cycle(random.choice(starts), only_a, only_b)
+        self.draws = 1 + steps
+        adj = [list(neighbours) for neighbours in adj_a]
+        for k in range(0, len(cycle) - 1, 2):
+            u, v = cycle[k], cycle[k + 1]
+            adj[u].remove(v)
+            adj[v].remove(u)
+        for k in range(1, len(cycle) - 1, 2):
+            u, v = cycle[k], cycle[k + 1]
+            adj[u].append(v)
+            adj[v].append(u)
+
+        self._merge_subtours(adj)
+        return self._to_path(adj)
+
+    # ==============
+    # FR: Retourne pour chaque ville ses deux voisines dans le chemin fermé.
+    #
+    # EN: Returns, for every city, its two neighbours in the closed path.
+    # =========
+    @staticmethod
+    def _adjacency(path):
+        size = len(path)
+        adj = [None] * size
+        for i, city in enumerate(path):
+            adj[city] = [path[i - 1], path[(i + 1) % size]]
+        return adj
+
+    # ==============
+    # FR: Parcourt alternativement des arêtes propres à A et à B jusqu'à fermer un cycle AB; retourne le cycle et le
+    # nombre de pas (un tirage chacun).
+    #
+    # EN: Walks alternately along A-only and B-only edges until an AB-cycle closes; returns the cycle and the number of
+    # steps (one draw each).
+    # =========
+    @staticmethod
+    def _ab_cycle(start, only_a, only_b):
+        only_a = [list(edges) for edges in only_a]
+        only_b = [list(edges) for edges in only_b]
+        walk = [start]
+        leaving_by_a = {start: 0}
+        use_a = True
+        current = start
+        while True:
+            edges = only_a if use_a else only_b
+            nxt = random.choice(edges[current])
+            edges[current].remove(nxt)
+            edges[nxt].remove(current)
+            walk.append(nxt)
+            if not use_a and nxt in leaving_by_a:
+                return walk[leaving_by_a[nxt]:], len(walk) - 1
+            if not use_a:
+                leaving_by_a[nxt] = len(walk) - 1
+            use_a = not use_a
+            current = nxt
+
+    # ==============
+    # FR: Fusionne les sous-tours, du plus petit au plus grand, par l'échange de deux arêtes le moins coûteux.
+    #
+    # EN: Merges the sub-tours, smallest first, with the cheapest two-edge exchange.
+    # =========
+    def _merge_subtours(self, adj):
+        size = len(adj)
+        component = [-1] * size
+        members = []
+        for city in range(size):
+            if component[city] < 0:
+                cities = self._walk(adj, city)
+                for c in cities:
+                    component[c] = len(members)
+                members.append(cities)
+
+        alive = set(range(len(members)))
+        dist = self.dist
+        while len(alive) > 1:
+            smallest = min(alive, key=lambda c: len(members[c]))
+            best = None
+            for u in members[smallest]:
+                outside = [v for v in self.neighbour_lists[u] if component[v] != smallest]
+                if not outside and best is None and u == members[smallest][-1]:
+                    outside = [v for v in range(size) if component[v] != smallest]
+                for u2 in adj[u]:
+                    d_uu2 = dist(u, u2)
+                    for v in outside:
+                        for v2 in adj[v]:
+                            base = d_uu2 + dist(v, v2)
+                            for x, y in ((v, v2), (v2, v)):
+                                cost = dist(u, x) + dist(u2, y) - base
+                                if best is None or cost < best[0]:
+                                    best = (cost, u, u2, v, v2, x, y)
+            _, u, u2, v, v2, x, y = best
+            adj[u].remove(u2)
+            adj[u2].remove(u)
+            adj[v].remove(v2)
+            adj[v2].remove(v)
+            adj[u].append(x)
+            adj[x].append(u)
+            adj[u2].append(y)
+            adj[y].append(u2)
+            target = component[v]
+            for c in members[smallest]:
+                component[c] = target
+            members[target].extend(members[smallest])
+            alive.discard(smallest)
+
+    # ==============
+    # FR: Parcourt le cycle qui contient une ville donnée.
+    #
+    # EN: Walks the cycle containing a given city.
+    # =========
+    @staticmethod
+    def _walk(adj, start):
+        cycle = [start]
+        prev, current = start, adj[start][0]
+        while current != start:
+            cycle.append(current)
+            a, b = adj[current]
+            prev, current = current, (b if a == prev else a)
+        return cycle
+
+    # ==============
+    # FR: Convertit la liste d'adjacence d'un tour unique en chemin commençant par la ville 0.
+    #
+    # EN: Converts the adjacency list of a single tour into a path starting at city 0.
+    # =========
+    def _to_path(self, adj):
+        return self._walk(adj, 0)
+
+CROSSOVERS = {
+    "ox": order_crossover,
+    "pmx": partially_mapped_crossover,
+    "erx": edge_recombination_crossover,
+    "eax": EAXLite,
+}
+
+# ==============
+# FR: Retourne l'opérateur de croisement correspondant à un nom ("ox", "pmx", "erx" ou "eax").
+#
+# EN: Returns the crossover operator matching a name ("ox", "pmx", "erx" or "eax").
+# =========
+def make_crossover(name, dist_matrix):
+    if name not in CROSSOVERS:
+        raise ValueError(f"Croisement inconnu: {name} (choix: {', '.join(CROSSOVERS)})")
+    operator = CROSSOVERS[name]
+    return operator(dist_matrix) if isinstance(operator, type) else operator
+
+# ==============
+# FR: Nombre d'appels random.* du dernier croisement d'un opérateur: un pour OX et PMX (points de coupe), un par ville
+# ajoutée pour ERX, ceux du dernier appel pour EAX.
+#
+# EN: Number of random.* calls of an operator's last crossover: one for OX and PMX (cut points), one per added city
+# for ERX, those of the last call for EAX.
+# =========
+def crossover_draws(operator, size):
+    if isinstance(operator, EAXLite):
+        return operator.draws
+    if operator is edge_recombination_crossover:
+        return size - 1
+    return 1
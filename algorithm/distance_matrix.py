@@ -0,0 +1,172 @@
+import math
+import numpy as np
+from .spatial import build_neighbour_lists
+
+class DistanceMatrix:
+    def __init__(self, cities):
+        self.cities = cities
+        self.n = len(cities)
+        self.matrix = self._build(cities)
+        self._neighbours = {}
+
+    # ==============
+    # FR: Enveloppe une matrice déjà calculée (par exemple en mémoire partagée) sans la recalculer.
+    #
+    # EN: Wraps an already computed matrix (for example in shared memory) without recomputing it.
+    # =========
+    @classmethod
+    def from_matrix(cls, cities, matrix):
+        instance = cls.__new__(cls)
+        instance.cities = cities
+        instance.n = len(cities)
+        instance.matrix = matrix
+        instance._neighbours = {}
+        return instance
+
+    # ==============
+    # FR: Construit une seule fois la matrice des distances euclidiennes entre toutes les villes.
+    #
+    # EN: Builds the Euclidean distance matrix between all cities once.
+    # =========
+    @staticmethod
+    def _build(cities):
+        if not cities:
+            return np.zeros((0, 0), dtype=np.float64)
+        coords = np.asarray(cities, dtype=np.float64)
+        diff = coords[:, None, :] - coords[None, :, :]
+        return np.sqrt((diff ** 2).sum(axis=2))
+
+    # ==============
+    # FR: Indique si la matrice a été construite pour cet ensemble de villes.
+    #
+    # EN: Tells whether the matrix was built for this set of cities.
+    # =========
+    def matches(self, cities):
+        return self.cities is cities or list(self.cities) == list(cities)
+
+    # ==============
+    # FR: Retourne la distance entre deux villes.
+    #
+    # EN: Returns the distance between two cities.
+    # =========
+    def dist(self, a, b):
+        return float(self.matrix[a, b])
+
+    # ==============
+    # FR: Distances entre villes prises deux à deux dans des tableaux d'indices (diffusion NumPy).
+    #
+    # EN: Distances between cities taken pairwise from index arrays (NumPy broadcasting).
+    # =========
+    def pair_distances(self, a, b):
+        return self.matrix[a, b]
+
+    # ==============
+    # FR: Calcule la distance totale d'un chemin fermé à partir de la matrice.
+    #
+    # EN: Computes the total length of a closed path from the matrix.
+    # =========
+    def tour_length(self, path):
+        if len(path) < 2:
+            return 0.0
+        idx = np.asarray(path, dtype=np.intp)
+        return float(self.matrix[idx, np.roll(idx, -1)].sum())
+
+    # ==============
+    # FR: Calcule en une seule opération la longueur de chaque chemin d'une matrice (une ligne par chemin).
+    #
+    # EN: Computes in one operation the length of every path in a matrix (one row per path).
+    # =========
+    def tour_lengths(self, paths):
+        paths = np.asarray(paths)
+        return self.matrix[paths, np.roll(paths, -1, axis=1)].sum(axis=1)
+
+    # ==============
+    # FR: Retourne (et mémorise) les listes des k plus proches voisins de chaque ville, sous forme de matrice (n, k).
+    #
+    # EN: Returns (and memoizes) the k-nearest-neighbour lists of every city as an (n, k) matrix.
+    # =========
+    def neighbours(self, k):
+        k = max(0, min(k, self.n - 1))
+        if k not in self._neighbours:
+            self._neighbours[k] = np.array(build_neighbour_lists(self.cities, k), dtype=np.intp).reshape(self.n, k)
+        return self._neighbours[k]
+
+class CoordinateDistance:
+    matrix = None
+
+    def __init__(self, cities):
+        self.cities = cities
+        self.n = len(cities)
+        self.coords = np.asarray(cities, dtype=np.float64).reshape(self.n, 2)
+        self._xs = self.coords[:, 0].tolist()
+        self._ys = self.coords[:, 1].tolist()
+        self._neighbours = {}
+
+    # ==============
+    # FR: Indique si les distances portent sur cet ensemble de villes.
+    #
+    # EN: Tells whether the distances are over this set of cities.
+    # =========
+    def matches(self, cities):
+        return self.cities is cities or list(self.cities) == list(cities)
+
+    # ==============
+    # FR: Distance entre deux villes calculée depuis les coordonnées (mémoire en O(n), sans matrice n x n).
+    #
+    # EN: Distance between two cities computed from the coordinates (O(n) memory, no n x n matrix).
+    # =========
+    def dist(self, a, b):
+        return math.hypot(self._xs[a] - self._xs[b], self._ys[a] - self._ys[b])
+
+    # ==============
+    # FR: Distances entre villes prises deux à deux dans des tableaux d'indices, calculées depuis les coordonnées.
+    #
+    # EN: Distances between cities taken pairwise from index arrays, computed from the coordinates.
+    # =========
+    def pair_distances(self, a, b):
+        return np.sqrt(((self.coords[a] - self.coords[b]) ** 2).sum(axis=-1))
+
+    # ==============
+    # FR: Calcule la distance totale d'un chemin fermé à partir des coordonnées.
+    #
+    # EN: Computes the total length of a closed path from the coordinates.
+    # =========
+    def tour_length(self, path):
+        if len(path) < 2:
+            return 0.0
+        points = self.coords[np.asarray(path, dtype=np.intp)]
+        return float(np.sqrt(((points - np.roll(points, -1, axis=0)) ** 2).sum(axis=1)).sum())
+
+    # ==============
+    # FR: Calcule la longueur de chaque chemin d'une matrice (une ligne par chemin).
+    #
+    # EN: Computes the length of every path in a matrix (one row per path).
+    # =========
+    def tour_lengths(self, paths):
+        points = self.coords[np.asarray(paths, dtype=np.intp)]
+        return np.sqrt(((points - np.roll(points, -1, axis=1)) ** 2).sum(axis=2)).sum(axis=1)
+
+    # ==============
+    # FR: Retourne (et mémorise) les listes des k plus proches voisins de chaque ville, sous forme de matrice (n, k).
+    #
+    # EN: Returns (and memoizes) the k-nearest-neighbour lists of every city as an (n, k) matrix.
+    # =========
+    def neighbours(self, k):
+        k = max(0, min(k, self.n - 1))
+        if k not in self._neighbours:
+            self._neighbours[k] = np.array(build_neighbour_lists(self.cities, k), dtype=np.intp).reshape(self.n, k)
+        return self._neighbours[k]
+
+# ==============
+# FR: Réutilise des distances existantes si elles correspondent aux villes, sinon construit une matrice. Avec dense,
+# une matrice n x n est exigée (phéromones, heuristique, mémoire partagée): des distances calculées depuis les
+# coordonnées sont alors remplacées par une matrice.
+#
+# EN: Reuses existing distances if they match the cities, otherwise builds a matrix. With dense, an n x n matrix is
+# required (pheromones, heuristic, shared memory): distances computed from the coordinates are then replaced with a
+# matrix.
+# =========
+def get_distance_matrix(cities, dist_matrix=None, dense=False):
+    if dist_matrix is not None and dist_matrix.matches(cities) and not (dense and dist_matrix.matrix is None):
+        return dist_matrix
+    return DistanceMatrix(cities)
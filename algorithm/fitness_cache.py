@@ -0,0 +1,48 @@
+from collections import OrderedDict
+
+class FitnessCache:
+    def __init__(self, max_size=10000):
+        self.max_size = max_size
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    # ==============
+    # FR: Retourne la valeur en cache d'un chemin, ou la calcule et la mémorise (éviction LRU).
+    #
+    # EN: Returns the cached value of a path, or computes and stores it (LRU eviction).
+    # =========
+    def get(self, path, compute):
+        key = tuple(path)
+        value = self.entries.get(key)
+        if value is not None:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return value
+        self.misses += 1
+        value = compute(path)
+        self.entries[key] = value
+        if len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+        return value
+
+    # ==============
+    # FR: Retourne les compteurs de succès et d'échecs puis les remet à zéro.
+    #
+    # EN: Returns the hit and miss counters and resets them.
+    # =========
+    def pop_counters(self):
+        counters = {"cache_hits": self.hits, "cache_misses": self.misses}
+        self.hits = 0
+        self.misses = 0
+        return counters
+
+    # ==============
+    # FR: Vide le cache et ses compteurs.
+    #
+    # EN: Clears the cache and its counters.
+    # =========
+    def clear(self):
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
@@ -1,16 +1,50 @@
 import random
-import math
 import time
+import numpy as np
+from .distance_matrix import get_distance_matrix
+from .fitness_cache import FitnessCache
+from .local_search import LocalSearch
+from .crossover import crossover_draws, make_crossover, order_crossover_batch
+from .profiling import get_profiler
+from .construction import seed_tours
+from .stopping import StoppingCriteria
 
 class GeneticAlgorithm:
-    def __init__(self, cities, pop_size=100, max_gen=50, mutation_rate=0.05, elitism_count=10, logger=None):
+    def __init__(self, cities, pop_size=100, max_gen=50, mutation_rate=0.05, elitism_count=10, logger=None, dist_matrix=None, cache_size=None, batched=False, candidates=None, memetic=False, crossover="ox", progress=None, cancel=None, profiler=None, seed_fraction=0.0, time_budget=None, stagnation_rounds=None, stagnation_eps=0.0, initial_population=None):
         self.cities = cities
+        self.dist_matrix = get_distance_matrix(cities, dist_matrix)
         self.pop_size = pop_size
         self.max_gen = max_gen
         self.mutation_rate = mutation_rate
         self.n = len(cities)
         self.elitism_count = elitism_count
         self.logger = logger
+        self.fitness_cache = FitnessCache(cache_size or 4 * pop_size)
+        self.batched = batched
+        self.rng = np.random.default_rng(random.getrandbits(64))
+        self.neighbour_lists = self.dist_matrix.neighbours(candidates).tolist() if candidates else None
+        self.local_search = LocalSearch(self.dist_matrix) if memetic else None
+        self.population = None
+        self.crossover = crossover
+        self.crossover_op = make_crossover(crossover, self.dist_matrix)
+        self.progress = progress
+        self.cancel = cancel
+        self.profiler = get_profiler(profiler)
+        self.seed_fraction = seed_fraction
+        self.stopping = StoppingCriteria(time_budget, stagnation_rounds, stagnation_eps)
+        self.initial_population = initial_population
+        self.log_overhead = 0.0
+        self.log_overhead_total = 0.0
+
+    # ==============
+    # FR: Journalise une étape avec le temps passé dans l'appel précédent (celui-ci n'est connu qu'au retour).
+    #
+    # EN: Logs a step with the time spent in the previous call (this one's is only known on return).
+    # =========
+    def _log(self, algo_name, distance, duration, **extra):
+        self.log_overhead = self.logger.log(algo_name, distance, duration, log_overhead=self.log_overhead, **extra)
+        self.log_overhead_total += self.log_overhead
+        return self.log_overhead
 
     # ==============
     # FR:Calcule la distance totale d'un chemin donné en visitant chaque ville dans l'ordre.
@@ -18,11 +52,7 @@ class GeneticAlgorithm:
     # EN:Calculates the total distance of a given path visiting each city in sequence.
     # =========
     def total_distance(self, path):
-        dist = 0
-        for i in range(-1, len(path) - 1):
-            city_a, city_b = self.cities[path[i]], self.cities[path[i + 1]]
-            dist += math.dist(city_a, city_b)
-        return dist
+        return self.dist_matrix.tour_length(path)
 
     # ==============
     # FR:Évalue la qualité d'un chemin en retournant l'inverse de sa distance.
@@ -30,24 +60,66 @@ class GeneticAlgorithm:
     # EN:Evaluates the fitness of a path by returning the inverse of its total distance.
     # =========
     def fitness(self, path):
+        return self.fitness_cache.get(path, self._compute_fitness)
+
+    # ==============
+    # FR:Calcule la qualité d'un chemin sans passer par le cache.
+    #
+    # EN:Computes the fitness of a path bypassing the cache.
+    # =========
+    def _compute_fitness(self, path):
+        self.profiler.count("distance_evals")
         dist = self.total_distance(path)
         return 1.0 / dist if dist > 0 else float('inf')
 
     # ==============
-    # FR:Initialise une population aléatoire de chemins, chaque chemin commence par la ville 0.
+    # FR:Initialise la population: une part (seed_fraction) de tours distincts construits par heuristiques, le reste aléatoire.
     #
-    # EN:Initializes a random population of paths, each starting at city 0.
+    # EN:Initializes the population: a share (seed_fraction) of distinct heuristic-built tours, the rest random.
     # =========
     def _init_population(self):
-        population = []
-        for _ in range(self.pop_size):
-            indiv = list(range(self.n))
-            random.shuffle(indiv)
-            idx0 = indiv.index(0)
-            indiv[0], indiv[idx0] = indiv[idx0], indiv[0]
-            population.append(indiv)
+        seeds = seed_tours(self.dist_matrix, min(self.pop_size, round(self.seed_fraction * self.pop_size)))
+        if self.batched:
+            return self._init_population_matrix(seeds)
+        population = seeds
+        for _ in range(self.pop_size - len(seeds)):
+            population.append(self._random_tour())
+        return population
+
+    # ==============
+    # FR:Tire un chemin aléatoire qui commence par la ville 0.
+    #
+    # EN:Draws a random path that starts at city 0.
+    # =========
+    def _random_tour(self):
+        indiv = list(range(self.n))
+        random.shuffle(indiv)
+        idx0 = indiv.index(0)
+        indiv[0], indiv[idx0] = indiv[idx0], indiv[0]
+        return indiv
+
+    # ==============
+    # FR:Initialise la population sous forme de matrice (pop_size, n) en int32, colonne 0 fixée à la ville 0.
+    #
+    # EN:Initializes the population as a (pop_size, n) int32 matrix, column 0 pinned to city 0.
+    # =========
+    def _init_population_matrix(self, seeds=()):
+        population = np.zeros((self.pop_size, self.n), dtype=np.int32)
+        if self.n > 1:
+            population[:, 1:] = np.argsort(self.rng.random((self.pop_size, self.n - 1)), axis=1) + 1
+        if len(seeds):
+            population[:len(seeds)] = seeds
         return population
 
+    # ==============
+    # FR:Calcule la distance de tous les individus de la population matricielle en une seule opération.
+    #
+    # EN:Computes the distance of every individual of the matrix population in one operation.
+    # =========
+    def _evaluate_population(self, population):
+        self.profiler.count("distance_evals", len(population))
+        return self.dist_matrix.tour_lengths(population)
+
     # ==============
     # FR:Sélectionne un individu par tournoi parmi trois et retourne le plus adapté.
     #
@@ -58,35 +130,53 @@ class GeneticAlgorithm:
         return max(tournament, key=self.fitness)
 
     # ==============
-    # FR:Effectue un croisement partiel entre deux parents pour créer un enfant.
+    # FR:Croise deux parents avec l'opérateur choisi par son nom (OX par défaut) pour créer un enfant.
     #
-    # EN:Performs partial crossover between two parents to create a child.
+    # EN:Crosses two parents with the operator selected by name (OX by default) to create a child.
     # =========
     def _crossover(self, p1, p2):
-        size = len(p1)
-        child = [None] * size
-        start, end = sorted(random.sample(range(1, size), 2))
-        child[start:end] = p1[start:end]
-        pos = end
-        for gene in p2[1:]:
-            if gene not in child:
-                if pos >= size:
-                    pos = 1
-                child[pos] = gene
-                pos += 1
-        child[0] = 0
-        return child
+        return self.crossover_op(p1, p2)
 
     # ==============
-    # FR:Applique une mutation aléatoire aux gènes du chemin sauf la première ville.
+    # FR:Applique une mutation aléatoire aux gènes du chemin sauf la première ville; retourne le nombre d'échanges et
+    # celui des tirages aléatoires.
     #
-    # EN:Applies random mutation to path genes except for the first city.
+    # EN:Applies random mutation to path genes except for the first city; returns the number of swaps and the number of
+    # random draws.
     # =========
     def _mutate(self, path):
+        if self.neighbour_lists:
+            return self._mutate_candidates(path)
+        swaps = 0
         for i in range(1, len(path)):
             if random.random() < self.mutation_rate:
                 j = random.randint(1, len(path) - 1)
                 path[i], path[j] = path[j], path[i]
+                swaps += 1
+        return swaps, len(path) - 1 + swaps
+
+    # ==============
+    # FR:Mutation restreinte aux voisins: rapproche de la ville précédente l'une de ses k plus proches voisines.
+    #
+    # EN:Neighbour-restricted mutation: moves one of the previous city's k nearest neighbours next to it.
+    # =========
+    def _mutate_candidates(self, path):
+        positions = [0] * len(path)
+        for idx, city in enumerate(path):
+            positions[city] = idx
+        swaps = 0
+        draws = len(path) - 1
+        for i in range(1, len(path)):
+            if random.random() < self.mutation_rate:
+                j = positions[random.choice(self.neighbour_lists[path[i - 1]])]
+                draws += 1
+                if j == 0:
+                    j = random.randint(1, len(path) - 1)
+                    draws += 1
+                path[i], path[j] = path[j], path[i]
+                positions[path[i]], positions[path[j]] = i, j
+                swaps += 1
+        return swaps, draws
 
     # ==============
     # FR:Crée un enfant en sélectionnant deux parents et en appliquant croisement et mutation.
@@ -94,85 +184,167 @@ class GeneticAlgorithm:
     # EN:Creates a child by selecting two parents and applying crossover and mutation.
     # =========
     def _create_child(self, elite_population):
-        parent1 = self._selection(elite_population)
-        parent2 = self._selection(elite_population)
-        child = self._crossover(parent1, parent2)
-        self._mutate(child)
-        return child
+        with self.profiler.phase("selection"):
+            parent1 = self._selection(elite_population)
+            parent2 = self._selection(elite_population)
+        self.profiler.count("rng_draws", 2)
+        return self._breed(parent1, parent2)
 
     # ==============
-    # FR:Exécute l'algorithme génétique génération par génération en tant que générateur.
+    # FR:Croise et mute deux parents, puis améliore l'enfant par recherche locale en mode mémétique.
     #
-    # EN:Runs the genetic algorithm generation by generation as a generator.
+    # EN:Crosses and mutates two parents, then improves the child by local search in memetic mode.
     # =========
-    def run_step_by_step(self):
-        population = self._init_population()
-        best_path = None
-        best_fit = -1
+    def _breed(self, parent1, parent2):
+        with self.profiler.phase("crossover"):
+            child = self._crossover(parent1, parent2)
+        self.profiler.count("rng_draws", crossover_draws(self.crossover_op, len(child)))
+        return self._mutate_child(child)
 
-        for gen in range(self.max_gen):
-            start_time = time.time()
+    # ==============
+    # FR:Mute un enfant puis l'améliore par recherche locale en mode mémétique, chaque étape dans sa phase mesurée.
+    #
+    # EN:Mutates a child then improves it by local search in memetic mode, each step in its own measured phase.
+    # =========
+    def _mutate_child(self, child):
+        profiler = self.profiler
+        with profiler.phase("mutation"):
+            swaps, draws = self._mutate(child)
+        profiler.count("mutations", swaps)
+        profiler.count("rng_draws", draws)
+        if self.local_search:
+            with profiler.phase("local_search"):
+                child, _ = self.local_search.improve(child)
+        return child
+
+    # ==============
+    # FR:Produit la génération suivante à partir d'une population de listes (avec cache de qualité).
+    #
+    # EN:Produces the next generation from a population of lists (using the fitness cache).
+    # =========
+    def _next_generation(self, population):
+        profiler = self.profiler
+        with profiler.phase("sort"):
             population_sorted = sorted(population, key=self.fitness, reverse=True)
-            elites = population_sorted[:self.elitism_count]
-            num_children = self.pop_size - self.elitism_count
+        elites = population_sorted[:self.elitism_count]
+        num_children = self.pop_size - self.elitism_count
 
-            children = []
-            for _ in range(num_children):
-                child = self._create_child(elites)
-                children.append(child)
+        children = [self._create_child(elites) for _ in range(num_children)]
 
-            population = elites + children
+        population = elites + children
+        with profiler.phase("evaluation"):
+            distances = [1.0 / self.fitness(indiv) for indiv in population]
+        return population, distances
 
-            for indiv in population:
-                indiv_fit = self.fitness(indiv)
-                if indiv_fit > best_fit:
-                    best_fit = indiv_fit
-                    best_path = indiv[:]
+    # ==============
+    # FR:Produit la génération suivante sur la population matricielle: tri des élites et évaluation vectorisés.
+    #
+    # EN:Produces the next generation on the matrix population: vectorized elite sorting and evaluation.
+    # =========
+    def _next_generation_batched(self, population, distances):
+        profiler = self.profiler
+        with profiler.phase("sort"):
+            order = np.argsort(distances, kind="stable")
+            elites = population[order[:self.elitism_count]]
+            elite_distances = distances[order[:self.elitism_count]]
+        num_children = self.pop_size - self.elitism_count
 
-            duration = time.time() - start_time
-            if self.logger:
-                self.logger.log("GA", 1.0 / best_fit, duration, generation=gen)
+        with profiler.phase("selection"):
+            tournaments = self._tournaments(len(elites), 2 * num_children)
+            winners = tournaments[np.arange(len(tournaments)), np.argmin(elite_distances[tournaments], axis=1)]
+            parents = elites[winners]
+        if self.crossover == "ox":
+            with profiler.phase("crossover"):
+                children = order_crossover_batch(parents[0::2], parents[1::2], self.rng).tolist()
+            profiler.count("rng_draws", num_children * (self.n - 1))
+            children = [self._mutate_child(child) for child in children]
+        else:
+            parents = parents.tolist()
+            children = [self._breed(parents[2 * k], parents[2 * k + 1]) for k in range(num_children)]
+        children = np.array(children, dtype=np.int32).reshape(num_children, self.n)
 
-            yield {
-                "generation": gen + 1,
-                "best_path": best_path,
-                "best_distance": 1.0 / best_fit,
-                "duration": duration
-            }
+        with profiler.phase("evaluation"):
+            population = np.concatenate((elites, children))
+            distances = np.concatenate((elite_distances, self._evaluate_population(children)))
+        return population, distances
 
     # ==============
-    # FR:Exécute l'algorithme génétique et retourne le meilleur chemin trouvé.
+    # FR:Tire des tournois de trois élites distinctes (ou moins s'il y a moins d'élites).
     #
-    # EN:Runs the genetic algorithm and returns the best path found.
+    # EN:Draws tournaments of three distinct elites (or fewer when there are fewer elites).
     # =========
-    def run(self):
-        population = self._init_population()
+    def _tournaments(self, elite_count, count):
+        size = min(3, elite_count)
+        self.profiler.count("rng_draws", count * elite_count)
+        return np.argsort(self.rng.random((count, elite_count)), axis=1)[:, :size]
+
+    # ==============
+    # FR:Exécute l'algorithme génétique génération par génération en tant que générateur, depuis une population optionnelle.
+    #
+    # EN:Runs the genetic algorithm generation by generation as a generator, from an optional population.
+    # =========
+    def run_step_by_step(self, population=None, start=0):
+        self.stopping.start()
+        generations = self.stopping.rounds(start, self.max_gen)
+        self.fitness_cache.clear()
+        if population is None:
+            population = self._init_population()
+        elif self.batched:
+            population = np.asarray(population, dtype=np.int32)
+        else:
+            population = [list(indiv) for indiv in population]
+        if self.batched:
+            distances = self._evaluate_population(population)
         best_path = None
-        best_fit = -1
+        best_distance = float('inf')
 
-        for gen in range(self.max_gen):
+        for gen in generations:
+            if self.cancel is not None and self.cancel.is_set():
+                return
+            if self.stopping.should_stop():
+                return
             start_time = time.time()
-            population_sorted = sorted(population, key=self.fitness, reverse=True)
-            elites = population_sorted[:self.elitism_count]
-            num_children = self.pop_size - self.elitism_count
-
-            children = []
-            for _ in range(num_children):
-                child = self._create_child(elites)
-                children.append(child)
+            with self.profiler.phase("GA"):
+                if self.batched:
+                    population, distances = self._next_generation_batched(population, distances)
+                    best_idx = int(np.argmin(distances))
+                else:
+                    population, distances = self._next_generation(population)
+                    best_idx = min(range(len(distances)), key=distances.__getitem__)
 
-            population = elites + children
-
-            for indiv in population:
-                indiv_fit = self.fitness(indiv)
-                if indiv_fit > best_fit:
-                    best_fit = indiv_fit
-                    best_path = indiv[:]
+            self.population = population
+            if distances[best_idx] < best_distance:
+                best_distance = float(distances[best_idx])
+                best_path = [int(city) for city in population[best_idx]]
+            self.stopping.update(best_distance)
 
             duration = time.time() - start_time
+            counters = {} if self.batched else self.fitness_cache.pop_counters()
+            counters.update(self.profiler.pop_step())
+            log_overhead = 0.0
             if self.logger:
-                self.logger.log("GA", 1.0 / best_fit, duration, generation=gen)
+                log_overhead = self._log("GA", best_distance, duration, generation=gen, **counters)
+            if self.progress:
+                self.progress("GA", gen, best_path, best_distance)
+
+            yield {
+                "generation": gen + 1,
+                "best_path": best_path,
+                "best_distance": best_distance,
+                "duration": duration,
+                "log_overhead": log_overhead,
+                **counters
+            }
 
-            print(f"Génération {gen + 1} - Meilleure distance: {1.0 / best_fit:.2f}")
+    # ==============
+    # FR:Exécute l'algorithme génétique (depuis initial_population si fournie) et retourne le meilleur chemin trouvé.
+    #
+    # EN:Runs the genetic algorithm (from initial_population when given) and returns the best path found.
+    # =========
+    def run(self):
+        best_path, best_distance = None, float('inf')
+        for result in self.run_step_by_step(self.initial_population):
+            best_path, best_distance = result["best_path"], result["best_distance"]
+            print(f"Génération {result['generation']} - Meilleure distance: {best_distance:.2f}")
 
-        return best_path, 1.0 / best_fit
+        return best_path, best_distance
@@ -1,16 +1,21 @@
 import tkinter as tk
 from tkinter import ttk
-import random, math, threading
-from PIL import Image, ImageTk
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from ga import GeneticAlgorithm
-from aco import AntColony
-from algorithm.stats_logger import StatsLogger
-from HybridTSP import HybridTSP
+import os
+import random
+from .stats_logger import StatsLogger
+from .distance_matrix import DistanceMatrix
+from .stats_plot import LiveStatsPlot
+from .renderer import TourRenderer
+from .runner import GAStepper, SolverRunner, solve, reoptimize
+from .reoptimize import apply_diff, remap_population, repair_tour
 
 class TSPApp(tk.Tk):
     HOVER_RADIUS = 10
+    SEGMENT_HOVER_RADIUS = 4
+    RESIZE_DELAY = 150
+    RUNNER_POLL_MS = 50
+    STATS_BUCKETS = 300
+    CITY_CHANGES = 3
 
     # ==============
     # FR: Initialise l'application TSP avec interface et variables.
@@ -23,6 +28,7 @@ class TSPApp(tk.Tk):
         self.state('zoomed')
         self.num_cities = 10
         self.cities = []
+        self.dist_matrix = None
         self.best_distance = float('inf')
         self.best_path = []
         self.best_solution_saved = None
@@ -32,21 +38,48 @@ class TSPApp(tk.Tk):
         self.auto_running = False
         self.stored_paths = []
         self.bg_image = None
-        self.bg_image_resized = None
-        self._load_background_image("IMG.png")
-        self.stats_logger = StatsLogger()
-        self.ga_instance = None
-        self.ga_generator = None
+        self.resize_job = None
+        self._load_background_image(os.path.join(os.path.dirname(os.path.abspath(__file__)), "IMG.png"))
+        self.stats_logger = StatsLogger(asynchronous=True)
+        self.runner = SolverRunner(logger=self.stats_logger)
+        self.run_job = None
+        self.ga_job = None
+        self.ga_stepper = None
+        self.ga_population = None
+        self.ga_generation = 0
+        self.solver_state = None
         self._setup_ui()
         self._generate_cities()
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+        self.after(self.RUNNER_POLL_MS, self._poll_runner)
 
     # ==============
-    # FR: Charge une image de fond à partir d’un fichier.
+    # FR: Arrête les calculs en cours, vide les statistiques en attente sur le disque puis ferme la fenêtre.
     #
-    # EN: Loads a background image from a file.
+    # EN: Stops the running computations, flushes pending statistics to disk, then closes the window.
+    # =========
+    def _on_close(self):
+        self.runner.shutdown()
+        self.stats_logger.close()
+        self.destroy()
+
+    # ==============
+    # FR: Relaie périodiquement la progression et les résultats des calculs en arrière-plan vers l'interface.
+    #
+    # EN: Periodically relays the progress and results of the background computations to the UI.
+    # =========
+    def _poll_runner(self):
+        self.runner.poll()
+        self.after(self.RUNNER_POLL_MS, self._poll_runner)
+
+    # ==============
+    # FR: Charge une image de fond à partir d’un fichier (PIL importé à la demande).
+    #
+    # EN: Loads a background image from a file (PIL imported on demand).
     # =========
     def _load_background_image(self, filename):
         try:
+            from PIL import Image, ImageTk
             img = Image.open(filename)
             self.bg_image = ImageTk.PhotoImage(img)
         except Exception as e:
@@ -126,6 +159,7 @@ class TSPApp(tk.Tk):
         self.canvas.pack(side=tk.LEFT, fill="both", expand=True)
         self.canvas.bind("<Configure>", self._on_canvas_resize)
         self.canvas.bind("<Motion>", self._on_mouse_move)
+        self.renderer = TourRenderer(self.canvas, self.bg_image)
         controls = ttk.Frame(main_frame, width=250)
         controls.pack(side=tk.RIGHT, fill="y", padx=10, pady=10)
         ville_frame = ttk.Labelframe(controls, text="Gestion Villes")
@@ -135,9 +169,10 @@ class TSPApp(tk.Tk):
         num_cities_entry = ttk.Entry(ville_frame, textvariable=self.num_cities_var, width=10)
         num_cities_entry.pack(pady=5)
         ttk.Button(ville_frame, text="Générer Villes", command=self._generate_cities).pack(fill="x", pady=5)
+        ttk.Button(ville_frame, text="Modifier Villes (reprise)", command=self._modify_cities).pack(fill="x", pady=5)
         ttk.Label(controls, text="Choisir Algorithme:", style="TLabel").pack(pady=2)
         self.algo_var = tk.StringVar(value="GA")
-        algo_menu = ttk.Combobox(controls, textvariable=self.algo_var, values=["GA", "ACO", "Hybride"],
+        algo_menu = ttk.Combobox(controls, textvariable=self.algo_var, values=["GA", "ACO", "Hybride", "Cluster"],
                                  state="readonly")
         algo_menu.pack(fill="x", pady=5)
         ttk.Label(controls, text="Vitesse d'animation (ms):", style="TLabel").pack(pady=2)
@@ -146,6 +181,7 @@ class TSPApp(tk.Tk):
         anim_speed_scale.pack(fill="x", pady=5)
         ttk.Button(controls, text="Lancer (animation)", command=self._run_once_thread).pack(fill="x", pady=5)
         ttk.Button(controls, text="Lancer Rapide", command=self._run_once_no_animation_thread).pack(fill="x", pady=5)
+        ttk.Button(controls, text="Annuler", command=lambda: self._cancel_run(announce=True)).pack(fill="x", pady=5)
         auto_frame = ttk.Labelframe(controls, text="Mode Automatique")
         auto_frame.pack(fill="x", pady=10)
         ttk.Button(auto_frame, text="Démarrer", command=self._start_auto).pack(fill="x", pady=5)
@@ -162,32 +198,32 @@ class TSPApp(tk.Tk):
         self.segment_label.pack(pady=5)
 
     # ==============
-    # FR: Crée la page de visualisation des statistiques avec des graphiques.
+    # FR: Crée la page de visualisation des statistiques (graphiques créés au premier affichage).
     #
-    # EN: Creates the statistics page with charts.
+    # EN: Creates the statistics page (charts created on first display).
     # =========
     def _create_stats_page(self):
         stats_frame = ttk.Frame(self.container, style="TFrame")
         self.pages['stats'] = stats_frame
+        self.stats_plot = None
         algo_frame = ttk.Labelframe(stats_frame, text="Choix de l'algorithme")
         algo_frame.pack(pady=10, padx=10, fill="x")
         self.stats_algo_var = tk.StringVar(value="GA")
-        selector = ttk.Combobox(algo_frame, textvariable=self.stats_algo_var, values=["GA", "ACO", "Hybride"], state="readonly")
+        selector = ttk.Combobox(algo_frame, textvariable=self.stats_algo_var, values=["GA", "ACO", "Hybride", "Cluster"], state="readonly")
         selector.pack(padx=10, pady=5)
         selector.bind("<<ComboboxSelected>>", lambda e: self._update_stats_graphs())
-        self.stats_fig = plt.Figure(figsize=(12, 5), dpi=100, facecolor="#282c34")
-        self.stats_ax1 = self.stats_fig.add_subplot(131, facecolor="#282c34")
-        self.stats_ax2 = self.stats_fig.add_subplot(132, facecolor="#282c34")
-        self.stats_ax3 = self.stats_fig.add_subplot(133, facecolor="#282c34")
-        for ax in [self.stats_ax1, self.stats_ax2, self.stats_ax3]:
-            ax.title.set_color("#abb2bf")
-            ax.xaxis.label.set_color("#abb2bf")
-            ax.yaxis.label.set_color("#abb2bf")
-            ax.tick_params(axis='x', colors="#abb2bf")
-            ax.tick_params(axis='y', colors="#abb2bf")
-            for spine in ax.spines.values():
-                spine.set_color("#abb2bf")
-        self.canvas_stats = FigureCanvasTkAgg(self.stats_fig, master=stats_frame)
+
+    # ==============
+    # FR: Crée les graphiques matplotlib de la page des statistiques (matplotlib importé à la demande).
+    #
+    # EN: Creates the matplotlib charts of the statistics page (matplotlib imported on demand).
+    # =========
+    def _create_stats_plot(self):
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        self.stats_fig = Figure(figsize=(12, 5), dpi=100, facecolor="#282c34")
+        self.canvas_stats = FigureCanvasTkAgg(self.stats_fig, master=self.pages['stats'])
+        self.stats_plot = LiveStatsPlot(self.stats_fig, self.canvas_stats, self.stats_logger, max_points=self.STATS_BUCKETS)
         self.canvas_stats.draw()
         self.canvas_stats.get_tk_widget().pack(fill="both", expand=True, padx=10, pady=10)
 
@@ -214,6 +250,8 @@ class TSPApp(tk.Tk):
             page.pack_forget()
         if 'stats' in self.pages:
             self.pages['stats'].pack(fill="both", expand=True)
+            if self.stats_plot is None:
+                self._create_stats_plot()
             self._start_stats_live_update()
 
     # ==============
@@ -227,53 +265,32 @@ class TSPApp(tk.Tk):
             self.after(1000, self._start_stats_live_update)
 
     # ==============
-    # FR: Met à jour les graphiques de statistiques avec les dernières données.
+    # FR: Met à jour les graphiques de statistiques avec les dernières données (rendu incrémental).
     #
-    # EN: Updates the statistics plots with the latest data.
+    # EN: Updates the statistics plots with the latest data (incremental rendering).
     # =========
     def _update_stats_graphs(self):
-        if not self.pages['stats'].winfo_ismapped():
+        if self.stats_plot is None or not self.pages['stats'].winfo_ismapped():
             return
-        algo = self.stats_algo_var.get()
-        stats = self.stats_logger.get(algo)
-        dists = stats.get("distances", [])
-        times = stats.get("times", [])
-        self.stats_ax1.clear()
-        self.stats_ax1.set_title(f"{algo} - Distance par génération", color="#abb2bf")
-        self.stats_ax1.set_xlabel("Génération", color="#abb2bf")
-        self.stats_ax1.set_ylabel("Distance", color="#abb2bf")
-        if dists:
-            x_vals = list(range(1, len(dists) + 1))
-            self.stats_ax1.plot(x_vals, dists, marker="o", color="#f72585")
-        else:
-            self.stats_ax1.text(0.5, 0.5, "Pas de données", horizontalalignment='center', color="#abb2bf")
-        self.stats_ax2.clear()
-        self.stats_ax2.set_title(f"{algo} - Temps par génération", color="#abb2bf")
-        self.stats_ax2.set_xlabel("Génération", color="#abb2bf")
-        self.stats_ax2.set_ylabel("Temps (s)", color="#abb2bf")
-        if times:
-            x_vals = list(range(1, len(times) + 1))
-            self.stats_ax2.plot(x_vals, times, marker="x", color="#4cc9f0")
-        else:
-            self.stats_ax2.text(0.5, 0.5, "Pas de données", horizontalalignment='center', color="#abb2bf")
-        all_stats = self.stats_logger.get_all()
-        self.stats_ax3.clear()
-        self.stats_ax3.set_title("Distribution des distances", color="#abb2bf")
-        self.stats_ax3.set_xlabel("Distance", color="#abb2bf")
-        self.stats_ax3.set_ylabel("Fréquence", color="#abb2bf")
-        colors = {"GA": "#f72585", "ACO": "#4cc9f0", "Hybride": "#3a0ca3"}
-        for algo_name, data in all_stats.items():
-            if data["distances"]:
-                self.stats_ax3.hist(data["distances"], bins=10, alpha=0.5, label=algo_name, color=colors.get(algo_name, "#abb2bf"))
-        self.stats_ax3.legend(facecolor="#282c34", labelcolor="#abb2bf")
-        self.canvas_stats.draw()
+        self.stats_plot.refresh(self.stats_algo_var.get())
 
     # ==============
-    # FR: Gère le redimensionnement du canvas.
+    # FR: Gère le redimensionnement du canvas (regroupé: un seul rendu une fois les événements terminés).
     #
-    # EN: Handles canvas resizing.
+    # EN: Handles canvas resizing (debounced: a single render once the events settle).
     # =========
     def _on_canvas_resize(self, event):
+        if self.resize_job is not None:
+            self.after_cancel(self.resize_job)
+        self.resize_job = self.after(self.RESIZE_DELAY, self._on_resize_settled)
+
+    # ==============
+    # FR: Rafraîchit le canvas après le dernier événement de redimensionnement.
+    #
+    # EN: Refreshes the canvas after the last resize event.
+    # =========
+    def _on_resize_settled(self):
+        self.resize_job = None
         self._refresh_canvas()
 
     # ==============
@@ -292,6 +309,7 @@ class TSPApp(tk.Tk):
         num = self.num_cities_var.get()
         self.cities = [(random.randint(margin, w - margin), random.randint(margin, h - margin))
                        for _ in range(num)]
+        self.dist_matrix = DistanceMatrix(self.cities)
         self.best_distance = float('inf')
         self.best_path = []
         self.best_solution_saved = None
@@ -299,82 +317,80 @@ class TSPApp(tk.Tk):
         self.current_segment_index = 0
         self.is_animating = False
         self.stored_paths.clear()
-        self.ga_generator = None
-        self.ga_instance = None
+        self._cancel_run()
+        self.solver_state = None
         self.stats_logger.reset()
-        self.canvas.delete("all")
+        self.renderer.set_cities(self.cities)
         self._refresh_canvas()
         self._update_info_label("Nouvelles villes générées.")
 
     # ==============
-    # FR: Dessine les villes sur le canvas.
+    # FR: Modifie quelques villes (retirées, déplacées, ajoutées) et reprend à chaud depuis le meilleur tour, la
+    # population GA et les phéromones au lieu de tout recalculer.
     #
-    # EN: Draws the cities on the canvas.
+    # EN: Changes a few cities (removed, moved, added) and warm-restarts from the best tour, the GA population and
+    # the pheromones instead of solving from scratch.
     # =========
-    def _draw_cities(self):
-        for i, (x, y) in enumerate(self.cities):
-            r = 5
-            self.canvas.create_oval(x - r, y - r, x + r, y + r,fill="#ffffff", outline="#000000", width=1)
-            self.canvas.create_text(x, y - 12, text=str(i + 1),fill="#ffffff", font=("Helvetica", 9, "bold"))
+    def _modify_cities(self):
+        count = self.CITY_CHANGES
+        if len(self.cities) < 3 * count + 3 or self.is_animating:
+            return
+        w = self.canvas.winfo_width()
+        h = self.canvas.winfo_height()
+        margin = 50
+        if w < 100:
+            w = 1200
+        if h < 100:
+            h = 800
+
+        def point():
+            return random.randint(margin, w - margin), random.randint(margin, h - margin)
+
+        changed = random.sample(range(len(self.cities)), 2 * count)
+        cities, mapping, dirty = apply_diff(self.cities, removed=changed[:count],
+                                            moved={i: point() for i in changed[count:]},
+                                            added=[point() for _ in range(count)])
+        population, generation = self.ga_population, self.ga_generation
+        state, best_path = self.solver_state, self.best_path
+        self._cancel_run()
+        self.solver_state = None
+        self.best_path = []
+        self.cities = cities
+        self.dist_matrix = DistanceMatrix(cities)
+        self.num_cities_var.set(len(cities))
+        self.stored_paths.clear()
+        self.current_path = []
+        self.renderer.set_cities(cities)
+        self.best_distance = float('inf')
+        self.best_solution_saved = None
+        if population is not None:
+            self.ga_population = remap_population(population, mapping, dirty, self.dist_matrix)
+            self.ga_generation = generation
+            self.stats_logger.new_run()
+        if state is not None and state.get("tour") is not None and self.algo_var.get() != "GA":
+            algo_name = self.algo_var.get()
+            self.stats_logger.new_run()
+            job = self.run_job = self.runner.submit(
+                reoptimize, algo_name, cities, self._solver_params(algo_name), state, mapping, dirty,
+                on_progress=lambda *progress: self._show_progress(job, *progress),
+                on_done=lambda result: self._on_run_done(job, result, cities, False, True)
+            )
+            self._update_info_label("Villes modifiées: reprise à chaud en cours...")
+        elif best_path:
+            path, _ = repair_tour(best_path, mapping, dirty, self.dist_matrix)
+            self._check_and_update_best(path, skip_animation=True)
+            self._update_info_label("Villes modifiées: meilleur tour réparé.")
+        else:
+            self._refresh_canvas()
+            self._update_info_label("Villes modifiées.")
 
     # ==============
-    # FR: Rafraîchit complètement le canvas.
+    # FR: Rafraîchit le canvas: fond, grille et villes en cache, chemins enregistrés redessinés.
     #
-    # EN: Fully refreshes the canvas.
+    # EN: Refreshes the canvas: cached background, grid and cities, stored paths redrawn.
     # =========
     def _refresh_canvas(self):
-        self.canvas.delete("all")
-        w = self.canvas.winfo_width()
-        h = self.canvas.winfo_height()
-        margin = 50
-        self._draw_bg_image(margin, margin, w - margin, h - margin)
-        self._draw_axes_with_grads(w, h, margin)
-        self._draw_cities()
-        for (path, color, width) in self.stored_paths:
-            self._draw_path(path, color=color, width=width, clear_first=False, store_in_list=False)
-
-    # ==============
-    # FR: Dessine l'image de fond dans une zone spécifiée.
-    #
-    # EN: Draws the background image in a specified area.
-    # =========
-    def _draw_bg_image(self, x1, y1, x2, y2):
-        if self.bg_image:
-            zone_width = x2 - x1
-            zone_height = y2 - y1
-            try:
-                img_pil = ImageTk.getimage(self.bg_image)
-                resized = img_pil.resize((zone_width, zone_height), Image.Resampling.LANCZOS)
-                self.bg_image_resized = ImageTk.PhotoImage(resized)
-                self.canvas.create_image(x1, y1, anchor="nw", image=self.bg_image_resized)
-            except Exception as e:
-                print(f"Erreur lors du redimensionnement de l'image: {e}")
-                self.canvas.create_image(x1, y1, anchor="nw", image=self.bg_image)
-
-    # ==============
-    # FR: Dessine les axes et les graduations sur le canvas.
-    #
-    # EN: Draws axes and ticks on the canvas.
-    # =========
-    def _draw_axes_with_grads(self, w, h, margin, step=50):
-        x_start, x_end = margin, w - margin
-        y_start, y_end = h - margin, margin
-        for x_pos in range(x_start, x_end + 1, step):
-            self.canvas.create_line(x_pos, y_end, x_pos, y_start,fill="white", width=1, stipple="gray75")
-        for y_pos in range(y_end, y_start + 1, step):
-            self.canvas.create_line(x_start, y_pos, x_end, y_pos,fill="white", width=1, stipple="gray75")
-        self.canvas.create_line(x_start, y_start, x_end, y_start,fill="white", width=2)
-        self.canvas.create_line(x_start, y_start, x_start, y_end,fill="white", width=2)
-        for x_pos in range(x_start, x_end + 1, step):
-            self.canvas.create_line(x_pos, y_start - 5, x_pos, y_start + 5,fill="white", width=2)
-            label_val = x_pos - x_start
-            self.canvas.create_text(x_pos, y_start + 12, text=str(label_val),fill="white", font=("Helvetica", 8))
-        for y_pos in range(y_end, y_start + 1, step):
-            self.canvas.create_line(x_start - 5, y_pos, x_start + 5, y_pos,fill="white", width=2)
-            label_val = y_start - y_pos
-            self.canvas.create_text(x_start - 8, y_pos, text=str(label_val),fill="white", font=("Helvetica", 8), anchor="e")
-        self.canvas.create_text(x_end + 15, y_start, text="X",fill="white", font=("Helvetica", 9), anchor="nw")
-        self.canvas.create_text(x_start, y_end - 15, text="Y",fill="white", font=("Helvetica", 9), anchor="sw")
+        self.renderer.render(self.stored_paths)
 
     # ==============
     # FR: Calcule la distance totale d'un chemin donné.
@@ -382,12 +398,7 @@ class TSPApp(tk.Tk):
     # EN: Calculates the total distance of a given path.
     # =========
     def _compute_distance(self, path):
-        dist = 0
-        for i in range(-1, len(path) - 1):
-            x1, y1 = self.cities[path[i]]
-            x2, y2 = self.cities[path[i + 1]]
-            dist += math.dist((x1, y1), (x2, y2))
-        return dist
+        return self.dist_matrix.tour_length(path)
 
     # ==============
     # FR: Met à jour l'étiquette d'information avec la meilleure distance.
@@ -400,9 +411,9 @@ class TSPApp(tk.Tk):
         self.info_label.config(text=text)
 
     # ==============
-    # FR: Lance un algorithme (avec animation) dans un thread.
+    # FR: Lance un algorithme (avec animation) dans un processus de travail.
     #
-    # EN: Starts an algorithm (with animation) in a thread.
+    # EN: Starts an algorithm (with animation) in a worker process.
     # =========
     def _run_once_thread(self):
         self.stored_paths.clear()
@@ -412,8 +423,7 @@ class TSPApp(tk.Tk):
         if self.algo_var.get() == "GA":
             self.next_ga_generation(skip_animation=False, is_auto=False)
         else:
-            thread = threading.Thread(target=self._run_algorithm_background, args=(self.algo_var.get(), False))
-            thread.start()
+            self._run_algorithm_background(self.algo_var.get(), False)
 
     # ==============
     # FR: Lance un algorithme rapidement sans animation.
@@ -428,84 +438,147 @@ class TSPApp(tk.Tk):
         if self.algo_var.get() == "GA":
             self.next_ga_generation(skip_animation=True, is_auto=False)
         else:
-            thread = threading.Thread(target=self._run_algorithm_background, args=(self.algo_var.get(), False, True))
-            thread.start()
+            self._run_algorithm_background(self.algo_var.get(), False, True)
 
     # ==============
-    # FR: Exécute un algorithme en arrière-plan.
+    # FR: Exécute un algorithme en arrière-plan (pool de processus); les meilleurs chemins sont affichés au fil de l'eau.
     #
-    # EN: Runs an algorithm in the background.
+    # EN: Runs an algorithm in the background (process pool); best paths are displayed as they arrive.
     # =========
     def _run_algorithm_background(self, algo_name, is_auto, skip_animation=False):
-        new_path = self._run_algorithm(algo_name)
-        self.after(0, lambda: self._check_and_update_best(new_path, is_auto=is_auto, skip_animation=skip_animation))
+        if self.run_job is not None:
+            return
+        cities = self.cities
+        self.stats_logger.new_run()
+        job = self.run_job = self.runner.submit(
+            solve, algo_name, cities, self._solver_params(algo_name),
+            on_progress=lambda *progress: self._show_progress(job, *progress),
+            on_done=lambda result: self._on_run_done(job, result, cities, is_auto, skip_animation)
+        )
 
     # ==============
-    # FR: Exécute un algorithme (GA, ACO ou Hybride) et retourne le meilleur chemin.
+    # FR: Retourne les paramètres d'un algorithme (GA, ACO, Hybride ou Cluster).
     #
-    # EN: Runs an algorithm (GA, ACO or Hybrid) and returns the best path.
+    # EN: Returns the parameters of an algorithm (GA, ACO, Hybrid or Cluster).
     # =========
-    def _run_algorithm(self, algo_name):
-        if algo_name == "GA":
-            ga = GeneticAlgorithm(self.cities, logger=self.stats_logger)
-            best_path, _ = ga.run()
-            return best_path
-        elif algo_name == "ACO":
-            aco = AntColony(self.cities, logger=self.stats_logger)
-            best_path, _ = aco.run()
-            return best_path
-        else:
-            hybrid = HybridTSP(
-                self.cities,
-                logger=self.stats_logger,
-                ga_params={"pop_size": 50, "max_gen": self.max_gen_var.get(), "mutation_rate": 0.05,
-                           "elitism_count": 10},
-                aco_params={"ant_count": 20, "iterations": 50}
-            )
-            best_path, _ = hybrid.run()
-            return best_path
+    def _solver_params(self, algo_name):
+        if algo_name == "Hybride":
+            return {
+                "local_search": True,
+                "ga_params": {"pop_size": 50, "max_gen": self.max_gen_var.get(), "mutation_rate": 0.05,
+                              "elitism_count": 10},
+                "aco_params": {"ant_count": 20, "iterations": 50}
+            }
+        return {}
+
+    # ==============
+    # FR: Affiche le meilleur chemin courant d'une exécution en cours (ignoré si elle n'est plus l'exécution courante).
+    #
+    # EN: Displays the current best path of a running execution (ignored once it is no longer the current run).
+    # =========
+    def _show_progress(self, job, algo_name, step, best_path, best_distance):
+        if job != self.run_job:
+            return
+        self.renderer.set_paths(self.stored_paths + [(best_path, "#4cc9f0", 1)])
+        self._update_info_label(f"{algo_name} - étape {step + 1}: meilleure distance = {best_distance:.2f}")
+
+    # ==============
+    # FR: Reçoit le résultat d'une exécution (None si annulée ou en échec) et l'affiche s'il concerne encore les villes
+    # actuelles. Le rappel d'une exécution annulée arrive après coup: il est ignoré si une autre exécution a démarré.
+    #
+    # EN: Receives the result of a run (None when cancelled or failed) and displays it if it still matches the current
+    # cities. A cancelled run's callback arrives late: it is ignored when another run has started since.
+    # =========
+    def _on_run_done(self, job, result, cities, is_auto, skip_animation):
+        if job != self.run_job:
+            return
+        self.run_job = None
+        if cities is not self.cities:
+            return
+        if result is None or result[0] is None:
+            self._refresh_canvas()
+            self._update_info_label("Exécution annulée.")
+            return
+        self.solver_state = result[2]
+        self._check_and_update_best(result[0], is_auto=is_auto, skip_animation=skip_animation)
+
+    # ==============
+    # FR: Annule l'exécution en cours (algorithme complet ou génération GA); announce l'indique à l'utilisateur, le
+    # rappel de la tâche annulée étant ignoré.
+    #
+    # EN: Cancels the running execution (full algorithm or GA generation); announce tells the user about it, since the
+    # cancelled job's callback is ignored.
+    # =========
+    def _cancel_run(self, announce=False):
+        if announce and (self.run_job is not None or self.ga_job is not None):
+            self._refresh_canvas()
+            self._update_info_label("Exécution annulée.")
+        self.runner.cancel()
+        self.run_job = None
+        self.ga_job = None
+        self.ga_stepper = None
+        self.ga_population = None
+        self.ga_generation = 0
 
     # ==============
-    # FR: Exécute une génération de l’algorithme génétique (GA).
+    # FR: Lance une génération de l’algorithme génétique (GA) dans le thread du runner; le GA est créé au premier pas
+    # (depuis la population courante, éventuellement remappée) et réutilisé jusqu'à la fin de l'exécution.
     #
-    # EN: Executes one generation of the genetic algorithm (GA).
+    # EN: Starts one generation of the genetic algorithm (GA) in the runner's thread; the GA is created on the first step
+    # (from the current, possibly remapped, population) and reused until the end of the run.
     # =========
     def next_ga_generation(self, skip_animation=False, is_auto=False):
         if self.is_animating:
             self.after(500, lambda: self.next_ga_generation(skip_animation=skip_animation, is_auto=is_auto))
             return
-        if not self.ga_generator:
+        if self.ga_job is not None:
+            return
+        if self.ga_population is None:
             self.stats_logger.reset()
+            self.stats_logger.new_run()
             self._update_stats_graphs()
+            self.ga_generation = 0
+        cities = self.cities
+        if self.ga_stepper is None:
+            params = {"pop_size": 50, "mutation_rate": 0.05, "elitism_count": 10}
+            self.ga_stepper = GAStepper(cities, params, self.ga_population, self.ga_generation,
+                                        self.max_gen_var.get(), self.dist_matrix)
+        job = self.ga_job = self.runner.submit(
+            self.ga_stepper.step, thread=True,
+            on_done=lambda output: self._on_ga_generation(job, output, cities, skip_animation, is_auto)
+        )
 
-            max_gen = self.max_gen_var.get()
-            self.ga_instance = GeneticAlgorithm(
-                self.cities, pop_size=50, max_gen=max_gen, mutation_rate=0.05, elitism_count=10,
-                logger=self.stats_logger
-            )
-            self.ga_generator = self.ga_instance.run_step_by_step()
-        try:
-            result = next(self.ga_generator)
-            self.generation_label.config(text=f"Génération: {result['generation']}")
-            self._update_info_label(
-                f"Génération {result['generation']}: Meilleure distance = {result['best_distance']:.2f} (durée {result['duration']:.2f}s)"
-            )
-            self._update_stats_graphs()
-            self._check_and_update_best(result["best_path"], is_auto=is_auto, skip_animation=skip_animation)
-            max_gen = self.max_gen_var.get()
-            if result['generation'] >= max_gen - 1:
-                self.generation_label.config(text="Fin des générations GA.")
-                self.after(1000, self._stop_auto)
-                self.ga_generator = None
-                self.ga_instance = None
-            else:
-                if is_auto and self.auto_running and skip_animation:
-                    self.after(1000, self._clear_and_next_ga, skip_animation, is_auto)
-        except StopIteration:
+    # ==============
+    # FR: Reçoit la génération GA calculée en arrière-plan et met à jour l'affichage.
+    #
+    # EN: Receives the GA generation computed in the background and updates the display (ignored if it is stale).
+    # =========
+    def _on_ga_generation(self, job, output, cities, skip_animation, is_auto):
+        if job != self.ga_job:
+            return
+        self.ga_job = None
+        if cities is not self.cities or output is None or output[0] is None:
+            self.ga_stepper = None
+            return
+        result, self.ga_population = output
+        self.ga_generation = result["generation"]
+        self.generation_label.config(text=f"Génération: {result['generation']}")
+        self._update_info_label(
+            f"Génération {result['generation']}: Meilleure distance = {result['best_distance']:.2f} "
+            f"(calcul {result['duration']:.2f}s, journalisation {result['log_overhead'] * 1000:.1f}ms)"
+        )
+        self._update_stats_graphs()
+        self._check_and_update_best(result["best_path"], is_auto=is_auto, skip_animation=skip_animation)
+        max_gen = self.max_gen_var.get()
+        if result['generation'] >= max_gen - 1:
             self.generation_label.config(text="Fin des générations GA.")
             self.after(1000, self._stop_auto)
-            self.ga_generator = None
-            self.ga_instance = None
+            self.ga_stepper = None
+            self.ga_population = None
+            self.ga_generation = 0
+        else:
+            if is_auto and self.auto_running and skip_animation:
+                self.after(1000, self._clear_and_next_ga, skip_animation, is_auto)
 
     # ==============
     # FR: Vide le canvas et lance une nouvelle génération GA.
@@ -514,7 +587,6 @@ class TSPApp(tk.Tk):
     # =========
     def _clear_and_next_ga(self, skip_animation, is_auto):
         self.stored_paths.clear()
-        self.canvas.delete("all")
         self._refresh_canvas()
         if self.auto_running:
             self.next_ga_generation(skip_animation=skip_animation, is_auto=is_auto)
@@ -579,14 +651,7 @@ class TSPApp(tk.Tk):
     # EN: Draws a synthwave-style segment between two cities.
     # =========
     def _draw_synthwave_line(self, i1, i2, seg_idx):
-        palette = ["#f72585", "#b5179e", "#7209b7", "#3a0ca3", "#4361ee", "#4cc9f0"]
-        color = palette[seg_idx % len(palette)]
-        x1, y1 = self.cities[i1]
-        x2, y2 = self.cities[i2]
-        line_id = self.canvas.create_line(x1, y1, x2, y2, fill=color, width=3)
-        dist_val = math.dist((x1, y1), (x2, y2))
-        self.canvas.tag_bind(line_id, "<Enter>", lambda e, d=dist_val: self._show_segment_distance(d))
-        self.canvas.tag_bind(line_id, "<Leave>", lambda e: self._show_segment_distance(None))
+        self.renderer.add_segment(i1, i2, seg_idx)
 
     # ==============
     # FR: Ajoute un chemin à la liste des chemins affichés.
@@ -639,8 +704,7 @@ class TSPApp(tk.Tk):
         if self.algo_var.get() == "GA":
             self.next_ga_generation(skip_animation=True, is_auto=True)
         else:
-            thread = threading.Thread(target=self._run_algorithm_background, args=(self.algo_var.get(), True, True))
-            thread.start()
+            self._run_algorithm_background(self.algo_var.get(), True, True)
 
     # ==============
     # FR: Stoppe l’exécution automatique de l’algorithme.
@@ -650,8 +714,7 @@ class TSPApp(tk.Tk):
     def _stop_auto(self):
         self.auto_running = False
         self.auto_status_label.config(text="OFF", foreground="#F00")
-        self.ga_generator = None
-        self.ga_instance = None
+        self._cancel_run(announce=True)
 
     # ==============
     # FR: Dessine la meilleure solution enregistrée.
@@ -670,46 +733,31 @@ class TSPApp(tk.Tk):
         self._update_info_label(f"Solution enregistrée dessinée (dist={dist:.2f}).")
 
     # ==============
-    # FR: Dessine un chemin complet rapidement avec survol interactif.
+    # FR: Dessine un chemin complet rapidement (un seul polyligne, survol géré par _on_mouse_move).
     #
-    # EN: Quickly draws a full path with interactive hover effects.
+    # EN: Quickly draws a full path (a single polyline, hover handled by _on_mouse_move).
     # =========
     def _draw_path(self, path, color="#ffa600", width=2, clear_first=True, store_in_list=False):
         if clear_first:
             self._refresh_canvas()
-        for i in range(len(path) - 1):
-            idx1 = path[i]
-            idx2 = path[i + 1]
-            x1, y1 = self.cities[idx1]
-            x2, y2 = self.cities[idx2]
-            dist_val = math.dist((x1, y1), (x2, y2))
-            line_id = self.canvas.create_line(x1, y1, x2, y2, fill=color, width=width)
-            self.canvas.tag_bind(line_id, "<Enter>", lambda e, d=dist_val: self._show_segment_distance(d))
-            self.canvas.tag_bind(line_id, "<Leave>", lambda e: self._show_segment_distance(None))
-        if len(path) > 1:
-            x_last, y_last = self.cities[path[-1]]
-            x_first, y_first = self.cities[path[0]]
-            dist_val = math.dist((x_last, y_last), (x_first, y_first))
-            line_id = self.canvas.create_line(x_last, y_last, x_first, y_first, fill=color, width=width)
-            self.canvas.tag_bind(line_id, "<Enter>", lambda e, d=dist_val: self._show_segment_distance(d))
-            self.canvas.tag_bind(line_id, "<Leave>", lambda e: self._show_segment_distance(None))
-        if store_in_list:
-            self.stored_paths.append((path[:], color, width))
-
-    # ==============
-    # FR: Gère l’événement de survol de la souris sur le canvas.
-    #
-    # EN: Handles mouse hover events over the canvas.
+        paths = self.stored_paths if store_in_list else self.stored_paths[:]
+        paths.append((path[:], color, width))
+        self.renderer.set_paths(paths)
+
+    # ==============
+    # FR: Gère l’événement de survol de la souris sur le canvas (ville et segment les plus proches, via index spatial).
+    #
+    # EN: Handles mouse hover events over the canvas (nearest city and segment, through spatial indexes).
     # =========
     def _on_mouse_move(self, event):
-        found_city = False
-        for i, (cx, cy) in enumerate(self.cities):
-            if (event.x - cx) ** 2 + (event.y - cy) ** 2 <= self.HOVER_RADIUS ** 2:
-                self.hover_label.config(text=f"Survol: Ville {i + 1} (X={cx}, Y={cy})")
-                found_city = True
-                break
-        if not found_city:
+        i = self.renderer.city_at(event.x, event.y, self.HOVER_RADIUS)
+        if i is not None:
+            cx, cy = self.cities[i]
+            self.hover_label.config(text=f"Survol: Ville {i + 1} (X={cx}, Y={cy})")
+        else:
             self.hover_label.config(text=f"Survol: ({event.x}, {event.y})")
+        segment = self.renderer.segment_at(event.x, event.y, self.SEGMENT_HOVER_RADIUS)
+        self._show_segment_distance(self.dist_matrix.dist(*segment) if segment else None)
 
     # ==============
     # FR: Affiche la distance du segment survolé.
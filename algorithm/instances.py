@@ -0,0 +1,122 @@
+import csv
+import math
+import os
+
+# FR: Seul EUC_2D correspond à la distance euclidienne des solveurs; GEO, ATT, CEIL_2D... donneraient des longueurs fausses.
+# EN: Only EUC_2D matches the solvers' Euclidean distance; GEO, ATT, CEIL_2D... would give wrong lengths.
+TSPLIB_EDGE_TYPES = ("EUC_2D",)
+
+# ==============
+# FR: Charge une instance depuis un fichier CSV de coordonnées ou un fichier TSPLIB (.tsp); retourne (nom, villes).
+#
+# EN: Loads an instance from a coordinate CSV file or a TSPLIB (.tsp) file; returns (name, cities).
+# =========
+def load_instance(path):
+    name = os.path.splitext(os.path.basename(path))[0]
+    if path.lower().endswith(".tsp"):
+        return name, load_tsplib(path)
+    return name, load_csv(path)
+
+# ==============
+# FR: Lit un CSV "x,y" ou "id,x,y" (une ville par ligne); les lignes non numériques (en-tête) sont ignorées.
+#
+# EN: Reads an "x,y" or "id,x,y" CSV (one city per line); non-numeric lines (header) are skipped.
+# =========
+def load_csv(path):
+    cities = []
+    with open(path, newline="") as f:
+        for row in csv.reader(f):
+            values = [value.strip() for value in row if value.strip()]
+            if len(values) < 2:
+                continue
+            try:
+                x, y = float(values[-2]), float(values[-1])
+            except ValueError:
+                continue
+            cities.append((x, y))
+    if not cities:
+        raise ValueError(f"Aucune ville trouvée dans {path}")
+    return cities
+
+# ==============
+# FR: Lit la section NODE_COORD_SECTION d'un fichier TSPLIB à distance euclidienne (EUC_2D); tout autre type est refusé.
+#
+# EN: Reads the NODE_COORD_SECTION of a Euclidean-distance (EUC_2D) TSPLIB file; any other type is rejected.
+# =========
+def load_tsplib(path):
+    cities = []
+    edge_type = None
+    in_coords = False
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            if not in_coords:
+                key, _, value = line.partition(":")
+                key = key.strip().upper()
+                if key == "EDGE_WEIGHT_TYPE":
+                    edge_type = value.strip().upper()
+                elif key == "NODE_COORD_SECTION":
+                    in_coords = True
+                continue
+            if line.upper() == "EOF" or not line[0].isdigit():
+                break
+            parts = line.split()
+            cities.append((float(parts[1]), float(parts[2])))
+    if edge_type is not None and edge_type not in TSPLIB_EDGE_TYPES:
+        raise ValueError(f"Type de distance TSPLIB non pris en charge: {edge_type} (choix: {', '.join(TSPLIB_EDGE_TYPES)})")
+    if not cities:
+        raise ValueError(f"Aucune coordonnée trouvée dans {path}")
+    return cities
+
+# ==============
+# FR: Longueur d'un tour selon TSPLIB pour EUC_2D: chaque arête est arrondie à l'entier le plus proche (nint) avant la
+# somme. Les solveurs optimisent la distance euclidienne non arrondie, qui peut en différer de quelques unités.
+#
+# EN: Length of a tour as defined by TSPLIB for EUC_2D: each edge is rounded to the nearest integer (nint) before
+# summing. The solvers optimize the unrounded Euclidean distance, which can differ from it by a few units.
+# =========
+def tsplib_length(cities, tour):
+    tour = list(tour)
+    total = 0
+    for a, b in zip(tour, tour[1:] + tour[:1]):
+        (xa, ya), (xb, yb) = cities[a], cities[b]
+        total += int(math.hypot(xa - xb, ya - yb) + 0.5)
+    return total
+
+# ==============
+# FR: Écrit un tour au format TSPLIB (.tour), villes numérotées à partir de 1; une longueur entière (TSPLIB) est écrite
+# telle quelle.
+#
+# EN: Writes a tour in TSPLIB format (.tour), cities numbered from 1; an integer (TSPLIB) length is written as is.
+# =========
+def save_tour(path, name, tour, length=None):
+    with open(path, "w") as f:
+        f.write(f"NAME : {name}\n")
+        f.write("TYPE : TOUR\n")
+        if isinstance(length, int):
+            f.write(f"COMMENT : Length {length}\n")
+        elif length is not None:
+            f.write(f"COMMENT : Length {length:.4f}\n")
+        f.write(f"DIMENSION : {len(tour)}\n")
+        f.write("TOUR_SECTION\n")
+        f.write("".join(f"{city + 1}\n" for city in tour))
+        f.write("-1\nEOF\n")
+
+# ==============
+# FR: Écrit une instance au format TSPLIB (.tsp, EUC_2D).
+#
+# EN: Writes an instance in TSPLIB format (.tsp, EUC_2D).
+# =========
+def save_tsplib(path, name, cities, comment=None):
+    with open(path, "w") as f:
+        f.write(f"NAME : {name}\n")
+        if comment:
+            f.write(f"COMMENT : {comment}\n")
+        f.write("TYPE : TSP\n")
+        f.write(f"DIMENSION : {len(cities)}\n")
+        f.write("EDGE_WEIGHT_TYPE : EUC_2D\n")
+        f.write("NODE_COORD_SECTION\n")
+        f.write("".join(f"{i + 1} {x:.4f} {y:.4f}\n" for i, (x, y) in enumerate(cities)))
+        f.write("EOF\n")
@@ -0,0 +1,167 @@
+import itertools
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from .ga import GeneticAlgorithm
+from .distance_matrix import DistanceMatrix, get_distance_matrix
+from .shared_arrays import SharedArray, attach, detach, detach_at_exit
+
+_worker_ga = None
+
+# ==============
+# FR: Initialise un processus de travail: villes et matrice en mémoire partagée, et un GA construit une seule fois
+# (listes de voisins, recherche locale) réutilisé par toutes les îles et époques confiées à ce processus.
+#
+# EN: Initializes a worker process: cities and matrix in shared memory, and a GA built once (neighbour lists, local
+# search) reused by every island and epoch handed to this process.
+# =========
+def _init_worker(coords_spec, matrix_spec, ga_params):
+    global _worker_ga
+    detach_at_exit(_release_worker)
+    cities = [tuple(city) for city in attach(coords_spec).tolist()]
+    dist_matrix = DistanceMatrix.from_matrix(cities, attach(matrix_spec))
+    _worker_ga = GeneticAlgorithm(cities, dist_matrix=dist_matrix, **ga_params)
+
+# ==============
+# FR: Libère le GA du processus de travail et ferme ses segments de mémoire partagée.
+#
+# EN: Releases the worker process's GA and closes its shared memory segments.
+# =========
+def _release_worker():
+    global _worker_ga
+    _worker_ga = None
+    detach()
+
+# ==============
+# FR: Fait évoluer une île pendant quelques générations avec le GA du processus de travail.
+#
+# EN: Evolves one island for a few generations with the worker process's GA.
+# =========
+def _evolve_island(population, generations, seed):
+    random.seed(seed)
+    ga = _worker_ga
+    ga.rng = np.random.default_rng(seed)
+    ga.max_gen = generations
+    history = []
+    for result in ga.run_step_by_step(population):
+        history.append((result["best_distance"], result["best_path"]))
+    final = [list(map(int, indiv)) for indiv in ga.population]
+    final.sort(key=ga.total_distance)
+    return history, final
+
+class IslandGeneticAlgorithm(GeneticAlgorithm):
+    def __init__(self, cities, islands=4, migration_interval=10, migration_size=2, workers=None, **ga_params):
+        # FR: Les îles partagent la matrice en mémoire partagée: des distances depuis les coordonnées ne suffisent pas.
+        # EN: The islands share the matrix through shared memory: distances from the coordinates are not enough.
+        ga_params["dist_matrix"] = get_distance_matrix(cities, ga_params.get("dist_matrix"), dense=True)
+        super().__init__(cities, **ga_params)
+        self.islands = islands
+        self.migration_interval = migration_interval
+        self.migration_size = migration_size
+        self.workers = workers or min(islands, os.cpu_count() or 1)
+        self.island_params = {
+            key: value for key, value in ga_params.items()
+            if key not in ("max_gen", "logger", "dist_matrix", "progress", "cancel", "profiler",
+                           "time_budget", "stagnation_rounds", "stagnation_eps", "initial_population")
+        }
+
+    # ==============
+    # FR: Répartit une population initiale entre les îles (un individu sur islands chacune), complétée par des chemins
+    # aléatoires jusqu'à pop_size; None laisse chaque île s'initialiser elle-même.
+    #
+    # EN: Splits an initial population across the islands (every islands-th individual each), padded with random paths
+    # up to pop_size; None lets every island initialize itself.
+    # =========
+    def _split_population(self, population):
+        if population is None:
+            return [None] * self.islands
+        population = [list(map(int, indiv)) for indiv in population]
+        populations = []
+        for i in range(self.islands):
+            share = population[i::self.islands][:self.pop_size]
+            while len(share) < self.pop_size:
+                share.append(self._random_tour())
+            populations.append(share)
+        return populations
+
+    # ==============
+    # FR: Migration en anneau: les meilleurs individus de chaque île remplacent les pires de l'île suivante.
+    #
+    # EN: Ring migration: each island's best individuals replace the worst ones of the next island.
+    # =========
+    def _migrate(self, populations):
+        count = min(self.migration_size, self.pop_size - 1)
+        if count <= 0 or len(populations) < 2:
+            return populations
+        migrants = [population[:count] for population in populations]
+        return [
+            population[:-count] + [indiv[:] for indiv in migrants[i - 1]]
+            for i, population in enumerate(populations)
+        ]
+
+    # ==============
+    # FR: Exécute le modèle en îles par époques de migration et produit le meilleur global à chaque génération.
+    #
+    # EN: Runs the island model in migration epochs and yields the global best at every generation.
+    # =========
+    def run_step_by_step(self, population=None, start=0):
+        self.stopping.start()
+        rounds = iter(self.stopping.rounds(start, self.max_gen))
+        coords = SharedArray(np.asarray(self.cities, dtype=np.float64).reshape(self.n, 2))
+        matrix = SharedArray(self.dist_matrix.matrix)
+        populations = self._split_population(population)
+        best_path = None
+        best_distance = float('inf')
+        try:
+            with ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                     initargs=(coords.spec, matrix.spec, self.island_params)) as executor:
+                while True:
+                    if self.cancel is not None and self.cancel.is_set():
+                        break
+                    if self.stopping.should_stop():
+                        break
+                    epoch = list(itertools.islice(rounds, self.migration_interval))
+                    if not epoch:
+                        break
+                    generations = len(epoch)
+                    start_time = time.time()
+                    with self.profiler.phase("GA"):
+                        with self.profiler.phase("islands"):
+                            futures = [
+                                executor.submit(_evolve_island, populations[i], generations, random.getrandbits(64))
+                                for i in range(self.islands)
+                            ]
+                            results = [future.result() for future in futures]
+                        with self.profiler.phase("migration"):
+                            populations = self._migrate([final for _, final in results])
+                    duration = (time.time() - start_time) / generations
+                    profile = self.profiler.pop_step()
+
+                    for step, gen in enumerate(epoch):
+                        for history, _ in results:
+                            distance, path = history[step]
+                            if distance < best_distance:
+                                best_distance, best_path = distance, path
+                        log_overhead = 0.0
+                        if self.logger:
+                            log_overhead = self._log("GA", best_distance, duration, generation=gen,
+                                                     islands=self.islands, **profile)
+                            profile = {}
+                        if self.progress:
+                            self.progress("GA", gen, best_path, best_distance)
+                        yield {
+                            "generation": gen + 1,
+                            "best_path": best_path,
+                            "best_distance": best_distance,
+                            "duration": duration,
+                            "log_overhead": log_overhead
+                        }
+                    # FR: Pour les îles, un tour de budget et de stagnation est une époque de migration.
+                    # EN: For islands, a budget and stagnation round is one migration epoch.
+                    self.stopping.update(best_distance)
+        finally:
+            coords.close()
+            matrix.close()
+        self.population = [indiv for population in populations if population for indiv in population]
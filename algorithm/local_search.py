@@ -0,0 +1,154 @@
+from collections import deque
+
+class LocalSearch:
+    EPSILON = 1e-9
+
+    def __init__(self, dist_matrix, candidates=8, or_opt=True, max_segment=3):
+        self.dist_matrix = dist_matrix
+        self.dist = dist_matrix.matrix.item if dist_matrix.matrix is not None else dist_matrix.dist
+        self.neighbour_lists = dist_matrix.neighbours(candidates).tolist()
+        self.or_opt = or_opt
+        self.max_segment = max_segment
+
+    # ==============
+    # FR: Améliore un chemin par 2-opt et Or-opt (listes de voisins et bits "don't look"), en conservant sa première ville.
+    #
+    # EN: Improves a path with 2-opt and Or-opt (neighbour lists and don't-look bits), keeping its first city.
+    # =========
+    def improve(self, path, active=None):
+        n = len(path)
+        if n < 5:
+            return list(path), self.dist_matrix.tour_length(path)
+        first = path[0]
+        tour = list(path)
+        pos = [0] * n
+        for i, city in enumerate(tour):
+            pos[city] = i
+
+        queue = deque(tour if active is None else active)
+        queued = [False] * n
+        for city in queue:
+            queued[city] = True
+
+        while queue:
+            a = queue.popleft()
+            queued[a] = False
+            touched = self._try_two_opt(tour, pos, a)
+            if not touched and self.or_opt:
+                touched = self._try_or_opt(tour, pos, a)
+            for city in touched:
+                if not queued[city]:
+                    queued[city] = True
+                    queue.append(city)
+
+        start = pos[first]
+        tour = tour[start:] + tour[:start]
+        return tour, self.dist_matrix.tour_length(tour)
+
+    # ==============
+    # FR: Cherche un mouvement 2-opt améliorant autour de la ville a (delta en O(1)) et l'applique.
+    #
+    # EN: Looks for an improving 2-opt move around city a (O(1) delta) and applies it.
+    # =========
+    def _try_two_opt(self, tour, pos, a):
+        n = len(tour)
+        dist = self.dist
+        for forward in (True, False):
+            i = pos[a]
+            b = tour[(i + 1) % n] if forward else tour[i - 1]
+            d_ab = dist(a, b)
+            for c in self.neighbour_lists[a]:
+                d_ac = dist(a, c)
+                if d_ac >= d_ab - self.EPSILON:
+                    break
+                j = pos[c]
+                d = tour[(j + 1) % n] if forward else tour[j - 1]
+                if d == a or c == b:
+                    continue
+                delta = d_ac + dist(b, d) - d_ab - dist(c, d)
+                if delta < -self.EPSILON:
+                    if forward:
+                        self._reverse(tour, pos, (i + 1) % n, j)
+                    else:
+                        self._reverse(tour, pos, i, pos[d])
+                    return (a, b, c, d)
+        return ()
+
+    # ==============
+    # FR: Inverse le segment cyclique [i..j] du chemin (ou son complément s'il est plus court).
+    #
+    # EN: Reverses the cyclic segment [i..j] of the path (or its complement when shorter).
+    # =========
+    @staticmethod
+    def _reverse(tour, pos, i, j):
+        n = len(tour)
+        length = (j - i) % n + 1
+        if 2 * length > n:
+            i, j = (j + 1) % n, (i - 1) % n
+            length = n - length
+        for _ in range(length // 2):
+            ci, cj = tour[i], tour[j]
+            tour[i], tour[j] = cj, ci
+            pos[cj], pos[ci] = i, j
+            i = (i + 1) % n
+            j = (j - 1) % n
+
+    # ==============
+    # FR: Déplace le segment qui commence en position i juste après la position j, sur place: seules les villes entre le
+    # segment et sa destination sont décalées, du côté le plus court du cycle, et seules leurs positions sont mises à jour.
+    #
+    # EN: Moves the segment starting at position i to right after position j, in place: only the cities between the
+    # segment and its destination are shifted, on the shorter side of the cycle, and only their positions are updated.
+    # =========
+    @staticmethod
+    def _move_segment(tour, pos, i, seg, j):
+        n = len(tour)
+        length = len(seg)
+        after = (j - i - length) % n + 1
+        before = n - length - after
+        if after <= before:
+            start = i
+            cities = [tour[(i + length + k) % n] for k in range(after)] + seg
+        else:
+            start = (i - before) % n
+            cities = seg + [tour[(start + k) % n] for k in range(before)]
+        for k, city in enumerate(cities):
+            at = (start + k) % n
+            tour[at] = city
+            pos[city] = at
+
+    # ==============
+    # FR: Cherche un déplacement Or-opt améliorant d'un segment de 1 à 3 villes commençant en a, et l'applique.
+    #
+    # EN: Looks for an improving Or-opt move of a 1 to 3 city segment starting at a, and applies it.
+    # =========
+    def _try_or_opt(self, tour, pos, a):
+        n = len(tour)
+        dist = self.dist
+        i = pos[a]
+        p = tour[i - 1]
+        for length in range(1, self.max_segment + 1):
+            if length > n - 3:
+                break
+            e = tour[(i + length - 1) % n]
+            f = tour[(i + length) % n]
+            segment = {tour[(i + k) % n] for k in range(length)}
+            removed = dist(p, a) + dist(e, f) - dist(p, f)
+            if removed <= self.EPSILON:
+                continue
+            for c in set(self.neighbour_lists[a]) | set(self.neighbour_lists[e]):
+                if c in segment or c == p:
+                    continue
+                d = tour[(pos[c] + 1) % n]
+                if d in segment:
+                    continue
+                d_cd = dist(c, d)
+                straight = dist(c, a) + dist(e, d) - d_cd
+                reverse = dist(c, e) + dist(a, d) - d_cd
+                if min(straight, reverse) - removed < -self.EPSILON:
+                    seg = [tour[(i + k) % n] for k in range(length)]
+                    if reverse < straight:
+                        seg.reverse()
+                    self._move_segment(tour, pos, i, seg, pos[c])
+                    return (p, f, c, d, a, e)
+        return ()
@@ -1,6 +1,14 @@
-import tkinter as tk
-from tkinter import simpledialog
-from gui import TSPApp
+import os
+import sys
+
+if __package__ in (None, ""):
+    # FR: Lancé comme script (python main.py): on rend le paquet "algorithm" importable.
+    # EN: Run as a script (python main.py): make the "algorithm" package importable.
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    import algorithm
+    __package__ = "algorithm"
+
+from .gui import TSPApp
 
 def main():
     app = TSPApp()
@@ -0,0 +1,33 @@
+import numpy as np
+
+class PheromoneStore:
+    def __init__(self, n, initial=0.1, minimum=0.001):
+        self.n = n
+        self.minimum = minimum
+        self.matrix = np.full((n, n), initial, dtype=np.float64)
+
+    # ==============
+    # FR: Fait évaporer et borne toutes les phéromones en place, sans allouer de nouvelle matrice.
+    #
+    # EN: Evaporates and clamps every pheromone in place, without allocating a new matrix.
+    # =========
+    def evaporate(self, rate):
+        np.multiply(self.matrix, 1.0 - rate, out=self.matrix)
+        np.maximum(self.matrix, self.minimum, out=self.matrix)
+
+    # ==============
+    # FR: Dépose en une seule opération (scatter-add) les phéromones de plusieurs chemins fermés, dans les deux sens.
+    #
+    # EN: Deposits the pheromones of several closed paths at once (scatter-add), in both directions.
+    # =========
+    def deposit(self, paths, amounts):
+        paths = np.asarray(paths, dtype=np.intp)
+        if paths.ndim == 1:
+            paths = paths[None, :]
+        if paths.shape[1] < 2:
+            return
+        starts = paths.ravel()
+        ends = np.roll(paths, -1, axis=1).ravel()
+        weights = np.repeat(np.asarray(amounts, dtype=np.float64), paths.shape[1])
+        np.add.at(self.matrix, (starts, ends), weights)
+        np.add.at(self.matrix, (ends, starts), weights)
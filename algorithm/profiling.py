@@ -0,0 +1,168 @@
+import json
+import os
+import time
+from collections import defaultdict
+
+class _Phase:
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.profiler._stack.append([self.name, 0])
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler._close(self.start, time.perf_counter_ns())
+        return False
+
+class _NullPhase:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+_NULL_PHASE = _NullPhase()
+
+class NullProfiler:
+    enabled = False
+
+    # ==============
+    # FR: Phase sans mesure: retourne un gestionnaire de contexte partagé qui ne fait rien.
+    #
+    # EN: Unmeasured phase: returns a shared context manager that does nothing.
+    # =========
+    def phase(self, name):
+        return _NULL_PHASE
+
+    # ==============
+    # FR: Compteur ignoré.
+    #
+    # EN: Ignored counter.
+    # =========
+    def count(self, name, amount=1):
+        pass
+
+    # ==============
+    # FR: Aucune mesure à rapporter.
+    #
+    # EN: No measurement to report.
+    # =========
+    def pop_step(self):
+        return {}
+
+NULL_PROFILER = NullProfiler()
+
+class Profiler:
+    enabled = True
+
+    def __init__(self, trace=False):
+        self.trace = trace
+        self.events = []
+        self.totals = defaultdict(int)
+        self.folded = defaultdict(int)
+        self.counters = defaultdict(int)
+        self.step_times = defaultdict(int)
+        self.step_counters = defaultdict(int)
+        self.origin = time.perf_counter_ns()
+        self._stack = []
+
+    # ==============
+    # FR: Mesure une phase nommée (gestionnaire de contexte); les phases peuvent s'imbriquer.
+    #
+    # EN: Measures a named phase (context manager); phases can be nested.
+    # =========
+    def phase(self, name):
+        return _Phase(self, name)
+
+    # ==============
+    # FR: Ajoute une quantité à un compteur (évaluations de distance, mutations, tirages aléatoires...).
+    #
+    # EN: Adds an amount to a counter (distance evaluations, mutations, random draws...).
+    # =========
+    def count(self, name, amount=1):
+        self.step_counters[name] += amount
+
+    # ==============
+    # FR: Ferme la phase courante: temps total, temps propre par pile (hors sous-phases) et événement de trace.
+    #
+    # EN: Closes the current phase: total time, self time per stack (excluding sub-phases) and trace event.
+    # =========
+    def _close(self, start, end):
+        name, children = self._stack[-1]
+        elapsed = end - start
+        self.folded[";".join(frame[0] for frame in self._stack)] += elapsed - children
+        self._stack.pop()
+        if self._stack:
+            self._stack[-1][1] += elapsed
+        self.step_times[name] += elapsed
+        if self.trace:
+            self.events.append((name, start - self.origin, elapsed, len(self._stack)))
+
+    # ==============
+    # FR: Retourne les temps (ms) et compteurs de l'étape écoulée, à passer en extras du logger, puis les remet à zéro.
+    #
+    # EN: Returns the elapsed step's times (ms) and counters, to pass as logger extras, and resets them.
+    # =========
+    def pop_step(self):
+        step = {f"{name}_ms": elapsed / 1e6 for name, elapsed in self.step_times.items()}
+        step.update(self.step_counters)
+        for name, elapsed in self.step_times.items():
+            self.totals[name] += elapsed
+        for name, amount in self.step_counters.items():
+            self.counters[name] += amount
+        self.step_times.clear()
+        self.step_counters.clear()
+        return step
+
+    # ==============
+    # FR: Résumé de toute l'exécution: temps total par phase (ms) et compteurs cumulés.
+    #
+    # EN: Whole-run summary: total time per phase (ms) and cumulative counters.
+    # =========
+    def summary(self):
+        self.pop_step()
+        return {
+            "phases_ms": {name: elapsed / 1e6 for name, elapsed in sorted(self.totals.items())},
+            "counters": dict(self.counters),
+        }
+
+    # ==============
+    # FR: Écrit la trace au format Chrome (chrome://tracing, Perfetto, speedscope); nécessite trace=True.
+    #
+    # EN: Writes the trace in Chrome format (chrome://tracing, Perfetto, speedscope); requires trace=True.
+    # =========
+    def export_chrome_trace(self, path):
+        pid = os.getpid()
+        events = [
+            {"name": name, "ph": "X", "ts": start / 1000.0, "dur": elapsed / 1000.0, "pid": pid, "tid": 0,
+             "args": {"depth": depth}}
+            for name, start, elapsed, depth in self.events
+        ]
+        with open(path, "w") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+
+    # ==============
+    # FR: Écrit les piles repliées ("GA;selection 1234", temps propre en µs) pour flamegraph.pl ou speedscope.
+    #
+    # EN: Writes folded stacks ("GA;selection 1234", self time in µs) for flamegraph.pl or speedscope.
+    # =========
+    def export_folded(self, path):
+        with open(path, "w") as f:
+            for stack, elapsed in sorted(self.folded.items()):
+                if elapsed >= 1000:
+                    f.write(f"{stack} {elapsed // 1000}\n")
+
+# ==============
+# FR: Retourne le profileur fourni, ou le profileur nul partagé s'il n'y en a pas.
+#
+# EN: Returns the given profiler, or the shared null profiler when there is none.
+# =========
+def get_profiler(profiler):
+    return profiler if profiler is not None else NULL_PROFILER
@@ -0,0 +1,203 @@
+import numpy as np
+from .spatial import SpatialGrid, SegmentGrid
+
+class TourRenderer:
+    MARGIN = 50
+    GRID_STEP = 50
+    CITY_RADIUS = 5
+    PALETTE = ["#f72585", "#b5179e", "#7209b7", "#3a0ca3", "#4361ee", "#4cc9f0"]
+
+    def __init__(self, canvas, bg_image=None):
+        self.canvas = canvas
+        self.bg_image = bg_image
+        self.bg_image_resized = None
+        self.cities = []
+        self.coords = np.empty((0, 2))
+        self.static_size = None
+        self.city_grid = SpatialGrid([])
+        self.segment_grid = SegmentGrid(self.city_grid)
+        self.paths_key = None
+        self.path_items = []
+        self.anim_segments = []
+
+    # ==============
+    # FR: Change l'ensemble de villes affiché: index spatial reconstruit, couches statiques redessinées au prochain rendu.
+    #
+    # EN: Changes the displayed set of cities: spatial index rebuilt, static layers redrawn on the next render.
+    # =========
+    def set_cities(self, cities):
+        self.cities = cities
+        self.coords = np.asarray(cities, dtype=np.float64).reshape(len(cities), 2)
+        self.city_grid = SpatialGrid(cities)
+        self.segment_grid = SegmentGrid(self.city_grid)
+        self.paths_key = None
+        self.anim_segments = []
+        self.static_size = None
+
+    # ==============
+    # FR: Redessine le canvas: couches statiques seulement si la taille ou les villes ont changé, chemins réutilisés.
+    #
+    # EN: Redraws the canvas: static layers only when the size or the cities changed, path items reused.
+    # =========
+    def render(self, paths):
+        size = (self.canvas.winfo_width(), self.canvas.winfo_height())
+        if size != self.static_size:
+            self._build_static(*size)
+            self.static_size = size
+        self.clear_animation()
+        self.set_paths(paths)
+
+    # ==============
+    # FR: Reconstruit l'image de fond, la grille et les villes (balises "static").
+    #
+    # EN: Rebuilds the background image, the grid and the cities ("static" tag).
+    # =========
+    def _build_static(self, w, h):
+        self.canvas.delete("static")
+        margin = self.MARGIN
+        self._draw_bg_image(margin, margin, w - margin, h - margin)
+        self._draw_axes_with_grads(w, h, margin, self.GRID_STEP)
+        self._draw_cities()
+        self.canvas.tag_raise("path")
+        self.canvas.tag_raise("anim")
+
+    # ==============
+    # FR: Dessine l'image de fond redimensionnée dans une zone spécifiée.
+    #
+    # EN: Draws the resized background image in a specified area.
+    # =========
+    def _draw_bg_image(self, x1, y1, x2, y2):
+        if not self.bg_image or x2 <= x1 or y2 <= y1:
+            return
+        from PIL import Image, ImageTk
+        zone_width = x2 - x1
+        zone_height = y2 - y1
+        try:
+            img_pil = ImageTk.getimage(self.bg_image)
+            resized = img_pil.resize((zone_width, zone_height), Image.Resampling.LANCZOS)
+            self.bg_image_resized = ImageTk.PhotoImage(resized)
+            self.canvas.create_image(x1, y1, anchor="nw", image=self.bg_image_resized, tags=("static", "background"))
+        except Exception as e:
+            print(f"Erreur lors du redimensionnement de l'image: {e}")
+            self.canvas.create_image(x1, y1, anchor="nw", image=self.bg_image, tags=("static", "background"))
+
+    # ==============
+    # FR: Dessine les axes et les graduations sur le canvas.
+    #
+    # EN: Draws axes and ticks on the canvas.
+    # =========
+    def _draw_axes_with_grads(self, w, h, margin, step=50):
+        tags = ("static", "grid")
+        x_start, x_end = margin, w - margin
+        y_start, y_end = h - margin, margin
+        for x_pos in range(x_start, x_end + 1, step):
+            self.canvas.create_line(x_pos, y_end, x_pos, y_start, fill="white", width=1, stipple="gray75", tags=tags)
+        for y_pos in range(y_end, y_start + 1, step):
+            self.canvas.create_line(x_start, y_pos, x_end, y_pos, fill="white", width=1, stipple="gray75", tags=tags)
+        self.canvas.create_line(x_start, y_start, x_end, y_start, fill="white", width=2, tags=tags)
+        self.canvas.create_line(x_start, y_start, x_start, y_end, fill="white", width=2, tags=tags)
+        for x_pos in range(x_start, x_end + 1, step):
+            self.canvas.create_line(x_pos, y_start - 5, x_pos, y_start + 5, fill="white", width=2, tags=tags)
+            label_val = x_pos - x_start
+            self.canvas.create_text(x_pos, y_start + 12, text=str(label_val), fill="white", font=("Helvetica", 8), tags=tags)
+        for y_pos in range(y_end, y_start + 1, step):
+            self.canvas.create_line(x_start - 5, y_pos, x_start + 5, y_pos, fill="white", width=2, tags=tags)
+            label_val = y_start - y_pos
+            self.canvas.create_text(x_start - 8, y_pos, text=str(label_val), fill="white", font=("Helvetica", 8),
+                                    anchor="e", tags=tags)
+        self.canvas.create_text(x_end + 15, y_start, text="X", fill="white", font=("Helvetica", 9), anchor="nw", tags=tags)
+        self.canvas.create_text(x_start, y_end - 15, text="Y", fill="white", font=("Helvetica", 9), anchor="sw", tags=tags)
+
+    # ==============
+    # FR: Dessine les villes sur le canvas.
+    #
+    # EN: Draws the cities on the canvas.
+    # =========
+    def _draw_cities(self):
+        r = self.CITY_RADIUS
+        tags = ("static", "cities")
+        for i, (x, y) in enumerate(self.cities):
+            self.canvas.create_oval(x - r, y - r, x + r, y + r, fill="#ffffff", outline="#000000", width=1, tags=tags)
+            self.canvas.create_text(x, y - 12, text=str(i + 1), fill="#ffffff", font=("Helvetica", 9, "bold"), tags=tags)
+
+    # ==============
+    # FR: Affiche des chemins fermés, un seul polyligne par chemin; les éléments existants sont réutilisés via coords.
+    #
+    # EN: Displays closed paths, one polyline per path; existing items are reused through coords.
+    # =========
+    def set_paths(self, paths):
+        drawn = 0
+        for path, color, width in paths:
+            if len(path) < 2:
+                continue
+            closed = list(path) + [path[0]]
+            flat = self.coords[closed].ravel().tolist()
+            if drawn < len(self.path_items):
+                item = self.path_items[drawn]
+                self.canvas.coords(item, flat)
+                self.canvas.itemconfigure(item, fill=color, width=width)
+            else:
+                self.path_items.append(self.canvas.create_line(*flat, fill=color, width=width, tags="path"))
+            drawn += 1
+        for item in self.path_items[drawn:]:
+            self.canvas.delete(item)
+        del self.path_items[drawn:]
+        self.canvas.tag_raise("path")
+        self.canvas.tag_raise("anim")
+        key = [tuple(path) for path, _, _ in paths]
+        if key != self.paths_key:
+            self.paths_key = key
+            self._index_segments()
+
+    # ==============
+    # FR: Reconstruit l'index des segments affichés (chemins enregistrés et animation en cours).
+    #
+    # EN: Rebuilds the index of the displayed segments (stored paths and running animation).
+    # =========
+    def _index_segments(self):
+        self.segment_grid = SegmentGrid(self.city_grid)
+        for path in self.paths_key or ():
+            for i in range(len(path)):
+                self.segment_grid.add(path[i - 1], path[i])
+        for a, b in self.anim_segments:
+            self.segment_grid.add(a, b)
+
+    # ==============
+    # FR: Ajoute un segment animé de type synthwave entre deux villes.
+    #
+    # EN: Adds an animated synthwave-style segment between two cities.
+    # =========
+    def add_segment(self, i1, i2, seg_idx):
+        color = self.PALETTE[seg_idx % len(self.PALETTE)]
+        x1, y1 = self.cities[i1]
+        x2, y2 = self.cities[i2]
+        self.canvas.create_line(x1, y1, x2, y2, fill=color, width=3, tags="anim")
+        self.anim_segments.append((i1, i2))
+        self.segment_grid.add(i1, i2)
+
+    # ==============
+    # FR: Supprime les segments de l'animation en cours.
+    #
+    # EN: Removes the segments of the running animation.
+    # =========
+    def clear_animation(self):
+        self.canvas.delete("anim")
+        if self.anim_segments:
+            self.anim_segments = []
+            self._index_segments()
+
+    # ==============
+    # FR: Retourne l'indice de la ville la plus proche d'un point, à moins de `radius` pixels (index spatial).
+    #
+    # EN: Returns the index of the city closest to a point, within `radius` pixels (spatial index).
+    # =========
+    def city_at(self, x, y, radius):
+        return self.city_grid.nearest_within(x, y, radius)
+
+    # ==============
+    # FR: Retourne le segment affiché (paire de villes) le plus proche d'un point, à moins de `tolerance` pixels.
+    #
+    # EN: Returns the displayed segment (pair of cities) closest to a point, within `tolerance` pixels.
+    # =========
+    def segment_at(self, x, y, tolerance):
+        return self.segment_grid.nearest_within(x, y, tolerance)
@@ -0,0 +1,148 @@
+from collections import defaultdict, deque
+import numpy as np
+
+# ==============
+# FR: Applique une modification à un ensemble de villes: retirées (indices), déplacées ({indice: (x, y)}) et ajoutées
+# (en fin de liste). Retourne (nouvelles villes, correspondance ancien indice -> nouvel indice ou None, indices à réinsérer).
+#
+# EN: Applies a change to a set of cities: removed (indices), moved ({index: (x, y)}) and added (appended).
+# Returns (new cities, mapping old index -> new index or None, indices to reinsert).
+# =========
+def apply_diff(cities, removed=(), moved=None, added=()):
+    removed = set(removed)
+    moved = moved or {}
+    new_cities, mapping, dirty = [], [], []
+    for i, city in enumerate(cities):
+        if i in removed:
+            mapping.append(None)
+            continue
+        mapping.append(len(new_cities))
+        if i in moved:
+            dirty.append(len(new_cities))
+            new_cities.append(tuple(moved[i]))
+        else:
+            new_cities.append(city)
+    for city in added:
+        dirty.append(len(new_cities))
+        new_cities.append(tuple(city))
+    return new_cities, mapping, dirty
+
+# ==============
+# FR: Déduit la correspondance entre deux listes de villes par coordonnées identiques; les villes nouvelles ou déplacées
+# sont à réinsérer. Retourne (correspondance, indices à réinsérer) comme apply_diff.
+#
+# EN: Infers the mapping between two city lists from identical coordinates; new or moved cities are to be reinserted.
+# Returns (mapping, indices to reinsert) like apply_diff.
+# =========
+def diff_cities(old, new):
+    positions = defaultdict(deque)
+    for j, city in enumerate(new):
+        positions[tuple(city)].append(j)
+    mapping = [positions[tuple(city)].popleft() if positions.get(tuple(city)) else None for city in old]
+    matched = set(mapping)
+    return mapping, [j for j in range(len(new)) if j not in matched]
+
+# ==============
+# FR: Insère chaque ville à la position la moins coûteuse du tour (coût d'insertion de toutes les arêtes en une opération).
+#
+# EN: Inserts each city at the cheapest position of the tour (insertion cost of every edge in one operation).
+# =========
+def cheapest_insertion(tour, cities, dist_matrix):
+    pair_distances = dist_matrix.pair_distances
+    tour = list(tour)
+    for city in cities:
+        if len(tour) < 2:
+            tour.append(city)
+            continue
+        idx = np.asarray(tour, dtype=np.intp)
+        nxt = np.roll(idx, -1)
+        cost = pair_distances(idx, city) + pair_distances(city, nxt) - pair_distances(idx, nxt)
+        tour.insert(int(np.argmin(cost)) + 1, city)
+    return tour
+
+# ==============
+# FR: Répare un tour de l'ancien ensemble: villes retirées ou déplacées enlevées, villes à réinsérer placées par
+# insertion au moindre coût, puis recherche locale limitée aux villes touchées. Retourne (tour, longueur).
+#
+# EN: Repairs a tour of the old set: removed or moved cities dropped, cities to reinsert placed by cheapest insertion,
+# then local search restricted to the touched cities. Returns (tour, length).
+# =========
+def repair_tour(tour, mapping, dirty, dist_matrix, local_search=None):
+    dirty_set = set(dirty)
+    kept = [mapping[city] for city in tour if mapping[city] is not None and mapping[city] not in dirty_set]
+    tour = cheapest_insertion(kept, dirty, dist_matrix)
+    if 0 in tour:
+        start = tour.index(0)
+        tour = tour[start:] + tour[:start]
+    if local_search is not None and dirty:
+        pos = {city: i for i, city in enumerate(tour)}
+        active = {tour[(pos[city] + k) % len(tour)] for city in dirty for k in (-1, 0, 1)}
+        return local_search.improve(tour, active=sorted(active))
+    return tour, dist_matrix.tour_length(tour)
+
+# ==============
+# FR: Répare chaque individu d'une population GA (insertion au moindre coût, sans recherche locale).
+#
+# EN: Repairs every individual of a GA population (cheapest insertion, no local search).
+# =========
+def remap_population(population, mapping, dirty, dist_matrix):
+    return [repair_tour(indiv, mapping, dirty, dist_matrix)[0] for indiv in population]
+
+# ==============
+# FR: Recopie les lignes et colonnes de phéromones des villes conservées; les villes réinsérées repartent du niveau moyen.
+#
+# EN: Copies the pheromone rows and columns of the kept cities; reinserted cities restart from the mean level.
+# =========
+def remap_pheromones(matrix, mapping, dirty, n, fill=None):
+    matrix = np.asarray(matrix)
+    dirty_set = set(dirty)
+    old_idx = [i for i, j in enumerate(mapping) if j is not None and j not in dirty_set]
+    new_idx = [mapping[i] for i in old_idx]
+    remapped = np.full((n, n), float(matrix.mean()) if fill is None else fill, dtype=np.float64)
+    remapped[np.ix_(new_idx, new_idx)] = matrix[np.ix_(old_idx, old_idx)]
+    return remapped
+
+# ==============
+# FR: État réutilisable d'un solveur après exécution: meilleur tour, population GA et phéromones ACO (None si absents).
+#
+# EN: Reusable state of a solver after a run: best tour, GA population and ACO pheromones (None when absent).
+# =========
+def solver_state(solver, tour):
+    population = getattr(getattr(solver, "ga", solver), "population", None)
+    pheromones = getattr(getattr(solver, "aco", solver), "pheromones", None)
+    return {
+        "tour": list(tour) if tour is not None else None,
+        "population": [list(map(int, indiv)) for indiv in population] if population is not None else None,
+        "pheromones": np.array(pheromones) if pheromones is not None else None,
+    }
+
+# ==============
+# FR: Paramètres de reprise à chaud: population GA et phéromones ACO de l'état remappées vers les nouvelles villes,
+# le tour réparé en tête de population.
+#
+# EN: Warm-start parameters: the state's GA population and ACO pheromones remapped to the new cities, with the
+# repaired tour at the head of the population.
+# =========
+def warm_params(algo_name, params, state, mapping, dirty, dist_matrix, tour=None):
+    params = dict(params)
+    population = None
+    if state.get("population") is not None:
+        population = remap_population(state["population"], mapping, dirty, dist_matrix)
+        if tour is not None:
+            population[0] = list(tour)
+    pheromones = None
+    if state.get("pheromones") is not None:
+        pheromones = remap_pheromones(state["pheromones"], mapping, dirty, dist_matrix.n)
+    if algo_name == "Hybride":
+        if population is not None:
+            params["ga_params"] = dict(params.get("ga_params") or {}, initial_population=population)
+        if pheromones is not None:
+            params["aco_params"] = dict(params.get("aco_params") or {}, initial_pheromones=pheromones)
+    elif algo_name == "ACO":
+        if pheromones is not None:
+            params["initial_pheromones"] = pheromones
+        elif tour is not None:
+            params["initial_path"] = list(tour)
+    elif population is not None:
+        params["initial_population"] = population
+    return params
@@ -0,0 +1,244 @@
+import multiprocessing
+import os
+import queue
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from .ga import GeneticAlgorithm
+from .aco import AntColony
+from .HybridTSP import HybridTSP
+from .cluster import ClusterTSP
+from .distance_matrix import CoordinateDistance, DistanceMatrix
+from .local_search import LocalSearch
+from .reoptimize import repair_tour, solver_state, warm_params
+
+SOLVERS = {"GA": GeneticAlgorithm, "ACO": AntColony, "Hybride": HybridTSP, "Cluster": ClusterTSP}
+
+_worker_matrix = None
+
+class QueueLogger:
+    def __init__(self, progress_queue, job_id):
+        self.queue = progress_queue
+        self.job_id = job_id
+
+    # ==============
+    # FR: Transmet une entrée de statistique au processus principal et retourne le temps passé à journaliser.
+    #
+    # EN: Forwards a statistics entry to the main process and returns the time spent logging.
+    # =========
+    def log(self, algo_name, distance=None, timestamp=None, **kwargs):
+        start = time.perf_counter()
+        self.queue.put(("log", self.job_id, (algo_name, distance, timestamp, kwargs)))
+        return time.perf_counter() - start
+
+# ==============
+# FR: Retourne la matrice des distances du processus de travail, recalculée seulement si les villes ont changé.
+#
+# EN: Returns the worker process' distance matrix, recomputed only when the cities changed.
+# =========
+def _distance_matrix(cities):
+    global _worker_matrix
+    if _worker_matrix is None or not _worker_matrix.matches(cities):
+        _worker_matrix = DistanceMatrix(cities)
+    return _worker_matrix
+
+# ==============
+# FR: Exécute une tâche dans un processus de travail: journal et meilleurs chemins envoyés dans la file de progression.
+#
+# EN: Runs a job in a worker process: logs and best paths are sent through the progress queue.
+# =========
+def _run_job(target, job_id, progress_queue, cancel, args):
+    if cancel.is_set():
+        return None
+    best = [float('inf')]
+
+    def progress(algo_name, step, best_path, best_distance):
+        if best_distance < best[0]:
+            best[0] = best_distance
+            progress_queue.put(("progress", job_id, (algo_name, step, best_path, best_distance)))
+
+    return target(*args, logger=QueueLogger(progress_queue, job_id), progress=progress, cancel=cancel)
+
+# ==============
+# FR: Tâche: exécute entièrement un algorithme (GA, ACO ou Hybride) et retourne (chemin, distance, état réutilisable).
+#
+# EN: Job: fully runs an algorithm (GA, ACO or Hybrid) and returns (path, distance, reusable state).
+# =========
+def solve(algo_name, cities, params, logger=None, progress=None, cancel=None):
+    # FR: La décomposition en groupes calcule ses distances depuis les coordonnées (pas de matrice n x n).
+    # EN: The cluster decomposition computes its distances from the coordinates (no n x n matrix).
+    dist_matrix = None if algo_name == "Cluster" else _distance_matrix(cities)
+    solver = SOLVERS[algo_name](cities, logger=logger, dist_matrix=dist_matrix,
+                                progress=progress, cancel=cancel, **params)
+    path, distance = solver.run()
+    return path, distance, solver_state(solver, path)
+
+# ==============
+# FR: Tâche: reprise à chaud après une modification des villes. Le tour précédent est réparé (insertion au moindre
+# coût et recherche locale), la population et les phéromones sont remappées, puis l'algorithme repart de cet état.
+# Retourne (chemin, distance, état) comme solve.
+#
+# EN: Job: warm restart after the cities changed. The previous tour is repaired (cheapest insertion and local
+# search), the population and pheromones are remapped, then the algorithm resumes from that state.
+# Returns (path, distance, state) like solve.
+# =========
+def reoptimize(algo_name, cities, params, state, mapping, dirty, logger=None, progress=None, cancel=None):
+    dist_matrix = CoordinateDistance(cities) if algo_name == "Cluster" else _distance_matrix(cities)
+    tour, length = repair_tour(state["tour"], mapping, dirty, dist_matrix, LocalSearch(dist_matrix))
+    if progress:
+        progress(algo_name, 0, tour, length)
+    solver = SOLVERS[algo_name](cities, logger=logger, dist_matrix=dist_matrix, progress=progress, cancel=cancel,
+                                **warm_params(algo_name, params, state, mapping, dirty, dist_matrix, tour))
+    path, distance = solver.run()
+    if path is None or length < distance:
+        path, distance = tour, length
+    return path, distance, solver_state(solver, path)
+
+# ==============
+# FR: GA pas à pas de l'interface: l'algorithme et son générateur vivent toute l'exécution (cache des distances et
+# matrice conservés d'un pas à l'autre), à faire avancer dans un thread (submit(..., thread=True)).
+#
+# EN: The GUI's step-by-step GA: the algorithm and its generator live for the whole run (distance cache and matrix
+# kept from one step to the next), to be advanced in a thread (submit(..., thread=True)).
+# =========
+class GAStepper:
+    def __init__(self, cities, params, population=None, start=0, max_gen=50, dist_matrix=None):
+        self.ga = GeneticAlgorithm(cities, max_gen=max(0, max_gen - start), dist_matrix=dist_matrix, **params)
+        self.steps = self.ga.run_step_by_step(population, start=start)
+
+    # ==============
+    # FR: Tâche: calcule la génération suivante et retourne (résultat, population), le résultat valant None une fois
+    # les générations épuisées ou la tâche annulée.
+    #
+    # EN: Job: computes the next generation and returns (result, population), the result being None once the
+    # generations are exhausted or the job is cancelled.
+    # =========
+    def step(self, logger=None, progress=None, cancel=None):
+        ga = self.ga
+        ga.logger, ga.progress, ga.cancel = logger, progress, cancel
+        result = next(self.steps, None)
+        population = [list(map(int, indiv)) for indiv in ga.population] if ga.population is not None else None
+        return result, population
+
+class SolverRunner:
+    def __init__(self, logger=None, workers=None):
+        self.logger = logger
+        self.workers = workers or max(1, min(2, os.cpu_count() or 1))
+        self.executor = None
+        self.threads = None
+        self.manager = None
+        self.queue = None
+        self.jobs = {}
+        self.next_id = 0
+
+    # ==============
+    # FR: Démarre à la demande le pool de processus et le gestionnaire de la file partagée ("spawn": sûr avec Tk).
+    #
+    # EN: Starts the process pool and the shared queue manager on demand ("spawn": safe alongside Tk).
+    # =========
+    def _start(self):
+        if self.executor is None:
+            context = multiprocessing.get_context("spawn")
+            self.manager = context.Manager()
+            self.queue = self.manager.Queue()
+            self.executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=context)
+            self.threads = ThreadPoolExecutor(max_workers=1, thread_name_prefix="SolverRunner")
+
+    # ==============
+    # FR: Soumet une tâche (fonction de module) au pool; retourne son identifiant, utilisable pour l'annuler. Avec
+    # thread, la tâche (par exemple une méthode d'un objet qui doit survivre entre les tâches) s'exécute dans le thread
+    # du runner, ses messages passant par la même file.
+    #
+    # EN: Submits a job (module-level function) to the pool; returns its id, usable to cancel it. With thread, the job
+    # (for example a method of an object that must outlive the jobs) runs in the runner's thread, its messages going
+    # through the same queue.
+    # =========
+    def submit(self, target, *args, on_progress=None, on_done=None, thread=False):
+        self._start()
+        job_id = self.next_id
+        self.next_id += 1
+        if thread:
+            cancel = threading.Event()
+            future = self.threads.submit(_run_job, target, job_id, self.queue, cancel, args)
+        else:
+            cancel = self.manager.Event()
+            future = self.executor.submit(_run_job, target, job_id, self.queue, cancel, args)
+        self.jobs[job_id] = {"future": future, "cancel": cancel, "on_progress": on_progress, "on_done": on_done}
+        return job_id
+
+    # ==============
+    # FR: Demande l'arrêt d'une tâche (ou de toutes si job_id vaut None); elle s'arrête à la prochaine génération.
+    #
+    # EN: Requests a job to stop (or every job when job_id is None); it stops at the next generation.
+    # =========
+    def cancel(self, job_id=None):
+        for key in list(self.jobs) if job_id is None else [job_id]:
+            job = self.jobs.get(key)
+            if job:
+                job["cancel"].set()
+                job["future"].cancel()
+
+    # ==============
+    # FR: Indique si une tâche est encore en cours.
+    #
+    # EN: Tells whether a job is still running.
+    # =========
+    def is_running(self, job_id):
+        return job_id in self.jobs
+
+    # ==============
+    # FR: À appeler depuis la boucle Tk: relaie journal et progression, puis signale les tâches terminées. Une tâche
+    # terminée a déjà mis tous ses messages dans la file: celle-ci est vidée au moins jusqu'à eux avant son on_done.
+    #
+    # EN: To be called from the Tk loop: relays logs and progress, then reports finished jobs. A finished job has
+    # already put all its messages in the queue: it is drained at least up to them before its on_done.
+    # =========
+    def poll(self, max_items=500):
+        if self.queue is None:
+            return
+        finished = [job_id for job_id, job in self.jobs.items() if job["future"].done()]
+        self._drain(max(max_items, self.queue.qsize()) if finished else max_items)
+        for job_id in finished:
+            job = self.jobs.pop(job_id)
+            future = job["future"]
+            result = None
+            if not future.cancelled():
+                try:
+                    result = future.result()
+                except Exception as e:
+                    print(f"Erreur lors de l'exécution de la tâche {job_id}: {e}")
+            if job["on_done"]:
+                job["on_done"](result)
+
+    # ==============
+    # FR: Relaie au plus max_items messages de la file (journal vers le logger, progression vers on_progress).
+    #
+    # EN: Relays at most max_items messages from the queue (logs to the logger, progress to on_progress).
+    # =========
+    def _drain(self, max_items):
+        for _ in range(max_items):
+            try:
+                kind, job_id, payload = self.queue.get_nowait()
+            except queue.Empty:
+                return
+            job = self.jobs.get(job_id)
+            if kind == "log":
+                algo_name, distance, timestamp, extra = payload
+                if self.logger:
+                    self.logger.log(algo_name, distance, timestamp, **extra)
+            elif job and job["on_progress"] and not job["cancel"].is_set():
+                job["on_progress"](*payload)
+
+    # ==============
+    # FR: Annule les tâches en cours et arrête le pool de processus.
+    #
+    # EN: Cancels the running jobs and shuts the process pool down.
+    # =========
+    def shutdown(self):
+        self.cancel()
+        if self.executor is not None:
+            self.executor.shutdown(wait=True, cancel_futures=True)
+            self.threads.shutdown(wait=True, cancel_futures=True)
+            self.manager.shutdown()
+            self.executor = self.threads = self.manager = self.queue = None
+        self.jobs.clear()
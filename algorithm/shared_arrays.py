@@ -0,0 +1,57 @@
+from multiprocessing import shared_memory, util
+import numpy as np
+
+_attached = {}
+
+class SharedArray:
+    def __init__(self, array):
+        array = np.ascontiguousarray(array)
+        self.shm = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+        self.array = np.ndarray(array.shape, dtype=array.dtype, buffer=self.shm.buf)
+        self.array[...] = array
+        self.spec = (self.shm.name, array.shape, array.dtype.str)
+
+    # ==============
+    # FR: Libère et supprime le segment de mémoire partagée (côté processus créateur).
+    #
+    # EN: Releases and unlinks the shared memory segment (creating process side).
+    # =========
+    def close(self):
+        self.array = None
+        self.shm.close()
+        self.shm.unlink()
+
+# ==============
+# FR: Ouvre (une seule fois par processus) un tableau partagé à partir de sa description picklable.
+#
+# EN: Opens (once per process) a shared array from its picklable description.
+# =========
+def attach(spec):
+    name, shape, dtype = spec
+    if name not in _attached:
+        shm = shared_memory.SharedMemory(name=name)
+        _attached[name] = (shm, np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf))
+    return _attached[name][1]
+
+# ==============
+# FR: Ferme les segments ouverts par attach (tous, ou ceux nommés); les tableaux obtenus ne doivent plus être utilisés.
+#
+# EN: Closes the segments opened by attach (all of them, or the named ones); the arrays obtained must no longer be used.
+# =========
+def detach(names=None):
+    for name in list(_attached) if names is None else names:
+        entry = _attached.pop(name, None)
+        if entry is not None:
+            entry[0].close()
+
+# ==============
+# FR: Processus de travail: à sa sortie, release libère les objets qui utilisent les tableaux partagés, puis tout est détaché.
+#
+# EN: Worker process: at exit, release drops the objects using the shared arrays, then everything is detached.
+# =========
+def detach_at_exit(release):
+    util.Finalize(None, _release_and_detach, args=(release,), exitpriority=0)
+
+def _release_and_detach(release):
+    release()
+    detach()
@@ -0,0 +1,201 @@
+import math
+
+class SpatialGrid:
+    def __init__(self, points, cell_size=None, points_per_cell=2):
+        self.points = points
+        self.n = len(points)
+        if self.n:
+            xs = [p[0] for p in points]
+            ys = [p[1] for p in points]
+            self.min_x, self.min_y = min(xs), min(ys)
+            width, height = max(xs) - self.min_x, max(ys) - self.min_y
+        else:
+            self.min_x = self.min_y = 0
+            width = height = 0
+        if cell_size is None:
+            area = max(width, 1) * max(height, 1)
+            cell_size = math.sqrt(area * points_per_cell / max(self.n, 1))
+        self.cell_size = max(cell_size, 1e-9)
+        self.cols = int(width // self.cell_size) + 1
+        self.rows = int(height // self.cell_size) + 1
+        self.cells = {}
+        for i, (x, y) in enumerate(points):
+            self.cells.setdefault(self._cell(x, y), []).append(i)
+
+    # ==============
+    # FR: Retourne les coordonnées de la cellule qui contient un point.
+    #
+    # EN: Returns the coordinates of the cell containing a point.
+    # =========
+    def _cell(self, x, y):
+        return int((x - self.min_x) // self.cell_size), int((y - self.min_y) // self.cell_size)
+
+    # ==============
+    # FR: Parcourt les indices des points situés dans l'anneau de cellules à distance r de (cx, cy).
+    #
+    # EN: Yields the indices of the points lying in the ring of cells at distance r from (cx, cy).
+    # =========
+    def _ring(self, cx, cy, r):
+        if r == 0:
+            yield from self.cells.get((cx, cy), ())
+            return
+        for dx in range(-r, r + 1):
+            yield from self.cells.get((cx + dx, cy - r), ())
+            yield from self.cells.get((cx + dx, cy + r), ())
+        for dy in range(-r + 1, r):
+            yield from self.cells.get((cx - r, cy + dy), ())
+            yield from self.cells.get((cx + r, cy + dy), ())
+
+    # ==============
+    # FR: Retourne les k points les plus proches de (x, y), triés par distance, en excluant éventuellement un indice.
+    #
+    # EN: Returns the k points closest to (x, y), sorted by distance, optionally excluding one index.
+    # =========
+    def k_nearest(self, x, y, k, exclude=None):
+        cx, cy = self._cell(x, y)
+        max_r = max(self.cols, self.rows) + abs(cx) + abs(cy)
+        found = []
+        r = 0
+        while r <= max_r:
+            for i in self._ring(cx, cy, r):
+                if i != exclude:
+                    px, py = self.points[i]
+                    found.append(((px - x) ** 2 + (py - y) ** 2, i))
+            if len(found) >= k:
+                found.sort()
+                # FR: Les cellules non visitées sont au moins à r * cell_size du point.
+                # EN: Unvisited cells are at least r * cell_size away from the point.
+                if found[k - 1][0] <= (r * self.cell_size) ** 2:
+                    break
+            r += 1
+        found.sort()
+        return [i for _, i in found[:k]]
+
+    # ==============
+    # FR: Retire un point de la grille (il ne sera plus retourné par les recherches).
+    #
+    # EN: Removes a point from the grid (searches will no longer return it).
+    # =========
+    def remove(self, i):
+        cell = self._cell(*self.points[i])
+        members = self.cells[cell]
+        members.remove(i)
+        if not members:
+            del self.cells[cell]
+
+    # ==============
+    # FR: Retourne le point le plus proche de (x, y) dans un rayon donné, ou None.
+    #
+    # EN: Returns the closest point to (x, y) within a given radius, or None.
+    # =========
+    def nearest_within(self, x, y, radius):
+        cx, cy = self._cell(x, y)
+        best, best_d2 = None, radius ** 2
+        for r in range(int(math.ceil(radius / self.cell_size)) + 1):
+            for i in self._ring(cx, cy, r):
+                px, py = self.points[i]
+                d2 = (px - x) ** 2 + (py - y) ** 2
+                if d2 <= best_d2:
+                    best, best_d2 = i, d2
+        return best
+
+# ==============
+# FR: Construit pour chaque ville la liste de ses k plus proches voisines via une grille uniforme.
+#
+# EN: Builds, for every city, the list of its k nearest neighbours using a uniform grid.
+# =========
+def build_neighbour_lists(cities, k):
+    k = min(k, len(cities) - 1)
+    if k <= 0:
+        return [[] for _ in cities]
+    grid = SpatialGrid(cities)
+    return [grid.k_nearest(x, y, k, exclude=i) for i, (x, y) in enumerate(cities)]
+
+class SegmentGrid:
+    def __init__(self, grid):
+        self.grid = grid
+        self.points = grid.points
+        self.segments = []
+        self.cells = {}
+
+    # ==============
+    # FR: Ajoute un segment entre deux points, enregistré dans chaque cellule traversée (parcours DDA).
+    #
+    # EN: Adds a segment between two points, recorded in every cell it crosses (DDA traversal).
+    # =========
+    def add(self, a, b):
+        index = len(self.segments)
+        self.segments.append((a, b))
+        for cell in self._cells_on_segment(self.points[a], self.points[b]):
+            self.cells.setdefault(cell, []).append(index)
+
+    # ==============
+    # FR: Retourne les cellules traversées par le segment p-q, de p vers q.
+    #
+    # EN: Returns the cells crossed by segment p-q, from p to q.
+    # =========
+    def _cells_on_segment(self, p, q):
+        grid = self.grid
+        (x1, y1), (x2, y2) = p, q
+        cx, cy = grid._cell(x1, y1)
+        ex, ey = grid._cell(x2, y2)
+        dx, dy = x2 - x1, y2 - y1
+        step_x = 1 if dx > 0 else -1
+        step_y = 1 if dy > 0 else -1
+        if dx:
+            t_max_x = (grid.min_x + (cx + (step_x > 0)) * grid.cell_size - x1) / dx
+            t_delta_x = grid.cell_size / abs(dx)
+        else:
+            t_max_x = t_delta_x = float('inf')
+        if dy:
+            t_max_y = (grid.min_y + (cy + (step_y > 0)) * grid.cell_size - y1) / dy
+            t_delta_y = grid.cell_size / abs(dy)
+        else:
+            t_max_y = t_delta_y = float('inf')
+        cells = [(cx, cy)]
+        for _ in range(abs(ex - cx) + abs(ey - cy)):
+            if t_max_x < t_max_y:
+                cx += step_x
+                t_max_x += t_delta_x
+            else:
+                cy += step_y
+                t_max_y += t_delta_y
+            cells.append((cx, cy))
+        if cells[-1] != (ex, ey):
+            cells.append((ex, ey))
+        return cells
+
+    # ==============
+    # FR: Retourne le segment (a, b) le plus proche de (x, y) dans un rayon donné, ou None.
+    #
+    # EN: Returns the segment (a, b) closest to (x, y) within a given radius, or None.
+    # =========
+    def nearest_within(self, x, y, radius):
+        cx, cy = self.grid._cell(x, y)
+        reach = int(math.ceil(radius / self.grid.cell_size))
+        best, best_d2 = None, radius ** 2
+        seen = set()
+        for gx in range(cx - reach, cx + reach + 1):
+            for gy in range(cy - reach, cy + reach + 1):
+                for index in self.cells.get((gx, gy), ()):
+                    if index in seen:
+                        continue
+                    seen.add(index)
+                    a, b = self.segments[index]
+                    d2 = _point_segment_d2(x, y, self.points[a], self.points[b])
+                    if d2 <= best_d2:
+                        best, best_d2 = self.segments[index], d2
+        return best
+
+# ==============
+# FR: Carré de la distance entre un point et un segment.
+#
+# EN: Squared distance between a point and a segment.
+# =========
+def _point_segment_d2(x, y, p, q):
+    (x1, y1), (x2, y2) = p, q
+    dx, dy = x2 - x1, y2 - y1
+    length2 = dx * dx + dy * dy
+    t = 0.0 if not length2 else max(0.0, min(1.0, ((x - x1) * dx + (y - y1) * dy) / length2))
+    px, py = x1 + t * dx - x, y1 + t * dy - y
+    return px * px + py * py
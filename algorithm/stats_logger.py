@@ -1,40 +1,207 @@
+import atexit
 import json
 import os
+import queue
+import threading
+import time
+from collections import deque
+from .stats_store import StatsSeries
+
+_STOP = object()
 
 class StatsLogger:
-    def __init__(self, file_path="stats.json"):
+    def __init__(self, file_path="stats.jsonl", flush_every=200, flush_interval=2.0, asynchronous=False, queue_size=10000, max_records=100000):
         self.file_path = file_path
+        self.max_records = max_records
+        self.append_only = not file_path.endswith(".json")
+        if asynchronous and not self.append_only:
+            raise ValueError(f"Le mode asynchrone nécessite un journal JSON Lines (.jsonl), pas {file_path}")
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        self.buffer = []
+        self.last_flush = time.monotonic()
+        self.needs_newline = False
+        self.lock = threading.Lock()
+        self.extras = {}
+        self.run_id = 0
+        self._migrate_legacy()
         self.data = self._load_stats()
+        self.asynchronous = asynchronous
+        self.closed = False
+        self.writer = None
+        if self.asynchronous:
+            self.queue = queue.Queue(maxsize=queue_size)
+            self.writer = threading.Thread(target=self._writer_loop, name="StatsLoggerWriter", daemon=True)
+            self.writer.start()
+        atexit.register(self.close)
+
+    # ==============
+    # FR: Retourne une structure de statistiques vide (une série en colonnes par algorithme).
+    #
+    # EN: Returns an empty statistics structure (one columnar series per algorithm).
+    # =========
+    def _empty_stats(self):
+        return {name: StatsSeries(self.max_records) for name in ("GA", "ACO", "Hybride", "Cluster")}
 
     # ==============
-    # FR: Charge les statistiques depuis un fichier JSON existant si disponible.
+    # FR: Charge les statistiques existantes: fichier JSON complet, ou journal JSON Lines rejoué ligne par ligne.
     #
-    # EN: Loads statistics from an existing JSON file if available.
+    # EN: Loads existing statistics: a whole JSON file, or a JSON Lines log replayed line by line.
     # =========
     def _load_stats(self):
+        self.data = self._empty_stats()
+        self.extras = {}
+        self.run_id = 0
         if os.path.exists(self.file_path):
             try:
                 with open(self.file_path, "r") as f:
-                    return json.load(f)
+                    if not self.append_only:
+                        self._load_legacy(json.load(f))
+                        return self.data
+                    text = f.read()
+                    self.needs_newline = bool(text) and not text.endswith("\n")
+                    for line in text.splitlines():
+                        try:
+                            self._apply(json.loads(line))
+                        except ValueError:
+                            # FR: Dernière ligne tronquée par un arrêt brutal: on l'ignore.
+                            # EN: Last line truncated by an abrupt stop: skip it.
+                            continue
             except Exception as e:
                 print(f"Erreur lors du chargement des stats: {e}")
-        return {
-            "GA": {"distances": [], "times": [], "extra": []},
-            "ACO": {"distances": [], "times": [], "extra": []},
-            "Hybride": {"distances": [], "times": [], "extra": []},
-        }
+                self.data = self._empty_stats()
+                self.extras = {}
+                self.run_id = 0
+        return self.data
 
     # ==============
-    # FR: Sauvegarde les statistiques actuelles dans un fichier JSON.
+    # FR: Convertit en journal JSON Lines un fichier JSON historique du même nom (conservé).
     #
-    # EN: Saves the current statistics into a JSON file.
+    # EN: Converts a legacy JSON file of the same name into the JSON Lines log (the old file is kept).
     # =========
-    def _save_stats(self):
+    def _migrate_legacy(self):
+        legacy_path = os.path.splitext(self.file_path)[0] + ".json"
+        if not self.append_only or os.path.exists(self.file_path) or not os.path.exists(legacy_path):
+            return
         try:
+            with open(legacy_path, "r") as f:
+                content = json.load(f)
             with open(self.file_path, "w") as f:
-                json.dump(self.data, f)
+                for algo_name, stats in content.items():
+                    columns = [stats.get(key, []) for key in ("distances", "times", "log_times", "run_ids", "extra")]
+                    for i in range(max(len(columns[0]), len(columns[1]))):
+                        distance, timestamp, log_time, run_id, extra = (
+                            column[i] if i < len(column) else None for column in columns
+                        )
+                        record = {"algo": algo_name, "distance": distance, "time": timestamp, "run": run_id,
+                                  "extra": extra or {}, "log_time": log_time}
+                        f.write(json.dumps(record) + "\n")
+            print(f"Statistiques converties de {legacy_path} vers {self.file_path} (ancien fichier conservé).")
+        except Exception as e:
+            print(f"Erreur lors de la conversion des stats: {e}")
+
+    # ==============
+    # FR: Reconstruit les séries depuis le format JSON historique (listes par algorithme).
+    #
+    # EN: Rebuilds the series from the legacy JSON format (lists per algorithm).
+    # =========
+    def _load_legacy(self, content):
+        for algo_name, stats in content.items():
+            distances = stats.get("distances", [])
+            times = stats.get("times", [])
+            steps = stats.get("steps") or [
+                extra.get("generation", extra.get("iteration")) for extra in stats.get("extra", [])
+            ]
+            log_times = stats.get("log_times", [])
+            run_ids = stats.get("run_ids", [])
+            extras = stats.get("extra", [])
+            series = self.data.setdefault(algo_name, StatsSeries(self.max_records))
+            for i in range(max(len(distances), len(times))):
+                series.append(
+                    distances[i] if i < len(distances) else None,
+                    times[i] if i < len(times) else None,
+                    steps[i] if i < len(steps) else None,
+                    log_times[i] if i < len(log_times) else None,
+                    self._seen_run(run_ids[i] if i < len(run_ids) else None),
+                )
+                self._keep_extra(algo_name, extras[i] if i < len(extras) else {})
+
+    # ==============
+    # FR: Sauvegarde les statistiques: réécriture complète en JSON, ou ajout des enregistrements en attente en JSON Lines.
+    #
+    # EN: Saves the statistics: full JSON rewrite, or append of the pending records as JSON Lines.
+    # =========
+    def _save_stats(self):
+        with self.lock:
+            self._write_stats()
+
+    # ==============
+    # FR: Écrit les statistiques sur le disque (verrou déjà pris).
+    #
+    # EN: Writes the statistics to disk (lock already held).
+    # =========
+    def _write_stats(self):
+        try:
+            if not self.append_only:
+                with open(self.file_path, "w") as f:
+                    json.dump({
+                        name: dict(series.to_dict(), extra=list(self.extras.get(name, ())))
+                        for name, series in self.data.items()
+                    }, f)
+            elif self.buffer:
+                with open(self.file_path, "a") as f:
+                    if self.needs_newline:
+                        f.write("\n")
+                        self.needs_newline = False
+                    f.write("".join(json.dumps(record) + "\n" for record in self.buffer))
         except Exception as e:
             print(f"Erreur lors de la sauvegarde des stats: {e}")
+        self.buffer.clear()
+        self.last_flush = time.monotonic()
+
+    # ==============
+    # FR: Applique un enregistrement aux séries en mémoire.
+    #
+    # EN: Applies one record to the in-memory series.
+    # =========
+    def _apply(self, record):
+        series = self.data.get(record["algo"])
+        if series is None:
+            series = self.data[record["algo"]] = StatsSeries(self.max_records)
+        extra = record.get("extra") or {}
+        series.append(record.get("distance"), record.get("time"),
+                      extra.get("generation", extra.get("iteration")), record.get("log_time"),
+                      self._seen_run(record.get("run")), extra.get("log_overhead"))
+        self._keep_extra(record["algo"], extra)
+        return series
+
+    # ==============
+    # FR: Retourne le numéro d'exécution d'un enregistrement et garde le plus grand vu.
+    #
+    # EN: Returns a record's run number and keeps the largest one seen.
+    # =========
+    def _seen_run(self, run_id):
+        if run_id is not None and run_id > self.run_id:
+            self.run_id = run_id
+        return run_id
+
+    # ==============
+    # FR: Démarre une nouvelle exécution: les enregistrements suivants portent ce numéro.
+    #
+    # EN: Starts a new run: the following records carry this number.
+    # =========
+    def new_run(self):
+        self.run_id += 1
+        return self.run_id
+
+    # ==============
+    # FR: Format JSON historique uniquement: garde les extras de chaque ligne conservée.
+    #
+    # EN: Legacy JSON format only: keeps the extras of each retained row.
+    # =========
+    def _keep_extra(self, algo_name, extra):
+        if not self.append_only:
+            self.extras.setdefault(algo_name, deque(maxlen=self.max_records)).append(extra)
 
     # ==============
     # FR: Réinitialise toutes les statistiques enregistrées.
@@ -42,36 +209,161 @@ class StatsLogger:
     # EN: Resets all recorded statistics.
     # =========
     def reset(self):
-        self.data = {
-            "GA": {"distances": [], "times": [], "extra": []},
-            "ACO": {"distances": [], "times": [], "extra": []},
-            "Hybride": {"distances": [], "times": [], "extra": []},
-        }
-        self._save_stats()
+        self.flush()
+        self.data = self._empty_stats()
+        self.extras = {}
+        self.run_id = 0
+        if not self.append_only:
+            self._save_stats()
+            return
+        with self.lock:
+            self.buffer.clear()
+            self.needs_newline = False
+            try:
+                open(self.file_path, "w").close()
+            except Exception as e:
+                print(f"Erreur lors de la sauvegarde des stats: {e}")
 
     # ==============
-    # FR: Ajoute une nouvelle entrée de statistique pour un algorithme donné.
+    # FR: Ajoute une entrée de statistique et retourne le temps passé à journaliser.
     #
-    # EN: Logs a new statistics entry for a given algorithm.
+    # EN: Logs a statistics entry and returns the time spent logging.
     # =========
     def log(self, algo_name, distance=None, timestamp=None, **kwargs):
-        if algo_name not in self.data:
-            self.data[algo_name] = {"distances": [], "times": [], "extra": []}
-        if distance is not None:
-            self.data[algo_name]["distances"].append(distance)
-        if timestamp is not None:
-            self.data[algo_name]["times"].append(timestamp)
-        if kwargs:
-            self.data[algo_name]["extra"].append(kwargs)
-        self._save_stats()
+        start = time.perf_counter()
+        threaded = self.asynchronous and self.writer.is_alive()
+        if not threaded and self._flush_due():
+            self._flush_buffer()
+        record = {"algo": algo_name, "distance": distance, "time": timestamp, "run": self.run_id, "extra": kwargs}
+        series = self._apply(record)
+        record["log_time"] = time.perf_counter() - start
+        series.set_last("log_time", record["log_time"])
+        if threaded:
+            self.queue.put(record)
+        else:
+            self.buffer.append(record)
+            if self.closed:
+                self._flush_buffer()
+        return time.perf_counter() - start
+
+    # ==============
+    # FR: Indique si le tampon doit être écrit (nombre d'enregistrements ou délai atteint).
+    #
+    # EN: Tells whether the buffer is due to be written (record count or delay reached).
+    # =========
+    def _flush_due(self):
+        return len(self.buffer) >= self.flush_every or time.monotonic() - self.last_flush >= self.flush_interval
+
+    # ==============
+    # FR: Boucle du thread d'écriture: regroupe les enregistrements de la file et les écrit par lots.
+    #
+    # EN: Writer thread loop: groups the queued records and writes them in batches.
+    # =========
+    def _writer_loop(self):
+        while True:
+            try:
+                item = self.queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                self._flush_buffer()
+                continue
+            if item is _STOP:
+                self._flush_buffer()
+                return
+            if isinstance(item, threading.Event):
+                self._flush_buffer()
+                item.set()
+                continue
+            self.buffer.append(item)
+            if self._flush_due():
+                self._flush_buffer()
+
+    # ==============
+    # FR: Écrit le tampon s'il contient des enregistrements.
+    #
+    # EN: Writes the buffer if it holds any records.
+    # =========
+    def _flush_buffer(self):
+        if self.buffer:
+            self._save_stats()
+
+    # ==============
+    # FR: Écrit immédiatement les enregistrements en attente.
+    #
+    # EN: Writes the pending records immediately.
+    # =========
+    def flush(self):
+        if self.writer is not None and self.writer.is_alive():
+            done = threading.Event()
+            self.queue.put(done)
+            done.wait()
+        else:
+            self._drain_queue()
+            self._flush_buffer()
 
     # ==============
-    # FR: Retourne les statistiques d'un algorithme spécifique.
+    # FR: Reprend dans le tampon les enregistrements restés dans la file.
     #
-    # EN: Returns statistics for a specific algorithm.
+    # EN: Moves the records left in the queue into the buffer.
+    # =========
+    def _drain_queue(self):
+        if self.writer is None:
+            return
+        while True:
+            try:
+                item = self.queue.get_nowait()
+            except queue.Empty:
+                return
+            if isinstance(item, threading.Event):
+                item.set()
+            elif item is not _STOP:
+                self.buffer.append(item)
+
+    # ==============
+    # FR: Vide la file et le tampon puis arrête le thread d'écriture (aussi appelé à la sortie).
+    #
+    # EN: Drains the queue and the buffer, then stops the writer thread (also called at exit).
+    # =========
+    def close(self):
+        self.closed = True
+        atexit.unregister(self.close)
+        if self.writer is not None and self.writer.is_alive():
+            self.queue.put(_STOP)
+            self.writer.join()
+        self.flush()
+
+    # ==============
+    # FR: Retourne la série en colonnes d'un algorithme (None si inconnu).
+    #
+    # EN: Returns the columnar series of an algorithm (None if unknown).
+    # =========
+    def series(self, algo_name):
+        return self.data.get(algo_name)
+
+    # ==============
+    # FR: Retourne toutes les séries en colonnes, par algorithme.
+    #
+    # EN: Returns every columnar series, by algorithm.
+    # =========
+    def get_all_series(self):
+        return dict(self.data)
+
+    # ==============
+    # FR: Retourne les statistiques d'un algorithme spécifique, colonne par colonne (tableaux NumPy chronologiques).
+    #
+    # EN: Returns statistics for a specific algorithm, column by column (chronological NumPy arrays).
     # =========
     def get(self, algo_name):
-        return self.data.get(algo_name, {})
+        series = self.data.get(algo_name)
+        if series is None:
+            return {}
+        return {
+            "distances": series.column("distance"),
+            "times": series.column("time"),
+            "log_times": series.column("log_time"),
+            "log_overheads": series.column("log_overhead"),
+            "steps": series.column("step"),
+            "run_ids": series.column("run_id"),
+        }
 
     # ==============
     # FR: Retourne l'ensemble des statistiques enregistrées.
@@ -79,4 +371,4 @@ class StatsLogger:
     # EN: Returns all recorded statistics.
     # =========
     def get_all(self):
-        return self.data
+        return {name: self.get(name) for name in self.data}
@@ -0,0 +1,272 @@
+from collections import deque
+import numpy as np
+from .stats_store import DownsampledView
+
+class LiveStatsPlot:
+    COLORS = {"GA": "#f72585", "ACO": "#4cc9f0", "Hybride": "#3a0ca3", "Cluster": "#ffa600"}
+    TEXT_COLOR = "#abb2bf"
+    BACKGROUND = "#282c34"
+    BINS = 10
+
+    def __init__(self, figure, canvas, logger, max_points=300):
+        self.figure = figure
+        self.canvas = canvas
+        self.logger = logger
+        self.max_points = max_points
+        self.ax_dist = figure.add_subplot(131, facecolor=self.BACKGROUND)
+        self.ax_time = figure.add_subplot(132, facecolor=self.BACKGROUND)
+        self.ax_hist = figure.add_subplot(133, facecolor=self.BACKGROUND)
+        for ax in (self.ax_dist, self.ax_time, self.ax_hist):
+            ax.title.set_color(self.TEXT_COLOR)
+            ax.xaxis.label.set_color(self.TEXT_COLOR)
+            ax.yaxis.label.set_color(self.TEXT_COLOR)
+            ax.tick_params(axis='x', colors=self.TEXT_COLOR)
+            ax.tick_params(axis='y', colors=self.TEXT_COLOR)
+            for spine in ax.spines.values():
+                spine.set_color(self.TEXT_COLOR)
+        self.ax_dist.set_xlabel("Génération", color=self.TEXT_COLOR)
+        self.ax_dist.set_ylabel("Distance", color=self.TEXT_COLOR)
+        self.ax_time.set_xlabel("Génération", color=self.TEXT_COLOR)
+        self.ax_time.set_ylabel("Temps (s)", color=self.TEXT_COLOR)
+        self.ax_hist.set_title("Distribution des distances", color=self.TEXT_COLOR)
+        self.ax_hist.set_xlabel("Distance", color=self.TEXT_COLOR)
+        self.ax_hist.set_ylabel("Fréquence", color=self.TEXT_COLOR)
+
+        self.dist_mean, = self.ax_dist.plot([], [], marker="o", markersize=3, color="#f72585", animated=True)
+        self.dist_min, = self.ax_dist.plot([], [], color="#f72585", alpha=0.35, linewidth=1, animated=True)
+        self.dist_max, = self.ax_dist.plot([], [], color="#f72585", alpha=0.35, linewidth=1, animated=True)
+        self.time_line, = self.ax_time.plot([], [], marker="x", markersize=3, color="#4cc9f0", label="Calcul", animated=True)
+        self.log_line, = self.ax_time.plot([], [], color="#ffa600", label="Journalisation", animated=True)
+        self.overhead_line, = self.ax_time.plot([], [], color="#f72585", linestyle="--", label="Surcoût solveur",
+                                                animated=True)
+        self.ax_time.legend(facecolor=self.BACKGROUND, labelcolor=self.TEXT_COLOR)
+        self.empty_dist = self.ax_dist.text(0.5, 0.5, "Pas de données", transform=self.ax_dist.transAxes,
+                                            horizontalalignment='center', color=self.TEXT_COLOR)
+        self.empty_time = self.ax_time.text(0.5, 0.5, "Pas de données", transform=self.ax_time.transAxes,
+                                            horizontalalignment='center', color=self.TEXT_COLOR)
+        self.artists = {
+            self.ax_dist: [self.dist_mean, self.dist_min, self.dist_max],
+            self.ax_time: [self.time_line, self.log_line, self.overhead_line],
+            self.ax_hist: [],
+        }
+        self.histograms = {}
+        self.algo = None
+        self.series = None
+        self.views = {}
+        self.backgrounds = {}
+        self.canvas.mpl_connect("draw_event", self._on_draw)
+
+    # ==============
+    # FR: Après un rendu complet: mémorise le fond de chaque axe et dessine les artistes animés par-dessus.
+    #
+    # EN: After a full draw: caches each axis background and draws the animated artists on top.
+    # =========
+    def _on_draw(self, event):
+        self.backgrounds = {ax: self.canvas.copy_from_bbox(ax.bbox) for ax in self.artists}
+        for ax, artists in self.artists.items():
+            for artist in artists:
+                ax.draw_artist(artist)
+        self.canvas.blit(self.figure.bbox)
+
+    # ==============
+    # FR: Change l'algorithme affiché: titres mis à jour et vues repartant de zéro.
+    #
+    # EN: Switches the displayed algorithm: titles updated and views restarted.
+    # =========
+    def _select(self, algo, series):
+        self.algo = algo
+        self.series = series
+        self.views = {}
+        if series is not None:
+            self.views = {name: DownsampledView(series, name, self.max_points)
+                          for name in ("distance", "time", "log_time", "log_overhead")}
+        self.ax_dist.set_title(f"{algo} - Distance par génération", color=self.TEXT_COLOR)
+        self.ax_time.set_title(f"{algo} - Temps par génération", color=self.TEXT_COLOR)
+        for line in self.artists[self.ax_dist] + self.artists[self.ax_time]:
+            line.set_data([], [])
+
+    # ==============
+    # FR: Met à jour les graphiques avec les seules nouvelles données; redessine uniquement les axes modifiés (blitting).
+    #
+    # EN: Updates the charts with the new data only; redraws just the modified axes (blitting).
+    # =========
+    def refresh(self, algo):
+        full = False
+        series = self.logger.series(algo)
+        if algo != self.algo or series is not self.series:
+            self._select(algo, series)
+            full = True
+        changed = set()
+
+        if self.views and self.views["distance"].update():
+            x, mins, maxs, means = self.views["distance"].arrays()
+            self.dist_mean.set_data(x, means)
+            self.dist_min.set_data(x, mins)
+            self.dist_max.set_data(x, maxs)
+            full |= self._fit_limits(self.ax_dist, x, mins, maxs)
+            changed.add(self.ax_dist)
+        time_views = ("time", "log_time", "log_overhead")
+        if self.views and any([self.views[name].update() for name in time_views]):
+            xs, values = [], []
+            for name, line in zip(time_views, (self.time_line, self.log_line, self.overhead_line)):
+                x, _, _, means = self.views[name].arrays()
+                line.set_data(x, means)
+                xs.append(x)
+                values.append(means)
+            values = np.concatenate(values)
+            full |= self._fit_limits(self.ax_time, np.concatenate(xs), values, values)
+            changed.add(self.ax_time)
+
+        has_data = self.series is not None and len(self.series) > 0
+        if self.empty_dist.get_visible() == has_data:
+            self.empty_dist.set_visible(not has_data)
+            self.empty_time.set_visible(not has_data)
+            full = True
+
+        hist_changed, hist_full = self._update_histograms()
+        if hist_changed:
+            changed.add(self.ax_hist)
+        full |= hist_full
+
+        if full:
+            self.canvas.draw_idle()
+        elif changed and self.backgrounds:
+            for ax in changed:
+                self.canvas.restore_region(self.backgrounds[ax])
+                for artist in self.artists[ax]:
+                    ax.draw_artist(artist)
+                self.canvas.blit(ax.bbox)
+
+    # ==============
+    # FR: Élargit les limites d'un axe (avec marge) si les données en sortent; retourne True si un rendu complet est requis.
+    #
+    # EN: Widens an axis' limits (with headroom) when the data leaves them; returns True when a full draw is needed.
+    # =========
+    @staticmethod
+    def _fit_limits(ax, x, low, high):
+        low = low[~np.isnan(low)]
+        high = high[~np.isnan(high)]
+        if not len(x) or not len(low) or not len(high):
+            return False
+        x0, x1 = ax.get_xlim()
+        y0, y1 = ax.get_ylim()
+        lo, hi = float(low.min()), float(high.max())
+        pad = (hi - lo) * 0.1 or abs(hi) * 0.1 or 1.0
+        span = x.max() - x.min() + 1
+        inside = x.min() >= x0 and x.max() <= x1 and lo >= y0 and hi <= y1
+        tight = (x1 - x0) <= 4 * span and (y1 - y0) <= 4 * (hi - lo + 2 * pad)
+        if inside and tight:
+            return False
+        ax.set_xlim(x.min() - 0.5, x.max() + max(span * 0.5, 5))
+        ax.set_ylim(lo - pad, hi + pad)
+        return True
+
+    # ==============
+    # FR: Met à jour les histogrammes de façon incrémentale: les nouvelles distances sont ajoutées à leurs classes, celles
+    # sorties du tampon circulaire en sont retirées (la classe de chaque ligne comptée est mémorisée, la valeur écrasée
+    # n'étant plus lisible). Les classes ne sont recalculées que si une distance sort de leurs bornes.
+    #
+    # EN: Updates the histograms incrementally: new distances are added to their bins, the ones evicted from the ring
+    # buffer are removed from them (each counted row's bin is remembered, the overwritten value being unreadable).
+    # The bins are only recomputed when a distance falls outside their edges.
+    # =========
+    def _update_histograms(self):
+        changed = full = legend_dirty = False
+        for algo, series in self.logger.get_all_series().items():
+            state = self.histograms.get(algo)
+            if state is not None and state["series"] is not series:
+                self.artists[self.ax_hist].remove(state["artist"])
+                state["artist"].remove()
+                state = self.histograms[algo] = None
+                full = legend_dirty = True
+            if state is not None and state["seen"] == series.total:
+                continue
+            if not len(series):
+                continue
+            if state is None:
+                artist = self.ax_hist.stairs([0] * self.BINS, np.arange(self.BINS + 1), fill=True, alpha=0.5,
+                                             label=algo, color=self.COLORS.get(algo, self.TEXT_COLOR), animated=True)
+                self.artists[self.ax_hist].append(artist)
+                state = self.histograms[algo] = {"series": series, "artist": artist, "seen": 0, "edges": None,
+                                                 "counts": None, "bins": deque()}
+                full = legend_dirty = True
+
+            total, size = series.total, len(series)
+            new = series.tail("distance", total - max(state["seen"], total - size))
+            self._evict(state, total - size + 1)
+            present = new[~np.isnan(new)]
+            edges = state["edges"]
+            if edges is None or (len(present) and (present.min() < edges[0] or present.max() > edges[-1])):
+                values = series.column("distance")
+                finite = values[~np.isnan(values)]
+                if not len(finite):
+                    state["seen"] = total
+                    continue
+                lo, hi = float(finite.min()), float(finite.max())
+                pad = (hi - lo) * 0.25 or abs(hi) * 0.05 or 1.0
+                state["edges"] = np.linspace(lo - pad, hi + pad, self.BINS + 1)
+                bins = self._bin_indices(values, state["edges"])
+                state["bins"] = deque(bins.tolist())
+                state["counts"] = np.bincount(bins[bins >= 0], minlength=self.BINS)
+                full = True
+            else:
+                bins = self._bin_indices(new, edges)
+                state["bins"].extend(bins.tolist())
+                state["counts"] = state["counts"] + np.bincount(bins[bins >= 0], minlength=self.BINS)
+            state["seen"] = total
+            state["artist"].set_data(state["counts"], state["edges"])
+            changed = True
+
+        if legend_dirty:
+            if self.artists[self.ax_hist]:
+                self.ax_hist.legend(facecolor=self.BACKGROUND, labelcolor=self.TEXT_COLOR)
+            elif self.ax_hist.get_legend():
+                self.ax_hist.get_legend().remove()
+        if changed:
+            full |= self._fit_histogram_limits()
+        return changed or legend_dirty, full
+
+    # ==============
+    # FR: Retire des classes les lignes comptées qui ont quitté la fenêtre conservée (numéro global < oldest).
+    #
+    # EN: Removes from the bins the counted rows that have left the retained window (global number < oldest).
+    # =========
+    @staticmethod
+    def _evict(state, oldest):
+        bins = state["bins"]
+        first = state["seen"] - len(bins) + 1
+        for _ in range(min(len(bins), max(0, oldest - first))):
+            index = bins.popleft()
+            if index >= 0:
+                state["counts"][index] -= 1
+
+    # ==============
+    # FR: Classe de chaque distance comme np.histogram (dernière classe fermée à droite); -1 pour une valeur absente.
+    #
+    # EN: Bin of each distance as np.histogram does (last bin closed on the right); -1 for a missing value.
+    # =========
+    def _bin_indices(self, values, edges):
+        bins = np.searchsorted(edges, values, side="right") - 1
+        bins[values == edges[-1]] = self.BINS - 1
+        bins[np.isnan(values)] = -1
+        return bins
+
+    # ==============
+    # FR: Ajuste les limites de l'histogramme si une classe ou une distance en sort.
+    #
+    # EN: Adjusts the histogram limits when a bin or a distance leaves them.
+    # =========
+    def _fit_histogram_limits(self):
+        states = [state for state in self.histograms.values() if state and state["edges"] is not None]
+        if not states:
+            return False
+        lo = min(state["edges"][0] for state in states)
+        hi = max(state["edges"][-1] for state in states)
+        top = max(int(state["counts"].max()) for state in states)
+        x0, x1 = self.ax_hist.get_xlim()
+        y0, y1 = self.ax_hist.get_ylim()
+        if lo >= x0 and hi <= x1 and top <= y1:
+            return False
+        self.ax_hist.set_xlim(lo, hi)
+        self.ax_hist.set_ylim(0, max(top * 1.5, 1))
+        return True
@@ -0,0 +1,251 @@
+import threading
+import numpy as np
+
+# ==============
+# FR: Convertit une colonne de flottants en liste, NaN remplacé par None.
+#
+# EN: Converts a float column to a list, NaN replaced with None.
+# =========
+def _nullable(values):
+    return [None if value != value else value for value in values.tolist()]
+
+class StatsSeries:
+    COLUMNS = {
+        "distance": np.float64,
+        "time": np.float64,
+        "log_time": np.float64,
+        "log_overhead": np.float64,
+        "step": np.int32,
+        "run_id": np.int32,
+    }
+
+    def __init__(self, capacity=100000, initial=1024):
+        self.capacity = capacity
+        self.columns = {
+            name: np.full(min(initial, capacity), np.nan if dtype is np.float64 else -1, dtype=dtype)
+            for name, dtype in self.COLUMNS.items()
+        }
+        self.start = 0
+        self.size = 0
+        self.total = 0
+        self.lock = threading.Lock()
+
+    # ==============
+    # FR: Ajoute une ligne; au-delà de la capacité, la plus ancienne est écrasée.
+    #
+    # EN: Appends a row; beyond the capacity the oldest one is overwritten.
+    # =========
+    def append(self, distance=None, time=None, step=None, log_time=None, run_id=None, log_overhead=None):
+        with self.lock:
+            if self.size == len(self.columns["distance"]) and self.size < self.capacity:
+                self._grow()
+            slot = (self.start + self.size) % len(self.columns["distance"])
+            if self.size == self.capacity:
+                self.start = (self.start + 1) % self.capacity
+            else:
+                self.size += 1
+            self.total += 1
+            row = {"distance": distance, "time": time, "log_time": log_time, "log_overhead": log_overhead, "step": step,
+                   "run_id": run_id}
+            for name, value in row.items():
+                column = self.columns[name]
+                column[slot] = (np.nan if column.dtype == np.float64 else -1) if value is None else value
+            return slot
+
+    # ==============
+    # FR: Renseigne a posteriori une valeur de la dernière ligne ajoutée (par exemple le temps de journalisation).
+    #
+    # EN: Fills in a value of the last appended row afterwards (for example the logging time).
+    # =========
+    def set_last(self, name, value):
+        with self.lock:
+            if self.size:
+                column = self.columns[name]
+                column[(self.start + self.size - 1) % len(column)] = value
+
+    # ==============
+    # FR: Double la taille des colonnes, sans dépasser la capacité.
+    #
+    # EN: Doubles the column size, without exceeding the capacity.
+    # =========
+    def _grow(self):
+        new_size = min(2 * len(self.columns["distance"]), self.capacity)
+        for name, column in self.columns.items():
+            grown = np.full(new_size, np.nan if column.dtype == np.float64 else -1, dtype=column.dtype)
+            grown[:self.size] = np.roll(column, -self.start)[:self.size]
+            self.columns[name] = grown
+        self.start = 0
+
+    # ==============
+    # FR: Retourne une colonne dans l'ordre chronologique (copie).
+    #
+    # EN: Returns a column in chronological order (copy).
+    # =========
+    def column(self, name):
+        with self.lock:
+            column = self.columns[name]
+            end = self.start + self.size
+            if end <= len(column):
+                return column[self.start:end].copy()
+            return np.concatenate((column[self.start:], column[:end - len(column)]))
+
+    # ==============
+    # FR: Retourne les `count` dernières valeurs d'une colonne (au plus toutes les lignes conservées), en float.
+    #
+    # EN: Returns the last `count` values of a column (at most every retained row), as floats.
+    # =========
+    def tail(self, name, count):
+        with self.lock:
+            count = min(count, self.size)
+            column = self.columns[name]
+            end = self.start + self.size
+            indices = np.arange(end - count, end) % len(column)
+            return column[indices].astype(np.float64)
+
+    # ==============
+    # FR: Numéros globaux (à partir de 1) des lignes conservées.
+    #
+    # EN: Global (1-based) numbers of the retained rows.
+    # =========
+    def record_numbers(self):
+        return np.arange(self.total - self.size + 1, self.total + 1)
+
+    # ==============
+    # FR: Vue sous-échantillonnée d'une colonne: min, max et moyenne par paquet, pour le tracé.
+    #
+    # EN: Downsampled view of a column: min, max and mean per bucket, for plotting.
+    # =========
+    def downsample(self, name, buckets=500):
+        values = self.column(name)
+        x = self.record_numbers()[-len(values):] if len(values) else np.empty(0)
+        if len(values) <= buckets:
+            return x.astype(np.float64), values, values, values
+        edges = np.linspace(0, len(values), buckets + 1).astype(np.intp)
+        starts = edges[:-1]
+        widths = np.diff(edges)
+        present = ~np.isnan(values) if values.dtype == np.float64 else np.ones(len(values), dtype=bool)
+        mins = np.fmin.reduceat(values, starts)
+        maxs = np.fmax.reduceat(values, starts)
+        counts = np.add.reduceat(present.astype(np.int64), starts)
+        sums = np.add.reduceat(np.where(present, values, 0), starts)
+        means = np.divide(sums, counts, out=np.full(len(starts), np.nan), where=counts > 0)
+        centers = x[starts] + (widths - 1) / 2.0
+        return centers, mins, maxs, means
+
+    # ==============
+    # FR: Convertit la série en listes simples, les valeurs absentes devenant None.
+    #
+    # EN: Converts the series to plain lists, missing values becoming None.
+    # =========
+    def to_dict(self):
+        return {
+            "distances": _nullable(self.column("distance")),
+            "times": _nullable(self.column("time")),
+            "log_times": _nullable(self.column("log_time")),
+            "steps": [int(v) if v >= 0 else None for v in self.column("step").tolist()],
+            "run_ids": [int(v) for v in self.column("run_id").tolist()],
+        }
+
+    def __len__(self):
+        return self.size
+
+class DownsampledView:
+    def __init__(self, series, name, max_points=300):
+        self.series = series
+        self.name = name
+        self.max_points = max_points
+        self.width = 1
+        self.seen = series.total - series.size
+        self.starts = np.empty(0)
+        self.ends = np.empty(0)
+        self.mins = np.empty(0)
+        self.maxs = np.empty(0)
+        self.sums = np.empty(0)
+        self.counts = np.empty(0)
+        self.pending = np.empty(0)
+        self.pending_start = self.seen + 1
+
+    # ==============
+    # FR: Intègre uniquement les lignes ajoutées depuis le dernier appel; retourne True si la vue a changé.
+    #
+    # EN: Folds in only the rows appended since the last call; returns True when the view changed.
+    # =========
+    def update(self):
+        total = self.series.total
+        if total <= self.seen:
+            return False
+        values = self.series.tail(self.name, total - self.seen)
+        first = total - len(values) + 1
+        if first > self.pending_start + len(self.pending):
+            self.pending = np.empty(0)
+            self.pending_start = first
+        self.pending = np.concatenate((self.pending, values))
+        self.seen = total
+
+        full = len(self.pending) // self.width
+        if full:
+            chunk = self.pending[:full * self.width].reshape(full, self.width)
+            starts = self.pending_start + np.arange(full) * self.width
+            self._append(starts, starts + self.width - 1, np.fmin.reduce(chunk, axis=1),
+                         np.fmax.reduce(chunk, axis=1), np.nansum(chunk, axis=1), (~np.isnan(chunk)).sum(axis=1))
+            self.pending = self.pending[full * self.width:]
+            self.pending_start += full * self.width
+        while len(self.starts) > 2 * self.max_points:
+            self._merge_pairs()
+
+        oldest = self.series.total - self.series.size + 1
+        keep = self.ends >= oldest
+        if not keep.all():
+            self.starts, self.ends, self.mins, self.maxs, self.sums, self.counts = (
+                column[keep] for column in (self.starts, self.ends, self.mins, self.maxs, self.sums, self.counts)
+            )
+        return True
+
+    # ==============
+    # FR: Ajoute des paquets complets à la vue.
+    #
+    # EN: Appends complete buckets to the view.
+    # =========
+    def _append(self, starts, ends, mins, maxs, sums, counts):
+        self.starts = np.concatenate((self.starts, starts))
+        self.ends = np.concatenate((self.ends, ends))
+        self.mins = np.concatenate((self.mins, mins))
+        self.maxs = np.concatenate((self.maxs, maxs))
+        self.sums = np.concatenate((self.sums, sums))
+        self.counts = np.concatenate((self.counts, counts))
+
+    # ==============
+    # FR: Fusionne les paquets deux à deux et double leur largeur.
+    #
+    # EN: Merges the buckets pairwise and doubles their width.
+    # =========
+    def _merge_pairs(self):
+        pairs = len(self.starts) // 2 * 2
+        merged = (
+            self.starts[0:pairs:2], self.ends[1:pairs:2],
+            np.fmin(self.mins[0:pairs:2], self.mins[1:pairs:2]), np.fmax(self.maxs[0:pairs:2], self.maxs[1:pairs:2]),
+            self.sums[0:pairs:2] + self.sums[1:pairs:2], self.counts[0:pairs:2] + self.counts[1:pairs:2],
+        )
+        rest = (column[pairs:] for column in (self.starts, self.ends, self.mins, self.maxs, self.sums, self.counts))
+        self.starts, self.ends, self.mins, self.maxs, self.sums, self.counts = (
+            np.concatenate((done, left)) for done, left in zip(merged, rest)
+        )
+        self.width *= 2
+
+    # ==============
+    # FR: Retourne x, min, max et moyenne de la vue, y compris le paquet en cours de remplissage.
+    #
+    # EN: Returns x, min, max and mean of the view, including the bucket still being filled.
+    # =========
+    def arrays(self):
+        starts, ends, mins, maxs, sums, counts = self.starts, self.ends, self.mins, self.maxs, self.sums, self.counts
+        if len(self.pending):
+            present = ~np.isnan(self.pending)
+            starts = np.append(starts, self.pending_start)
+            ends = np.append(ends, self.pending_start + len(self.pending) - 1)
+            mins = np.append(mins, np.fmin.reduce(self.pending))
+            maxs = np.append(maxs, np.fmax.reduce(self.pending))
+            sums = np.append(sums, np.nansum(self.pending))
+            counts = np.append(counts, present.sum())
+        means = np.divide(sums, counts, out=np.full(len(sums), np.nan), where=counts > 0)
+        return (starts + ends) / 2.0, mins, maxs, means
@@ -0,0 +1,83 @@
+import itertools
+import time
+
+class StoppingCriteria:
+    def __init__(self, time_budget=None, stagnation_rounds=None, stagnation_eps=0.0):
+        self.time_budget = time_budget
+        self.stagnation_rounds = stagnation_rounds
+        self.stagnation_eps = stagnation_eps
+        self.start()
+
+    # ==============
+    # FR: Indique si un critère d'arrêt (budget de temps ou stagnation) est actif.
+    #
+    # EN: Tells whether a stopping criterion (time budget or stagnation) is active.
+    # =========
+    @property
+    def active(self):
+        return self.time_budget is not None or bool(self.stagnation_rounds)
+
+    # ==============
+    # FR: Démarre le chronomètre et remet à zéro la détection de stagnation.
+    #
+    # EN: Starts the clock and resets the stagnation detection.
+    # =========
+    def start(self):
+        self.started = self.last = time.perf_counter()
+        self.step_time = None
+        self.reference = float('inf')
+        self.stale = 0
+        self.reason = None
+
+    # ==============
+    # FR: Itérateur des numéros de tours depuis start: count tours, ou sans limite si count vaut None (un critère est alors requis).
+    #
+    # EN: Iterator over round numbers from start: count rounds, or unbounded when count is None (a criterion is then required).
+    # =========
+    def rounds(self, start, count):
+        if count is not None:
+            return range(start, start + count)
+        if not self.active:
+            raise ValueError("Nombre de tours illimité: précisez time_budget ou stagnation_rounds")
+        return itertools.count(start)
+
+    # ==============
+    # FR: Enregistre la fin d'un tour: durée du tour et meilleure distance (amélioration relative > epsilon sinon stagnation).
+    #
+    # EN: Records the end of a round: round duration and best distance (relative improvement > epsilon, else stagnation).
+    # =========
+    def update(self, best_distance):
+        now = time.perf_counter()
+        self.step_time = now - self.last
+        self.last = now
+        if self.reference == float('inf') or best_distance < self.reference * (1.0 - self.stagnation_eps):
+            self.reference = best_distance
+            self.stale = 0
+        else:
+            self.stale += 1
+
+    # ==============
+    # FR: Indique s'il faut s'arrêter avant le prochain tour: stagnation, ou budget dépassé si le tour suivant dure
+    # autant que le précédent. Le premier tour est toujours exécuté pour disposer d'un tour valide.
+    #
+    # EN: Tells whether to stop before the next round: stagnation, or a budget overrun if the next round lasts as
+    # long as the previous one. The first round always runs so that a valid tour exists.
+    # =========
+    def should_stop(self):
+        if self.step_time is None:
+            return False
+        if self.stagnation_rounds and self.stale >= self.stagnation_rounds:
+            self.reason = "stagnation"
+        elif self.time_budget is not None and self.last - self.started + self.step_time > self.time_budget:
+            self.reason = "budget"
+        return self.reason is not None
+
+    # ==============
+    # FR: Temps restant sur le budget (None sans budget).
+    #
+    # EN: Time left on the budget (None without a budget).
+    # =========
+    def remaining(self):
+        if self.time_budget is None:
+            return None
+        return max(0.0, self.time_budget - (time.perf_counter() - self.started))
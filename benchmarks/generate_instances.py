@@ -0,0 +1,91 @@
+import argparse
+import json
+import os
+import random
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from algorithm.distance_matrix import DistanceMatrix
+from algorithm.instances import save_tsplib, save_tour
+from algorithm.local_search import LocalSearch
+
+INSTANCE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "instances")
+# FR: (nom, type, nombre de villes, graine) des instances livrées.
+# EN: (name, kind, city count, seed) of the bundled instances.
+INSTANCES = [
+    ("uniform50", "uniform", 50, 1),
+    ("uniform100", "uniform", 100, 2),
+    ("uniform200", "uniform", 200, 3),
+    ("clustered100", "clustered", 100, 4),
+    ("clustered200", "clustered", 200, 5),
+]
+
+# ==============
+# FR: Villes uniformément réparties dans un carré de 1000 x 1000.
+#
+# EN: Cities spread uniformly over a 1000 x 1000 square.
+# =========
+def uniform_cities(n, rng):
+    return [(rng.uniform(0, 1000), rng.uniform(0, 1000)) for _ in range(n)]
+
+# ==============
+# FR: Villes regroupées autour de quelques centres (répartition gaussienne), bornées au carré de 1000 x 1000.
+#
+# EN: Cities grouped around a few centres (Gaussian spread), clamped to the 1000 x 1000 square.
+# =========
+def clustered_cities(n, rng, clusters=None):
+    clusters = clusters or max(2, n // 25)
+    centres = [(rng.uniform(100, 900), rng.uniform(100, 900)) for _ in range(clusters)]
+    cities = []
+    for i in range(n):
+        cx, cy = centres[i % clusters]
+        cities.append((min(max(rng.gauss(cx, 40), 0), 1000), min(max(rng.gauss(cy, 40), 0), 1000)))
+    return cities
+
+# ==============
+# FR: Tour de référence par recherche locale itérée (2-opt/Or-opt + perturbation double-bridge).
+#
+# EN: Reference tour through iterated local search (2-opt/Or-opt + double-bridge kicks).
+# =========
+def reference_tour(dist_matrix, kicks, rng):
+    n = dist_matrix.n
+    local_search = LocalSearch(dist_matrix)
+    tour = [0] + rng.sample(range(1, n), n - 1)
+    best, best_length = local_search.improve(tour)
+    for _ in range(kicks):
+        a, b, c = sorted(rng.sample(range(1, n), 3))
+        kicked = best[:a] + best[b:c] + best[a:b] + best[c:]
+        tour, length = local_search.improve(kicked)
+        if length < best_length - LocalSearch.EPSILON:
+            best, best_length = tour, length
+    return best, best_length
+
+# ==============
+# FR: Génère les instances livrées et leurs meilleures valeurs connues (best_known.json).
+#
+# EN: Generates the bundled instances and their best-known values (best_known.json).
+# =========
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Génère les instances TSPLIB du banc d'essai.")
+    parser.add_argument("--kicks", type=int, default=3000, help="perturbations de la recherche de référence")
+    args = parser.parse_args(argv)
+    os.makedirs(INSTANCE_DIR, exist_ok=True)
+    best_known = {}
+    for name, kind, n, seed in INSTANCES:
+        rng = random.Random(seed)
+        cities = uniform_cities(n, rng) if kind == "uniform" else clustered_cities(n, rng)
+        # FR: Coordonnées arrondies comme dans le fichier, pour que la référence corresponde à l'instance relue.
+        # EN: Coordinates rounded as in the file, so the reference matches the instance read back.
+        cities = [(round(x, 4), round(y, 4)) for x, y in cities]
+        save_tsplib(os.path.join(INSTANCE_DIR, f"{name}.tsp"), name, cities, comment=f"{kind}, seed {seed}")
+        tour, length = reference_tour(DistanceMatrix(cities), args.kicks, rng)
+        save_tour(os.path.join(INSTANCE_DIR, f"{name}.opt.tour"), name, tour, length)
+        best_known[name] = {"kind": kind, "n": n, "seed": seed, "best_known": round(length, 4)}
+        print(f"{name:<14} n={n:<4} référence {length:.2f}")
+    with open(os.path.join(INSTANCE_DIR, "best_known.json"), "w") as f:
+        json.dump(best_known, f, indent=2)
+
+if __name__ == "__main__":
+    main()
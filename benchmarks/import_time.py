@@ -0,0 +1,73 @@
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CORE_MODULES = ["algorithm", "algorithm.ga", "algorithm.aco", "algorithm.HybridTSP", "algorithm.cluster",
+                "algorithm.stats_logger", "algorithm.runner", "algorithm.cli"]
+GUI_MODULES = ["algorithm.gui"]
+FORBIDDEN = ("tkinter", "PIL", "matplotlib")
+
+# ==============
+# FR: Importe un module dans un interpréteur neuf; retourne le temps cumulé (ms, -X importtime) et les modules lourds chargés.
+#
+# EN: Imports a module in a fresh interpreter; returns the cumulative time (ms, -X importtime) and the heavy modules loaded.
+# =========
+def measure(module):
+    code = (
+        f"import sys, json, {module}\n"
+        f"print(json.dumps(sorted({{m.split('.')[0] for m in sys.modules}} & set({FORBIDDEN!r}))))"
+    )
+    env = dict(os.environ, PYTHONPATH=ROOT + os.pathsep + os.environ.get("PYTHONPATH", ""))
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", code], capture_output=True, text=True,
+                            env=env, cwd=ROOT)
+    if result.returncode != 0:
+        raise RuntimeError(f"Import impossible de {module}: {result.stderr.strip().splitlines()[-1]}")
+    total_us = 0
+    for line in result.stderr.splitlines():
+        match = re.match(r"import time:\s+\d+\s+\|\s+(\d+)\s+\|( *)(\S+)", line)
+        # FR: Imports de premier niveau du paquet uniquement (ni démarrage de l'interpréteur, ni double comptage).
+        # EN: Top-level imports of the package only (no interpreter startup, no double counting).
+        if match and len(match.group(2)) == 1 and match.group(3).split(".")[0] == "algorithm":
+            total_us += int(match.group(1))
+    return total_us / 1000.0, json.loads(result.stdout.strip().splitlines()[-1])
+
+# ==============
+# FR: Mesure chaque module (meilleur de plusieurs essais) et échoue si le cœur charge une dépendance graphique ou dépasse le budget.
+#
+# EN: Measures each module (best of several runs) and fails if the core loads a GUI dependency or exceeds the budget.
+# =========
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Temps d'import des modules du solveur.")
+    parser.add_argument("--repeat", type=int, default=3, help="nombre d'essais par module")
+    parser.add_argument("--budget-ms", type=float, default=None, help="temps d'import maximal du cœur (ms)")
+    parser.add_argument("--json", default=None, help="fichier de sortie JSON")
+    args = parser.parse_args(argv)
+
+    results = []
+    failed = False
+    for module in CORE_MODULES + GUI_MODULES:
+        runs = [measure(module) for _ in range(max(1, args.repeat))]
+        best = min(ms for ms, _ in runs)
+        heavy = runs[0][1]
+        core = module in CORE_MODULES
+        status = "ok"
+        if core and heavy:
+            status, failed = "dépendance graphique: " + ", ".join(heavy), True
+        elif core and args.budget_ms is not None and best > args.budget_ms:
+            status, failed = f"budget dépassé ({args.budget_ms:.0f} ms)", True
+        elif not core and set(heavy) & {"PIL", "matplotlib"}:
+            status, failed = "PIL/matplotlib chargés à l'import", True
+        results.append({"module": module, "import_ms": best, "heavy_modules": heavy, "status": status})
+        print(f"{module:<26} {best:8.1f} ms  {status}")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"python": sys.version.split()[0], "results": results}, f, indent=2)
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
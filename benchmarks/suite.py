@@ -0,0 +1,203 @@
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+import tracemalloc
+from collections import defaultdict
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import numpy as np
+from algorithm.cli import parse_params
+from algorithm.distance_matrix import DistanceMatrix
+from algorithm.instances import load_instance
+from algorithm.profiling import Profiler
+from algorithm.runner import SOLVERS
+
+# FR: Les instances sont au format EUC_2D, mais best_known.json et les écarts portent sur la longueur euclidienne non
+# arrondie (celle des solveurs), pas sur la longueur TSPLIB arrondie arête par arête.
+# EN: The instances are in EUC_2D format, but best_known.json and the gaps use the unrounded Euclidean length (the
+# solvers' one), not the per-edge rounded TSPLIB length.
+INSTANCE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "instances")
+DEFAULT_PARAMS = {
+    "GA": {"pop_size": 100, "max_gen": 100},
+    "ACO": {"ant_count": 20, "iterations": 50},
+    "Hybride": {"ga_params": {"pop_size": 50, "max_gen": 50}, "aco_params": {"ant_count": 20, "iterations": 30}},
+    "Cluster": {"cluster_size": 50, "workers": 1},
+}
+
+# ==============
+# FR: Fusionne récursivement des paramètres (les sous-dictionnaires comme ga_params sont complétés, pas remplacés).
+#
+# EN: Recursively merges parameters (sub-dictionaries such as ga_params are completed, not replaced).
+# =========
+def merge_params(base, override):
+    merged = dict(base)
+    for key, value in override.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            value = merge_params(merged[key], value)
+        merged[key] = value
+    return merged
+
+# ==============
+# FR: Exécute un solveur une fois; retourne (distance, temps, nombre de tours évalués). Les évaluations sont celles
+# mesurées par le profileur pendant l'exécution (compteur distance_evals), sous-solveurs de Cluster compris. Leur unité
+# dépend du solveur (qualités calculées pour le GA, tours construits pour l'ACO, recherche locale non comptée): le débit
+# ne se compare qu'entre exécutions d'un même solveur, jamais d'un solveur à l'autre.
+#
+# EN: Runs a solver once; returns (distance, time, number of evaluated tours). The evaluations are the ones measured by
+# the profiler during the run (distance_evals counter), Cluster's sub-solvers included. Their unit depends on the
+# solver (fitness computations for GA, constructed tours for ACO, local search not counted): the throughput only
+# compares between runs of the same solver, never from one solver to another.
+# =========
+def run_once(algo_name, cities, params, seed):
+    random.seed(seed)
+    profiler = Profiler()
+    start = time.perf_counter()
+    solver = SOLVERS[algo_name](cities, dist_matrix=DistanceMatrix(cities), profiler=profiler, **params)
+    with contextlib.redirect_stdout(io.StringIO()):
+        _, distance = solver.run()
+    elapsed = time.perf_counter() - start
+    return float(distance), elapsed, profiler.summary()["counters"].get("distance_evals", 0)
+
+# ==============
+# FR: Mesure le pic mémoire (tracemalloc) d'une exécution, refaite à part pour ne pas fausser le temps mesuré.
+#
+# EN: Measures the peak memory (tracemalloc) of a run, repeated separately so it does not skew the timing.
+# =========
+def measure_peak_memory(algo_name, cities, params, seed):
+    tracemalloc.start()
+    try:
+        run_once(algo_name, cities, params, seed)
+        return tracemalloc.get_traced_memory()[1] / 2 ** 20
+    finally:
+        tracemalloc.stop()
+
+# ==============
+# FR: Identifiant du commit courant, si disponible.
+#
+# EN: Current commit id, if available.
+# =========
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              cwd=ROOT, check=True).stdout.strip()
+    except Exception:
+        return None
+
+# ==============
+# FR: Moyennes par (instance, algorithme) sur les graines.
+#
+# EN: Averages per (instance, algorithm) over the seeds.
+# =========
+def summarize(results):
+    groups = defaultdict(list)
+    for result in results:
+        groups[(result["instance"], result["algo"])].append(result)
+    summary = []
+    for (instance, algo_name), rows in groups.items():
+        summary.append({
+            "instance": instance,
+            "algo": algo_name,
+            "runs": len(rows),
+            "mean_gap_percent": float(np.mean([row["gap_percent"] for row in rows])),
+            "best_gap_percent": float(min(row["gap_percent"] for row in rows)),
+            "mean_wall_time": float(np.mean([row["wall_time"] for row in rows])),
+            "mean_evals_per_sec": float(np.mean([row["evals_per_sec"] for row in rows])),
+            "max_peak_memory_mb": max((row["peak_memory_mb"] or 0.0) for row in rows),
+        })
+    return summary
+
+# ==============
+# FR: Affiche l'écart de temps, de débit et de qualité avec un fichier de résultats précédent, solveur par solveur.
+#
+# EN: Prints the time, throughput and quality difference with a previous results file, solver by solver.
+# =========
+def compare(summary, baseline_path):
+    with open(baseline_path) as f:
+        baseline = {(row["instance"], row["algo"]): row for row in json.load(f)["summary"]}
+    print(f"\nComparaison avec {baseline_path}:")
+    for row in summary:
+        old = baseline.get((row["instance"], row["algo"]))
+        if old is None:
+            continue
+        ratio = row["mean_wall_time"] / old["mean_wall_time"] if old["mean_wall_time"] else float('nan')
+        speed = row["mean_evals_per_sec"] / old["mean_evals_per_sec"] if old["mean_evals_per_sec"] else float('nan')
+        print(f"{row['instance']:<14} {row['algo']:<8} temps x{ratio:.2f}  débit x{speed:.2f}  "
+              f"écart {old['mean_gap_percent']:.2f}% -> {row['mean_gap_percent']:.2f}%")
+
+# ==============
+# FR: Point d'entrée: exécute les solveurs sur les instances livrées avec des graines fixes et écrit les résultats en JSON.
+#
+# EN: Entry point: runs the solvers on the bundled instances with fixed seeds and writes the results as JSON.
+# =========
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Banc d'essai TSP: qualité et temps des solveurs.")
+    parser.add_argument("--instances", nargs="+", default=None, help="noms des instances (défaut: toutes)")
+    parser.add_argument("--algo", nargs="+", choices=list(SOLVERS), default=list(SOLVERS))
+    parser.add_argument("--seeds", nargs="+", type=int, default=[1, 2, 3])
+    parser.add_argument("--param", action="append", default=[], metavar="[ALGO:]CLE=VALEUR")
+    parser.add_argument("--no-memory", action="store_true", help="ne mesure pas le pic mémoire (plus rapide)")
+    parser.add_argument("--out", default=None, help="fichier JSON de résultats (défaut: benchmarks/results/<commit>.json)")
+    parser.add_argument("--compare", default=None, help="fichier JSON de référence à comparer")
+    args = parser.parse_args(argv)
+
+    with open(os.path.join(INSTANCE_DIR, "best_known.json")) as f:
+        best_known = json.load(f)
+    names = args.instances or list(best_known)
+    results = []
+    for name in names:
+        _, cities = load_instance(os.path.join(INSTANCE_DIR, f"{name}.tsp"))
+        reference = best_known[name]["best_known"]
+        for algo_name in args.algo:
+            params = merge_params(DEFAULT_PARAMS[algo_name], parse_params(args.param, algo_name))
+            for seed in args.seeds:
+                distance, wall_time, evaluations = run_once(algo_name, cities, params, seed)
+                peak = None if args.no_memory else measure_peak_memory(algo_name, cities, params, seed)
+                results.append({
+                    "instance": name,
+                    "kind": best_known[name]["kind"],
+                    "n": len(cities),
+                    "algo": algo_name,
+                    "seed": seed,
+                    "distance": distance,
+                    "best_known": reference,
+                    "gap_percent": 100.0 * (distance - reference) / reference,
+                    "wall_time": wall_time,
+                    "evaluations": evaluations,
+                    "evals_per_sec": evaluations / wall_time if wall_time > 0 else 0.0,
+                    "peak_memory_mb": peak,
+                    "params": params,
+                })
+                memory = f"{peak:7.1f} Mo" if peak is not None else "      -"
+                print(f"{name:<14} {algo_name:<8} graine {seed:<3} écart {results[-1]['gap_percent']:6.2f}%  "
+                      f"{wall_time:7.2f}s  {results[-1]['evals_per_sec']:9.0f} éval/s  {memory}")
+
+    summary = summarize(results)
+    commit = git_commit()
+    out = args.out or os.path.join(os.path.dirname(os.path.abspath(__file__)), "results", f"{commit or 'local'}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(out)), exist_ok=True)
+    with open(out, "w") as f:
+        json.dump({
+            "commit": commit,
+            "date": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "machine": platform.machine(),
+            "seeds": args.seeds,
+            "summary": summary,
+            "results": results,
+        }, f, indent=2)
+    print(f"\nRésultats écrits dans {out}")
+    if args.compare:
+        compare(summary, args.compare)
+
+if __name__ == "__main__":
+    main()
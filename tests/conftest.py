@@ -0,0 +1,32 @@
+import random
+import pytest
+
+# ==============
+# FR: Graine fixe pour chaque test: les solveurs tirent leurs nombres aléatoires du module random.
+#
+# EN: Fixed seed for every test: the solvers draw their random numbers from the random module.
+# =========
+@pytest.fixture(autouse=True)
+def seeded():
+    random.seed(1234)
+
+# ==============
+# FR: Fabrique de villes aléatoires reproductibles dans un carré de 1000 x 1000.
+#
+# EN: Factory of reproducible random cities in a 1000 x 1000 square.
+# =========
+@pytest.fixture
+def make_cities():
+    def make(n, seed=0):
+        rng = random.Random(seed)
+        return [(rng.uniform(0, 1000), rng.uniform(0, 1000)) for _ in range(n)]
+    return make
+
+# ==============
+# FR: Quarante villes aléatoires, assez pour exercer les solveurs en quelques dixièmes de seconde.
+#
+# EN: Forty random cities, enough to exercise the solvers in a few tenths of a second.
+# =========
+@pytest.fixture
+def cities(make_cities):
+    return make_cities(40)
@@ -0,0 +1,85 @@
+import contextlib
+import io
+import numpy as np
+from algorithm.aco import AntColony
+from algorithm.distance_matrix import DistanceMatrix
+
+# ==============
+# FR: Vérifie qu'un chemin est une permutation des villes qui commence par la ville 0.
+#
+# EN: Checks that a path is a permutation of the cities starting at city 0.
+# =========
+def assert_tour(path, n):
+    assert path[0] == 0
+    assert sorted(path) == list(range(n))
+
+# ==============
+# FR: La construction vectorisée produit un chemin valide par fourmi, avec sa longueur exacte.
+#
+# EN: The vectorized construction yields one valid path per ant, with its exact length.
+# =========
+def test_vectorized_construction_yields_valid_tours(cities):
+    dm = DistanceMatrix(cities)
+    colony = AntColony(cities, ant_count=12, dist_matrix=dm)
+    solutions = colony._construct_paths_vectorized(12)
+    assert len(solutions) == 12
+    for path, length in solutions:
+        assert_tour(path, len(cities))
+        assert np.isclose(length, dm.tour_length(path))
+
+# ==============
+# FR: Le tirage par ligne suit les poids de chaque ligne, même petits et sur beaucoup de lignes, sans jamais tirer une
+# ville de poids nul.
+#
+# EN: Per-row sampling follows each row's weights, even small ones and over many rows, never drawing a zero-weight
+# city.
+# =========
+def test_sample_rows_follows_the_weights(cities):
+    colony = AntColony(cities, ant_count=2)
+    weights = np.tile([0.0, 1e-3, 0.0, 1.0, 3.0, 0.0], (200000, 1))
+    counts = np.bincount(colony._sample_rows(weights), minlength=6) / len(weights)
+    assert counts[[0, 2, 5]].sum() == 0
+    assert np.allclose(counts[[1, 3, 4]], np.array([1e-3, 1.0, 3.0]) / 4.001, atol=3e-3)
+    assert counts[1] > 0
+
+# ==============
+# FR: Les deux constructions (vectorisée et ville par ville) donnent une colonie qui converge vers un tour valide.
+#
+# EN: Both constructions (vectorized and city by city) give a colony that converges to a valid tour.
+# =========
+def test_run_returns_a_valid_tour(cities):
+    for vectorized in (True, False):
+        colony = AntColony(cities, ant_count=8, iterations=5, vectorized=vectorized)
+        with contextlib.redirect_stdout(io.StringIO()):
+            path, distance = colony.run()
+        assert_tour(path, len(cities))
+        assert np.isclose(distance, colony.dist_matrix.tour_length(path))
+
+# ==============
+# FR: Restreinte aux listes de candidats, la construction reste complète (repli sur toutes les villes non visitées).
+#
+# EN: Restricted to candidate lists, the construction stays complete (fallback to every unvisited city).
+# =========
+def test_candidate_construction_yields_valid_tours(cities):
+    for vectorized in (True, False):
+        colony = AntColony(cities, ant_count=6, candidates=3, vectorized=vectorized)
+        for path, _ in colony._construct_solutions(6):
+            assert_tour(path, len(cities))
+
+# ==============
+# FR: Les fourmis réparties entre processus donnent un tour valide; les phéromones reviennent en mémoire privée, avec le
+# dépôt du processus principal sur les arêtes du meilleur tour.
+#
+# EN: Ants spread across processes give a valid tour; the pheromones come back to private memory, with the main
+# process' deposit on the best tour's edges.
+# =========
+def test_parallel_colonies_share_one_pheromone_matrix(cities):
+    colony = AntColony(cities, ant_count=8, iterations=3, workers=2)
+    with contextlib.redirect_stdout(io.StringIO()):
+        path, distance = colony.run()
+    assert_tour(path, len(cities))
+    assert colony.pheromones is colony.pheromone_store.matrix
+    assert colony.pheromones.flags.owndata
+    assert np.allclose(colony.pheromones, colony.pheromones.T)
+    evaporated = 0.1 * (1 - colony.evap) ** 3
+    assert all(colony.pheromones[path[i - 1], path[i]] > evaporated for i in range(len(path)))
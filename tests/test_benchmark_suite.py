@@ -0,0 +1,52 @@
+import contextlib
+import io
+import json
+from benchmarks.suite import main, merge_params, run_once
+
+# ==============
+# FR: La fusion complète les sous-dictionnaires au lieu de les remplacer, sans modifier la base.
+#
+# EN: Merging completes the sub-dictionaries instead of replacing them, without changing the base.
+# =========
+def test_merge_params_is_recursive():
+    base = {"ga_params": {"pop_size": 50, "max_gen": 50}, "aco_params": {"ant_count": 20}}
+    merged = merge_params(base, {"ga_params": {"max_gen": 5}, "aco_params": 3})
+    assert merged == {"ga_params": {"pop_size": 50, "max_gen": 5}, "aco_params": 3}
+    assert base["ga_params"]["max_gen"] == 50
+
+# ==============
+# FR: Les évaluations sont mesurées pendant l'exécution: une par fourmi et par itération pour l'ACO, et pour le GA
+# seulement les tours absents du cache (moins qu'individus par génération).
+#
+# EN: Evaluations are measured during the run: one per ant and per iteration for the ACO, and for the GA only the
+# tours missing from the cache (fewer than individuals per generation).
+# =========
+def test_run_once_measures_evaluations(cities):
+    assert run_once("ACO", cities, {"ant_count": 5, "iterations": 3}, seed=1)[2] == 15
+    evaluations = run_once("GA", cities, {"pop_size": 20, "max_gen": 4}, seed=1)[2]
+    assert 20 < evaluations < 20 * 5
+    hybrid = {"ga_params": {"pop_size": 20, "max_gen": 4}, "aco_params": {"ant_count": 5, "iterations": 3}}
+    assert run_once("Hybride", cities, hybrid, seed=1)[2] == evaluations + 15
+
+# ==============
+# FR: Une exécution courte écrit un JSON de résultats avec écart à la meilleure solution connue et débit, puis se
+# compare à lui-même.
+#
+# EN: A short run writes a results JSON with the gap to the best known solution and the throughput, then compares
+# with itself.
+# =========
+def test_main_writes_results(tmp_path):
+    out = tmp_path / "results.json"
+    args = ["--instances", "uniform50", "--algo", "GA", "ACO", "--seeds", "1", "--no-memory", "--out", str(out),
+            "--param", "GA:max_gen=5", "--param", "ACO:iterations=3"]
+    with contextlib.redirect_stdout(io.StringIO()):
+        main(args)
+    content = json.loads(out.read_text())
+    assert [(row["algo"], row["evaluations"]) for row in content["results"]][1] == ("ACO", 60)
+    assert 100 < content["results"][0]["evaluations"] <= 600
+    assert all(row["gap_percent"] >= 0 and row["evals_per_sec"] > 0 for row in content["results"])
+    assert [row["runs"] for row in content["summary"]] == [1, 1]
+    printed = io.StringIO()
+    with contextlib.redirect_stdout(printed):
+        main(args + ["--compare", str(out)])
+    assert "temps x" in printed.getvalue() and "débit x" in printed.getvalue()
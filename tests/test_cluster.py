@@ -0,0 +1,108 @@
+import contextlib
+import io
+import multiprocessing
+import random
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from algorithm.cluster import ClusterTSP, _solve_cluster
+from algorithm.ga import GeneticAlgorithm
+from algorithm.profiling import Profiler
+from benchmarks.suite import run_once
+
+SMALL_GA = {"pop_size": 10, "max_gen": 3, "elitism_count": 4, "seed_fraction": 0}
+
+# ==============
+# FR: La décomposition en groupes retourne une permutation valide et ajoute au profileur les évaluations mesurées par
+# les sous-solveurs, en série comme en parallèle.
+#
+# EN: The cluster decomposition returns a valid permutation and adds the evaluations measured by the sub-solvers to
+# the profiler, serially as in parallel.
+# =========
+def test_cluster_merges_sub_solver_counters(make_cities):
+    cities = make_cities(120)
+    evaluations = []
+    for workers in (1, 2):
+        random.seed(7)
+        profiler = Profiler()
+        solver = ClusterTSP(cities, cluster_size=30, algo="GA", params=SMALL_GA, workers=workers, profiler=profiler)
+        with contextlib.redirect_stdout(io.StringIO()):
+            path, distance = solver.run()
+        assert sorted(path) == list(range(len(cities)))
+        evaluations.append(profiler.summary()["counters"]["distance_evals"])
+    assert evaluations[0] == evaluations[1] > 0
+
+# ==============
+# FR: Un groupe résolu seul retourne son tour local et les compteurs de son sous-solveur, identiques à ceux d'une
+# exécution directe avec la même graine.
+#
+# EN: A group solved on its own returns its local tour and its sub-solver's counters, identical to those of a direct
+# run with the same seed.
+# =========
+def test_solve_cluster_reports_counters(make_cities):
+    cities = make_cities(15)
+    tour, counters = _solve_cluster(cities, "GA", SMALL_GA, seed=1)
+    assert sorted(tour) == list(range(15))
+    random.seed(1)
+    profiler = Profiler()
+    with contextlib.redirect_stdout(io.StringIO()):
+        GeneticAlgorithm(cities, profiler=profiler, **SMALL_GA).run()
+    assert counters == profiler.summary()["counters"]
+    assert counters["distance_evals"] > 0
+    assert _solve_cluster(cities[:3], "GA", SMALL_GA, seed=1) == ([0, 1, 2], {})
+
+# ==============
+# FR: La suite de mesures compte les évaluations des sous-solveurs pour Cluster (plus de 0 éval/s).
+#
+# EN: The benchmark suite counts the sub-solvers' evaluations for Cluster (no more 0 evals/s).
+# =========
+def test_suite_counts_cluster_evaluations(make_cities):
+    cities = make_cities(60)
+    params = {"cluster_size": 20, "algo": "GA", "params": SMALL_GA, "workers": 1}
+    distance, wall_time, evaluations = run_once("Cluster", cities, params, seed=1)
+    assert evaluations > 0
+
+# ==============
+# FR: Retourne le nombre de processus choisi par défaut par la décomposition en groupes.
+#
+# EN: Returns the number of processes the cluster decomposition picks by default.
+# =========
+def _default_workers(cities):
+    return ClusterTSP(cities).workers
+
+# ==============
+# FR: Dans un processus de travail, la décomposition n'ouvre pas de pool imbriqué par défaut.
+#
+# EN: Inside a worker process, the decomposition opens no nested pool by default.
+# =========
+def test_no_nested_pool_inside_a_worker(make_cities):
+    cities = make_cities(10)
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        assert executor.submit(_default_workers, cities).result() == 1
+    assert ClusterTSP(cities, workers=3).workers == 3
+
+# ==============
+# FR: L'annulation atteint les sous-solveurs: un groupe annulé ne produit pas de tour.
+#
+# EN: Cancellation reaches the sub-solvers: a cancelled group yields no tour.
+# =========
+def test_cancel_reaches_the_sub_solver(make_cities):
+    cancel = threading.Event()
+    cancel.set()
+    tour, counters = _solve_cluster(make_cities(15), "GA", SMALL_GA, seed=1, cancel=cancel)
+    assert tour is None and not counters.get("distance_evals")
+
+# ==============
+# FR: Une annulation pendant la résolution parallèle des groupes arrête l'exécution sans attendre la fin des groupes.
+#
+# EN: A cancellation during the parallel group solving stops the run without waiting for the groups to finish.
+# =========
+def test_cancel_stops_parallel_clusters_promptly(make_cities):
+    with multiprocessing.Manager() as manager:
+        cancel = manager.Event()
+        solver = ClusterTSP(make_cities(200), cluster_size=50, algo="GA", workers=2, cancel=cancel,
+                            params={"pop_size": 30, "max_gen": 100000, "seed_fraction": 0})
+        threading.Timer(1.0, cancel.set).start()
+        start = time.perf_counter()
+        assert solver.run() == (None, float('inf'))
+        assert time.perf_counter() - start < 10.0
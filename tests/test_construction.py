@@ -0,0 +1,99 @@
+import random
+import numpy as np
+import pytest
+from algorithm.aco import AntColony
+from algorithm.construction import CONSTRUCTORS, construct, seed_tours
+from algorithm.distance_matrix import DistanceMatrix
+from algorithm.ga import GeneticAlgorithm
+
+# ==============
+# FR: Chaque heuristique de construction produit une permutation des villes qui commence par la ville 0.
+#
+# EN: Every construction heuristic produces a permutation of the cities that starts at city 0.
+# =========
+@pytest.mark.parametrize("name", sorted(CONSTRUCTORS))
+def test_constructors_build_tours(cities, name):
+    tour = construct(name, DistanceMatrix(cities))
+    assert sorted(tour) == list(range(len(cities))) and tour[0] == 0
+
+# ==============
+# FR: L'arête gloutonne bat un tour aléatoire de loin; un nom inconnu est refusé.
+#
+# EN: Greedy edge beats a random tour by far; an unknown name is rejected.
+# =========
+def test_greedy_is_short_and_unknown_names_fail(cities):
+    dm = DistanceMatrix(cities)
+    assert dm.tour_length(construct("greedy", dm)) < 0.5 * dm.tour_length(list(range(len(cities))))
+    with pytest.raises(ValueError):
+        construct("christofides", dm)
+
+# ==============
+# FR: Les tours d'amorçage sont distincts, même sur une instance trop petite pour que les heuristiques diffèrent.
+#
+# EN: The seed tours are distinct, even on an instance too small for the heuristics to differ.
+# =========
+@pytest.mark.parametrize("n", [6, 12, 40])
+def test_seed_tours_are_distinct(make_cities, n):
+    tours = seed_tours(DistanceMatrix(make_cities(n)), 10)
+    assert len(tours) == 10
+    assert len({tuple(tour) for tour in tours}) == 10
+    assert all(sorted(tour) == list(range(n)) and tour[0] == 0 for tour in tours)
+
+# ==============
+# FR: Le GA amorcé continue de chercher: il bat le meilleur de ses propres tours d'amorçage.
+#
+# EN: The seeded GA keeps searching: it beats the best of its own seed tours.
+# =========
+@pytest.mark.parametrize("batched", [False, True])
+def test_seeded_ga_beats_its_seeds(make_cities, batched):
+    ga = GeneticAlgorithm(make_cities(20, seed=3), batched=batched, seed_fraction=0.1)
+    population = ga._init_population()
+    best_seed = min(ga.total_distance(tour) for tour in population[:10])
+    for result in ga.run_step_by_step(population):
+        pass
+    assert result["best_distance"] < best_seed
+
+# ==============
+# FR: L'amorçage est optionnel: par défaut, population aléatoire pour le GA et phéromones uniformes pour l'ACO; un
+# initial_path (hybride) garde le dépôt historique de 5/L.
+#
+# EN: Seeding is opt-in: by default, a random population for the GA and flat pheromones for the ACO; an initial_path
+# (hybrid) keeps the historical 5/L deposit.
+# =========
+def test_seeding_is_opt_in(cities):
+    dm = DistanceMatrix(cities)
+    greedy = construct("greedy", dm)
+    ga = GeneticAlgorithm(cities, dist_matrix=dm)
+    assert greedy not in ga._init_population()
+    assert np.all(AntColony(cities, dist_matrix=dm).pheromones == 0.1)
+    colony = AntColony(cities, dist_matrix=dm, initial_path=greedy)
+    assert np.isclose(colony.pheromones[greedy[0], greedy[1]], 0.1 + 5.0 / dm.tour_length(greedy))
+    assert colony.pheromones[greedy[0], greedy[2]] == 0.1
+    seeded = AntColony(cities, dist_matrix=dm, seed_tour="greedy")
+    assert seeded.pheromones[greedy[0], greedy[1]] > seeded.pheromones[greedy[0], greedy[2]]
+
+# ==============
+# FR: Avec un opérateur capable d'améliorer un bon tour (mode mémétique), le GA amorcé ne converge pas
+# prématurément: il dépasse nettement ses tours d'amorçage, atteint la même qualité que sans amorçage et garde une
+# population aussi variée.
+#
+# EN: With an operator able to improve a good tour (memetic mode), the seeded GA does not converge prematurely: it
+# clearly beats its seed tours, reaches the same quality as without seeding and keeps an equally diverse population.
+# =========
+def test_memetic_seeded_ga_keeps_improving(make_cities):
+    cities = make_cities(60, seed=5)
+    outcomes = {}
+    for seed_fraction in (0.0, 0.1):
+        random.seed(3)
+        ga = GeneticAlgorithm(cities, pop_size=20, elitism_count=5, max_gen=5, memetic=True,
+                              seed_fraction=seed_fraction)
+        population = ga._init_population()
+        best_start = min(ga.total_distance(tour) for tour in population)
+        for result in ga.run_step_by_step(population):
+            pass
+        outcomes[seed_fraction] = (best_start, result["best_distance"], len({tuple(indiv) for indiv in ga.population}))
+    best_seed, seeded, seeded_distinct = outcomes[0.1]
+    _, unseeded, unseeded_distinct = outcomes[0.0]
+    assert seeded < 0.97 * best_seed
+    assert seeded <= 1.01 * unseeded
+    assert seeded_distinct >= min(unseeded_distinct, 5)
@@ -0,0 +1,75 @@
+import random
+import numpy as np
+import pytest
+from algorithm.crossover import CROSSOVERS, make_crossover, order_crossover, order_crossover_batch
+from algorithm.distance_matrix import DistanceMatrix
+
+# ==============
+# FR: Croisement OX de référence en O(n²): segment de p1, puis villes de p2 dans l'ordre, après le segment.
+#
+# EN: O(n²) reference OX: p1's segment, then p2's cities in order, after the segment.
+# =========
+def reference_order_crossover(p1, p2, start, end):
+    size = len(p1)
+    child = [None] * size
+    child[0] = 0
+    child[start:end] = p1[start:end]
+    rest = [gene for gene in p2[1:] if gene not in child]
+    slots = [i % (size - 1) + 1 for i in range(end - 1, end - 1 + size - 1) if child[i % (size - 1) + 1] is None]
+    for slot, gene in zip(slots, rest):
+        child[slot] = gene
+    return child
+
+# ==============
+# FR: Tire deux parents aléatoires qui commencent par la ville 0.
+#
+# EN: Draws two random parents starting at city 0.
+# =========
+def random_parents(n):
+    parents = []
+    for _ in range(2):
+        tail = list(range(1, n))
+        random.shuffle(tail)
+        parents.append([0] + tail)
+    return parents
+
+# ==============
+# FR: Chaque opérateur nommé produit une permutation qui commence par la ville 0.
+#
+# EN: Every named operator yields a permutation starting at city 0.
+# =========
+@pytest.mark.parametrize("name", sorted(CROSSOVERS))
+def test_crossovers_yield_permutations(name, cities):
+    operator = make_crossover(name, DistanceMatrix(cities))
+    for _ in range(20):
+        child = operator(*random_parents(len(cities)))
+        assert child[0] == 0
+        assert sorted(child) == list(range(len(cities)))
+    with pytest.raises(ValueError):
+        make_crossover("inconnu", DistanceMatrix(cities))
+
+# ==============
+# FR: L'OX en O(n) donne le même enfant que la référence pour les mêmes points de coupe.
+#
+# EN: The O(n) OX gives the same child as the reference for the same cut points.
+# =========
+def test_order_crossover_matches_the_reference():
+    for _ in range(50):
+        p1, p2 = random_parents(12)
+        state = random.getstate()
+        start, end = sorted(random.sample(range(1, 12), 2))
+        random.setstate(state)
+        assert order_crossover(p1, p2) == reference_order_crossover(p1, p2, start, end)
+
+# ==============
+# FR: L'OX par lots donne, ligne par ligne, l'enfant de la référence pour les points de coupe tirés du même générateur.
+#
+# EN: Batched OX gives, row by row, the reference child for the cut points drawn from the same generator.
+# =========
+def test_order_crossover_batch_matches_the_reference():
+    size = 15
+    parents = [random_parents(size) for _ in range(30)]
+    children = order_crossover_batch([p for p, _ in parents], [q for _, q in parents], np.random.default_rng(0))
+    cuts = np.sort(np.argsort(np.random.default_rng(0).random((30, size - 1)), axis=1)[:, :2] + 1, axis=1)
+    for child, (p1, p2), (start, end) in zip(children.tolist(), parents, cuts.tolist()):
+        assert child == reference_order_crossover(p1, p2, start, end)
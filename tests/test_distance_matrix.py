@@ -0,0 +1,93 @@
+import math
+import numpy as np
+from algorithm.construction import greedy_edge, nearest_neighbour
+from algorithm.crossover import EAXLite
+from algorithm.distance_matrix import CoordinateDistance, DistanceMatrix, get_distance_matrix
+from algorithm.ga import GeneticAlgorithm
+from algorithm.aco import AntColony
+from algorithm.HybridTSP import HybridTSP
+from algorithm.reoptimize import cheapest_insertion
+
+# ==============
+# FR: La matrice est symétrique, de diagonale nulle, et égale aux distances euclidiennes.
+#
+# EN: The matrix is symmetric, has a zero diagonal, and equals the Euclidean distances.
+# =========
+def test_matrix_is_euclidean(cities):
+    dm = DistanceMatrix(cities)
+    assert dm.matrix.shape == (len(cities), len(cities))
+    assert np.allclose(dm.matrix, dm.matrix.T)
+    assert not dm.matrix.diagonal().any()
+    for a, b in [(0, 1), (3, 17), (39, 5)]:
+        assert math.isclose(dm.dist(a, b), math.dist(cities[a], cities[b]))
+
+# ==============
+# FR: Longueur d'un tour fermé (retour au départ compris), seule ou par lot.
+#
+# EN: Length of a closed tour (including the return to the start), alone or in a batch.
+# =========
+def test_tour_lengths(cities):
+    dm = DistanceMatrix(cities)
+    tours = [list(range(len(cities))), list(range(len(cities)))[::-1], [0] + list(range(len(cities) - 1, 0, -1))]
+    expected = [sum(math.dist(cities[t[i]], cities[t[i - 1]]) for i in range(len(t))) for t in tours]
+    assert np.allclose([dm.tour_length(t) for t in tours], expected)
+    assert np.allclose(dm.tour_lengths(tours), expected)
+    assert dm.tour_length([3]) == 0.0
+
+# ==============
+# FR: Une matrice correspondant aux villes est réutilisée; sinon une nouvelle est construite.
+#
+# EN: A matrix matching the cities is reused; otherwise a new one is built.
+# =========
+def test_get_distance_matrix_reuses_matching(cities, make_cities):
+    dm = DistanceMatrix(cities)
+    assert get_distance_matrix(list(cities), dm) is dm
+    other = make_cities(40, seed=1)
+    rebuilt = get_distance_matrix(other, dm)
+    assert rebuilt is not dm and rebuilt.matches(other)
+
+# ==============
+# FR: Le GA, l'ACO et l'hybride partagent la matrice fournie au lieu d'en recalculer une.
+#
+# EN: The GA, ACO and hybrid share the given matrix instead of recomputing one.
+# =========
+def test_solvers_share_matrix(cities):
+    dm = DistanceMatrix(cities)
+    assert GeneticAlgorithm(cities, dist_matrix=dm).dist_matrix is dm
+    assert AntColony(cities, dist_matrix=dm).dist_matrix is dm
+    assert HybridTSP(cities, dist_matrix=dm).dist_matrix is dm
+
+# ==============
+# FR: Les listes de candidats sont les k plus proches voisins de chaque ville, du plus proche au plus lointain.
+#
+# EN: The candidate lists are each city's k nearest neighbours, nearest first.
+# =========
+def test_neighbours_are_the_nearest_cities(cities):
+    dm = DistanceMatrix(cities)
+    neighbours = dm.neighbours(5)
+    assert neighbours.shape == (len(cities), 5)
+    for city, row in enumerate(neighbours.tolist()):
+        others = sorted((math.dist(cities[city], cities[other]), other) for other in range(len(cities)) if other != city)
+        assert [dm.dist(city, other) for other in row] == sorted(dm.dist(city, other) for other in row)
+        assert np.isclose(dm.dist(city, row[-1]), others[4][0])
+        assert city not in row
+    assert dm.neighbours(5) is neighbours
+    assert dm.neighbours(100).shape == (len(cities), len(cities) - 1)
+
+# ==============
+# FR: Les distances calculées depuis les coordonnées conviennent aux heuristiques et opérateurs: mêmes tours qu'avec la
+# matrice; les solveurs qui exigent une matrice n x n la construisent.
+#
+# EN: Distances computed from the coordinates suit the heuristics and operators: same tours as with the matrix;
+# solvers that require an n x n matrix build it.
+# =========
+def test_coordinate_distances_work_without_a_matrix(cities):
+    dm, cd = DistanceMatrix(cities), CoordinateDistance(cities)
+    starts, ends = np.arange(len(cities)), np.arange(len(cities))[::-1]
+    assert np.allclose(cd.pair_distances(starts, ends), dm.pair_distances(starts, ends))
+    assert greedy_edge(cd) == greedy_edge(dm)
+    assert cheapest_insertion([0, 1, 2], range(3, len(cities)), cd) == cheapest_insertion([0, 1, 2], range(3, len(cities)), dm)
+    child = EAXLite(cd)(greedy_edge(dm), nearest_neighbour(dm))
+    assert sorted(child) == list(range(len(cities)))
+    assert AntColony(cities, dist_matrix=cd).dist_matrix.matrix is not None
+    assert GeneticAlgorithm(cities, dist_matrix=cd).dist_matrix is cd
@@ -0,0 +1,46 @@
+from algorithm.fitness_cache import FitnessCache
+from algorithm.ga import GeneticAlgorithm
+
+# ==============
+# FR: Un chemin déjà évalué n'est pas recalculé; les compteurs sont remis à zéro à la lecture.
+#
+# EN: An already evaluated path is not recomputed; the counters are reset when read.
+# =========
+def test_cache_hits_skip_the_computation():
+    calls = []
+    cache = FitnessCache(max_size=10)
+
+    def compute(path):
+        calls.append(path)
+        return float(sum(path))
+
+    assert cache.get([0, 2, 1], compute) == 3.0
+    assert cache.get((0, 2, 1), compute) == 3.0
+    assert len(calls) == 1
+    assert cache.pop_counters() == {"cache_hits": 1, "cache_misses": 1}
+    assert cache.pop_counters() == {"cache_hits": 0, "cache_misses": 0}
+
+# ==============
+# FR: Au-delà de max_size, l'entrée la moins récemment utilisée est retirée.
+#
+# EN: Beyond max_size, the least recently used entry is evicted.
+# =========
+def test_cache_evicts_the_least_recently_used_entry():
+    cache = FitnessCache(max_size=2)
+    compute = lambda path: float(path[-1])
+    cache.get([0, 1], compute)
+    cache.get([0, 2], compute)
+    cache.get([0, 1], compute)
+    cache.get([0, 3], compute)
+    assert list(cache.entries) == [(0, 1), (0, 3)]
+
+# ==============
+# FR: La qualité mise en cache par le GA est bien l'inverse de la longueur du chemin.
+#
+# EN: The fitness cached by the GA is the inverse of the path length.
+# =========
+def test_ga_fitness_matches_the_tour_length(cities):
+    ga = GeneticAlgorithm(cities, pop_size=10)
+    path = ga._random_tour()
+    assert ga.fitness(path) == ga.fitness(list(path)) == 1.0 / ga.total_distance(path)
+    assert ga.fitness_cache.pop_counters() == {"cache_hits": 1, "cache_misses": 1}
@@ -0,0 +1,39 @@
+import numpy as np
+from algorithm.ga import GeneticAlgorithm
+
+# ==============
+# FR: Vérifie que chaque ligne d'une population est une permutation des villes qui commence par la ville 0.
+#
+# EN: Checks that every row of a population is a permutation of the cities starting at city 0.
+# =========
+def assert_population(population, n):
+    for indiv in population:
+        assert indiv[0] == 0
+        assert sorted(int(city) for city in indiv) == list(range(n))
+
+# ==============
+# FR: Le mode par lots garde une population matricielle valide, évaluée comme chemin par chemin, et la meilleure
+# distance ne remonte jamais (élitisme).
+#
+# EN: Batched mode keeps a valid matrix population, evaluated as path by path, and the best distance never goes back
+# up (elitism).
+# =========
+def test_batched_generations_keep_valid_tours(cities):
+    ga = GeneticAlgorithm(cities, pop_size=30, max_gen=8, elitism_count=5, batched=True)
+    best = [result["best_distance"] for result in ga.run_step_by_step()]
+    assert all(later <= earlier for earlier, later in zip(best, best[1:]))
+    assert isinstance(ga.population, np.ndarray) and ga.population.shape == (30, len(cities))
+    assert_population(ga.population, len(cities))
+    assert np.allclose(ga._evaluate_population(ga.population),
+                       [ga.total_distance(indiv) for indiv in ga.population.tolist()])
+
+# ==============
+# FR: La mutation par voisins garde une permutation et la ville 0 en tête.
+#
+# EN: The neighbour mutation keeps a permutation with city 0 first.
+# =========
+def test_candidate_mutation_keeps_a_permutation(cities):
+    ga = GeneticAlgorithm(cities, pop_size=10, mutation_rate=0.5, candidates=5)
+    paths = [ga._random_tour() for _ in range(20)]
+    assert sum(ga._mutate(path)[0] for path in paths) > 0
+    assert_population(paths, len(cities))
@@ -0,0 +1,82 @@
+import json
+import numpy as np
+import pytest
+from algorithm.cli import main
+from algorithm.instances import load_csv, load_instance, load_tsplib, save_tour, save_tsplib, tsplib_length
+
+# ==============
+# FR: Une instance écrite au format TSPLIB se relit à l'identique (à la précision d'écriture près).
+#
+# EN: An instance written in TSPLIB format reads back identically (up to the written precision).
+# =========
+def test_tsplib_round_trip(tmp_path, cities):
+    path = tmp_path / "demo.tsp"
+    save_tsplib(str(path), "demo", cities, comment="test")
+    name, loaded = load_instance(str(path))
+    assert name == "demo"
+    assert np.allclose(loaded, cities, atol=1e-4)
+
+# ==============
+# FR: Les types de distance autres qu'EUC_2D (GEO, ATT...) sont refusés au lieu d'être traités comme euclidiens.
+#
+# EN: Distance types other than EUC_2D (GEO, ATT...) are rejected instead of being treated as Euclidean.
+# =========
+@pytest.mark.parametrize("edge_type", ["GEO", "ATT", "CEIL_2D", "MAN_2D", "MAX_2D", "EXPLICIT"])
+def test_non_euclidean_tsplib_is_rejected(tmp_path, edge_type):
+    path = tmp_path / "geo.tsp"
+    path.write_text(f"NAME : geo\nTYPE : TSP\nDIMENSION : 3\nEDGE_WEIGHT_TYPE : {edge_type}\n"
+                    "NODE_COORD_SECTION\n1 38.24 20.42\n2 39.57 26.15\n3 40.56 25.32\nEOF\n")
+    with pytest.raises(ValueError, match=edge_type):
+        load_tsplib(str(path))
+
+# ==============
+# FR: Le CSV accepte "x,y" ou "id,x,y" et ignore l'en-tête.
+#
+# EN: The CSV accepts "x,y" or "id,x,y" and skips the header.
+# =========
+def test_csv_with_header_and_ids(tmp_path):
+    path = tmp_path / "cities.csv"
+    path.write_text("id,x,y\n1,0,0\n2,3.5,4\n3,10,-2\n")
+    assert load_csv(str(path)) == [(0.0, 0.0), (3.5, 4.0), (10.0, -2.0)]
+
+# ==============
+# FR: Le tour écrit numérote les villes à partir de 1 et se termine par -1.
+#
+# EN: The written tour numbers the cities from 1 and ends with -1.
+# =========
+def test_save_tour(tmp_path):
+    path = tmp_path / "demo.tour"
+    save_tour(str(path), "demo", [0, 2, 1], 12.5)
+    lines = path.read_text().splitlines()
+    assert lines[lines.index("TOUR_SECTION") + 1:] == ["1", "3", "2", "-1", "EOF"]
+
+# ==============
+# FR: La ligne de commande résout une instance, écrit le tour et une ligne de mesures par exécution.
+#
+# EN: The command line solves an instance, writes the tour and one metrics line per run.
+# =========
+def test_cli_writes_tours_and_metrics(tmp_path, cities):
+    instance = tmp_path / "demo.tsp"
+    save_tsplib(str(instance), "demo", cities)
+    out = tmp_path / "out"
+    code = main([str(instance), "--algo", "GA", "--seeds", "0", "1", "--param", "max_gen=3",
+                 "--workers", "1", "--out", str(out)])
+    assert code == 0
+    records = [json.loads(line) for line in (out / "metrics.jsonl").read_text().splitlines()]
+    assert sorted(record["seed"] for record in records) == [0, 1]
+    assert all(record["n"] == len(cities) and record["params"] == {"max_gen": 3} for record in records)
+    assert (out / "demo_GA_s0.tour").exists()
+    lines = (out / "demo_GA_s0.tour").read_text().splitlines()
+    tour = [int(city) - 1 for city in lines[lines.index("TOUR_SECTION") + 1:-2]]
+    rounded = next(record["tsplib_distance"] for record in records if record["seed"] == 0)
+    assert rounded == tsplib_length(cities, tour) and f"COMMENT : Length {rounded}" in lines
+
+# ==============
+# FR: La longueur TSPLIB (EUC_2D) arrondit chaque arête à l'entier le plus proche avant la somme.
+#
+# EN: The TSPLIB (EUC_2D) length rounds every edge to the nearest integer before summing.
+# =========
+def test_tsplib_length_rounds_each_edge():
+    cities = [(0.0, 0.0), (3.0, 4.0), (3.0, 5.0), (0.0, 0.5)]
+    assert tsplib_length(cities, [0, 1, 2]) == 5 + 1 + 6
+    assert tsplib_length(cities, [0, 3]) == 1 + 1
@@ -0,0 +1,77 @@
+import contextlib
+import io
+import numpy as np
+import pytest
+from algorithm import island_ga, shared_arrays
+from algorithm.construction import greedy_edge
+from algorithm.distance_matrix import DistanceMatrix
+from algorithm.island_ga import IslandGeneticAlgorithm
+from algorithm.shared_arrays import SharedArray
+
+# ==============
+# FR: La population initiale est répartie entre les îles: chaque chemin fourni est présent, chaque île est complète.
+#
+# EN: The initial population is split across the islands: every given path is present, every island is full.
+# =========
+def test_initial_population_is_split_across_islands(cities):
+    ga = IslandGeneticAlgorithm(cities, islands=3, pop_size=8)
+    given = [ga._random_tour() for _ in range(5)]
+    populations = ga._split_population(given)
+    assert len(populations) == 3
+    assert all(len(population) == 8 for population in populations)
+    assert all(sorted(indiv) == list(range(len(cities))) and indiv[0] == 0
+               for population in populations for indiv in population)
+    flattened = [indiv for population in populations for indiv in population]
+    assert all(indiv in flattened for indiv in given)
+    assert ga._split_population(None) == [None, None, None]
+
+# ==============
+# FR: Une exécution amorcée par un bon tour ne fait jamais pire que lui (l'élitisme le conserve sur son île).
+#
+# EN: A run seeded with a good tour never does worse than it (elitism keeps it on its island).
+# =========
+def test_run_keeps_the_warm_population(cities):
+    dm = DistanceMatrix(cities)
+    seed = greedy_edge(dm)
+    ga = IslandGeneticAlgorithm(cities, islands=2, workers=1, pop_size=20, elitism_count=4, max_gen=4,
+                                migration_interval=2, seed_fraction=0, dist_matrix=dm, initial_population=[seed])
+    with contextlib.redirect_stdout(io.StringIO()):
+        path, distance = ga.run()
+    assert distance <= dm.tour_length(seed) + 1e-9
+    assert sorted(path) == list(range(len(cities)))
+    assert len(ga.population) == 40
+
+# ==============
+# FR: Le GA d'un processus de travail est construit une fois (listes de voisins comprises) puis réutilisé d'une époque
+# à l'autre, chacune partant de la population reçue.
+#
+# EN: A worker process's GA is built once (neighbour lists included) then reused from one epoch to the next, each
+# starting from the population it receives.
+# =========
+def test_worker_ga_is_reused_across_epochs(cities):
+    coords = SharedArray(np.asarray(cities, dtype=np.float64))
+    matrix = SharedArray(DistanceMatrix(cities).matrix)
+    try:
+        island_ga._init_worker(coords.spec, matrix.spec, {"pop_size": 10, "elitism_count": 4, "candidates": 5})
+        ga = island_ga._worker_ga
+        neighbour_lists = ga.neighbour_lists
+        history, final = island_ga._evolve_island(None, 3, seed=1)
+        assert len(history) == 3 and len(final) == 10
+        history, final = island_ga._evolve_island(final, 2, seed=2)
+        assert len(history) == 2 and island_ga._worker_ga is ga and ga.neighbour_lists is neighbour_lists
+        del ga
+        island_ga._release_worker()
+        assert island_ga._worker_ga is None and not shared_arrays._attached
+    finally:
+        coords.close()
+        matrix.close()
+
+# ==============
+# FR: Sans nombre de générations ni critère d'arrêt, l'exécution est refusée comme pour le GA simple.
+#
+# EN: Without a generation count or a stopping criterion, the run is rejected as for the plain GA.
+# =========
+def test_unbounded_run_requires_a_stopping_criterion(cities):
+    ga = IslandGeneticAlgorithm(cities, islands=2, workers=1, pop_size=10, max_gen=None)
+    with pytest.raises(ValueError):
+        next(ga.run_step_by_step())
@@ -0,0 +1,38 @@
+import subprocess
+import sys
+from pathlib import Path
+import pytest
+import algorithm
+
+# ==============
+# FR: Exécute du code dans un interpréteur neuf et retourne les modules lourds chargés, parmi ceux demandés.
+#
+# EN: Runs code in a fresh interpreter and returns the heavy modules loaded, among the requested ones.
+# =========
+def loaded_modules(code, modules):
+    probe = f"{code}\nimport sys\nprint(' '.join(m for m in {modules!r} if m in sys.modules))"
+    result = subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True, check=True,
+                            cwd=Path(__file__).resolve().parent.parent)
+    return result.stdout.split()
+
+# ==============
+# FR: Importer le paquet ne charge ni NumPy ni l'interface graphique; un solveur ne charge pas l'interface.
+#
+# EN: Importing the package loads neither NumPy nor the GUI; a solver does not load the GUI.
+# =========
+def test_package_import_is_lazy():
+    heavy = ["numpy", "tkinter", "matplotlib", "PIL"]
+    assert loaded_modules("import algorithm", heavy) == []
+    assert loaded_modules("from algorithm import GeneticAlgorithm, AntColony", heavy) == ["numpy"]
+    assert loaded_modules("import algorithm.cli", heavy[1:]) == []
+
+# ==============
+# FR: Chaque export se résout vers sa classe; un nom inconnu lève AttributeError.
+#
+# EN: Every export resolves to its class; an unknown name raises AttributeError.
+# =========
+def test_exports_resolve():
+    for name in algorithm.__all__:
+        assert getattr(algorithm, name).__name__ == name
+    with pytest.raises(AttributeError):
+        algorithm.Inconnu
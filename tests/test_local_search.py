@@ -0,0 +1,73 @@
+import random
+from algorithm.distance_matrix import CoordinateDistance, DistanceMatrix
+from algorithm.local_search import LocalSearch
+
+# ==============
+# FR: La recherche locale retourne une permutation de même première ville, jamais plus longue, avec sa longueur exacte.
+#
+# EN: The local search returns a permutation with the same first city, never longer, with its exact length.
+# =========
+def test_improve_never_lengthens_the_tour(cities):
+    dm = DistanceMatrix(cities)
+    search = LocalSearch(dm)
+    for _ in range(5):
+        path = list(range(len(cities)))
+        random.shuffle(path)
+        tour, length = search.improve(path)
+        assert tour[0] == path[0]
+        assert sorted(tour) == list(range(len(cities)))
+        assert abs(length - dm.tour_length(tour)) < 1e-6
+        assert length <= dm.tour_length(path) + 1e-9
+
+# ==============
+# FR: Avec des listes de voisins complètes, le résultat est un optimum local 2-opt (vérifié par force brute).
+#
+# EN: With full neighbour lists, the result is a 2-opt local optimum (checked by brute force).
+# =========
+def test_improve_reaches_a_two_opt_optimum(make_cities):
+    cities = make_cities(25)
+    dm = DistanceMatrix(cities)
+    tour, _ = LocalSearch(dm, candidates=len(cities) - 1, or_opt=False).improve(list(range(len(cities))))
+    n = len(tour)
+    for i in range(n - 1):
+        for j in range(i + 2, n if i else n - 1):
+            a, b, c, d = tour[i], tour[i + 1], tour[j], tour[(j + 1) % n]
+            delta = dm.dist(a, c) + dm.dist(b, d) - dm.dist(a, b) - dm.dist(c, d)
+            assert delta > -1e-6
+
+# ==============
+# FR: Restreinte à quelques villes actives et sans matrice (distances depuis les coordonnées), elle reste valide.
+#
+# EN: Restricted to a few active cities and without a matrix (distances from the coordinates), it stays valid.
+# =========
+def test_improve_with_active_cities_and_coordinates(cities):
+    distances = CoordinateDistance(cities)
+    path = list(range(len(cities)))
+    tour, length = LocalSearch(distances).improve(path, active=[1, 2, 3])
+    assert sorted(tour) == path and tour[0] == 0
+    assert length <= distances.tour_length(path) + 1e-9
+
+# ==============
+# FR: Le déplacement Or-opt sur place donne le même cycle que la reconstruction complète, positions comprises, que le
+# segment passe en avant ou en arrière et même à cheval sur la fin du tableau.
+#
+# EN: The in-place Or-opt move gives the same cycle as the full rebuild, positions included, whether the segment moves
+# forward or backward and even when it wraps around the end of the array.
+# =========
+def test_move_segment_matches_a_full_rebuild():
+    n = 12
+    for i in range(n):
+        for length in (1, 2, 3):
+            segment = [(i + k) % n for k in range(length)]
+            for j in range(n):
+                if j in segment or (j + 1) % n == i:
+                    continue
+                for seg in (segment, segment[::-1]):
+                    tour, pos = list(range(n)), list(range(n))
+                    LocalSearch._move_segment(tour, pos, i, list(seg), j)
+                    rest = [city for city in range(n) if city not in segment]
+                    at = rest.index(j) + 1
+                    expected = rest[:at] + list(seg) + rest[at:]
+                    start = tour.index(expected[0])
+                    assert tour[start:] + tour[:start] == expected
+                    assert all(tour[pos[city]] == city for city in range(n))
@@ -0,0 +1,40 @@
+import numpy as np
+from algorithm.pheromones import PheromoneStore
+
+# ==============
+# FR: L'évaporation se fait sur place et respecte le plancher minimum.
+#
+# EN: Evaporation happens in place and honours the minimum floor.
+# =========
+def test_evaporate_in_place_with_floor():
+    store = PheromoneStore(4, initial=0.1, minimum=0.04)
+    matrix = store.matrix
+    store.evaporate(0.5)
+    assert store.matrix is matrix
+    assert np.allclose(matrix, 0.05)
+    store.evaporate(0.5)
+    assert np.allclose(matrix, 0.04)
+
+# ==============
+# FR: Le dépôt groupé (arêtes répétées, chemins fermés, symétrie) égale un dépôt naïf arête par arête.
+#
+# EN: The grouped deposit (repeated edges, closed paths, symmetry) equals a naive edge-by-edge deposit.
+# =========
+def test_deposit_matches_a_naive_loop():
+    rng = np.random.default_rng(0)
+    n = 7
+    paths = [np.concatenate(([0], rng.permutation(np.arange(1, n)))) for _ in range(5)]
+    paths.append(paths[0])
+    amounts = rng.random(len(paths))
+    expected = np.full((n, n), 0.1)
+    for path, amount in zip(paths, amounts):
+        for i in range(n):
+            a, b = path[i - 1], path[i]
+            expected[a, b] += amount
+            expected[b, a] += amount
+    store = PheromoneStore(n)
+    store.deposit(paths, amounts)
+    assert np.allclose(store.matrix, expected)
+    single = PheromoneStore(n)
+    single.deposit(paths[0], [amounts[0]])
+    assert np.allclose(single.matrix[paths[0][0], paths[0][1]], 0.1 + amounts[0])
@@ -0,0 +1,98 @@
+import contextlib
+import io
+import random
+import pytest
+from algorithm.aco import AntColony
+from algorithm.ga import GeneticAlgorithm
+from algorithm.profiling import NULL_PROFILER, Profiler, get_profiler
+
+# ==============
+# FR: Exécute un GA de quelques générations avec une graine fixe; retourne sa meilleure distance.
+#
+# EN: Runs a GA for a few generations with a fixed seed; returns its best distance.
+# =========
+def _run_ga(cities, profiler=None, **params):
+    random.seed(7)
+    ga = GeneticAlgorithm(cities, max_gen=10, seed_fraction=0, profiler=profiler, **params)
+    with contextlib.redirect_stdout(io.StringIO()):
+        return ga.run()[1]
+
+# ==============
+# FR: Le profilage n'altère pas l'ordre des tirages aléatoires: mêmes résultats qu'avant l'ajout des points de mesure
+# (valeurs de référence), avec ou sans profileur.
+#
+# EN: Profiling does not alter the order of random draws: same results as before the measurement hooks were added
+# (reference values), with or without a profiler.
+# =========
+@pytest.mark.parametrize("params, expected", [
+    ({}, 10503.728309481006),
+    ({"candidates": 5}, 9714.954815100149),
+    ({"batched": True, "crossover": "pmx"}, 11642.879271702417),
+])
+def test_profiler_does_not_change_ga_results(cities, params, expected):
+    assert _run_ga(cities, **params) == pytest.approx(expected, rel=1e-12)
+    profiler = Profiler()
+    assert _run_ga(cities, profiler, **params) == pytest.approx(expected, rel=1e-12)
+    phases = profiler.summary()["phases_ms"]
+    assert {"GA", "selection", "crossover", "mutation", "evaluation"} <= set(phases)
+
+# ==============
+# FR: Les phases imbriquées comptent leur temps propre dans les piles repliées, et la trace garde chaque phase.
+#
+# EN: Nested phases count their self time in the folded stacks, and the trace keeps every phase.
+# =========
+def test_nested_phases_and_trace():
+    profiler = Profiler(trace=True)
+    with profiler.phase("outer"):
+        with profiler.phase("inner"):
+            profiler.count("draws", 3)
+    step = profiler.pop_step()
+    assert step["draws"] == 3 and step["outer_ms"] >= step["inner_ms"]
+    assert set(profiler.folded) == {"outer", "outer;inner"}
+    assert [event[0] for event in profiler.events] == ["inner", "outer"]
+    assert get_profiler(None) is NULL_PROFILER and NULL_PROFILER.pop_step() == {}
+
+# ==============
+# FR: Les compteurs rapportés sont mesurés au point où le travail a lieu: mutations réellement appliquées et
+# évaluations de distance égales aux échecs du cache.
+#
+# EN: The reported counters are measured where the work happens: mutations actually applied and distance evaluations
+# equal to the cache misses.
+# =========
+def test_counters_are_measured(cities, monkeypatch):
+    results = []
+    mutate = GeneticAlgorithm._mutate
+    monkeypatch.setattr(GeneticAlgorithm, "_mutate", lambda self, path: results.append(mutate(self, path)) or results[-1])
+    ga = GeneticAlgorithm(cities, max_gen=5, profiler=Profiler())
+    steps = list(ga.run_step_by_step())
+    assert sum(step["mutations"] for step in steps) == sum(swaps for swaps, _ in results) > 0
+    assert all(step["distance_evals"] == step["cache_misses"] for step in steps)
+
+# ==============
+# FR: Le compteur rng_draws du GA est égal au nombre d'appels random.* de la sélection, du croisement et de la mutation.
+#
+# EN: The GA's rng_draws counter equals the number of random.* calls of selection, crossover and mutation.
+# =========
+@pytest.mark.parametrize("params", [{}, {"candidates": 5}, {"crossover": "erx"}, {"crossover": "eax"}])
+def test_ga_counts_rng_draws(cities, monkeypatch, params):
+    ga = GeneticAlgorithm(cities, pop_size=20, max_gen=3, seed_fraction=0, profiler=Profiler(), **params)
+    population = ga._init_population()
+    calls = []
+    for name in ("random", "randint", "sample", "choice"):
+        draw = getattr(random, name)
+        monkeypatch.setattr(random, name, lambda *args, draw=draw: calls.append(1) or draw(*args))
+    steps = list(ga.run_step_by_step(population))
+    assert sum(step["rng_draws"] for step in steps) == len(calls) > 0
+
+# ==============
+# FR: L'ACO compte un tirage par fourmi et par pas de construction, en mode vectorisé, restreint aux voisins ou non.
+#
+# EN: ACO counts one draw per ant and per construction step, whether vectorized, neighbour-restricted or not.
+# =========
+@pytest.mark.parametrize("params", [{}, {"candidates": 5}, {"vectorized": False}])
+def test_aco_counts_rng_draws(cities, params):
+    profiler = Profiler()
+    colony = AntColony(cities, ant_count=6, iterations=2, profiler=profiler, **params)
+    with contextlib.redirect_stdout(io.StringIO()):
+        colony.run()
+    assert profiler.summary()["counters"]["rng_draws"] == 2 * 6 * (len(cities) - 1)
@@ -0,0 +1,107 @@
+from algorithm.renderer import TourRenderer
+
+class RecordingCanvas:
+    def __init__(self, width=400, height=300):
+        self.width = width
+        self.height = height
+        self.items = {}
+        self.created = 0
+
+    def winfo_width(self):
+        return self.width
+
+    def winfo_height(self):
+        return self.height
+
+    # ==============
+    # FR: Enregistre un nouvel élément (type, coordonnées, balises) et retourne son identifiant.
+    #
+    # EN: Records a new item (kind, coordinates, tags) and returns its id.
+    # =========
+    def _create(self, kind, coords, tags=(), **options):
+        self.created += 1
+        tags = (tags,) if isinstance(tags, str) else tuple(tags)
+        self.items[self.created] = {"kind": kind, "coords": list(coords), "tags": tags, **options}
+        return self.created
+
+    def create_line(self, *coords, **options):
+        return self._create("line", coords, **options)
+
+    def create_oval(self, *coords, **options):
+        return self._create("oval", coords, **options)
+
+    def create_text(self, *coords, **options):
+        return self._create("text", coords, **options)
+
+    def create_image(self, *coords, **options):
+        return self._create("image", coords, **options)
+
+    def coords(self, item, flat):
+        self.items[item]["coords"] = list(flat)
+
+    def itemconfigure(self, item, **options):
+        self.items[item].update(options)
+
+    def delete(self, target):
+        for item in [item for item, data in self.items.items() if item == target or target in data["tags"]]:
+            del self.items[item]
+
+    def tag_raise(self, tag):
+        pass
+
+    # ==============
+    # FR: Identifiants des éléments portant une balise.
+    #
+    # EN: Ids of the items carrying a tag.
+    # =========
+    def tagged(self, tag):
+        return [item for item, data in self.items.items() if tag in data["tags"]]
+
+CITIES = [(60, 60), (200, 80), (300, 200), (100, 220)]
+
+# ==============
+# FR: Les couches statiques ne sont redessinées que si la taille change; chaque chemin garde son polyligne fermé,
+# mis à jour sur place.
+#
+# EN: The static layers are only redrawn when the size changes; each path keeps its closed polyline, updated in place.
+# =========
+def test_render_reuses_static_layers_and_path_items():
+    canvas = RecordingCanvas()
+    renderer = TourRenderer(canvas)
+    renderer.set_cities(CITIES)
+    renderer.render([([0, 1, 2, 3], "red", 2)])
+    static = canvas.tagged("static")
+    assert len(canvas.tagged("cities")) == 2 * len(CITIES)
+    (path_item,) = canvas.tagged("path")
+    assert canvas.items[path_item]["coords"] == [60, 60, 200, 80, 300, 200, 100, 220, 60, 60]
+
+    renderer.render([([0, 2, 1, 3], "blue", 3)])
+    assert canvas.tagged("static") == static
+    assert canvas.tagged("path") == [path_item]
+    assert canvas.items[path_item]["fill"] == "blue"
+    assert canvas.items[path_item]["coords"][:4] == [60, 60, 300, 200]
+
+    renderer.render([])
+    assert canvas.tagged("path") == []
+    canvas.width = 500
+    renderer.render([])
+    assert canvas.tagged("static") and set(canvas.tagged("static")).isdisjoint(static)
+
+# ==============
+# FR: Le survol trouve les villes et les segments affichés, animation comprise, via les index spatiaux.
+#
+# EN: Hovering finds the displayed cities and segments, animation included, through the spatial indexes.
+# =========
+def test_hover_queries_follow_the_displayed_segments():
+    canvas = RecordingCanvas()
+    renderer = TourRenderer(canvas)
+    renderer.set_cities(CITIES)
+    renderer.render([([0, 1, 2, 3], "red", 2)])
+    assert renderer.city_at(62, 58, 5) == 0
+    assert renderer.city_at(150, 150, 5) is None
+    assert set(renderer.segment_at(130, 70, 5)) == {0, 1}
+    assert renderer.segment_at(180, 140, 5) is None
+    renderer.add_segment(0, 2, 0)
+    assert set(renderer.segment_at(180, 130, 5)) == {0, 2}
+    renderer.clear_animation()
+    assert renderer.segment_at(180, 130, 5) is None
@@ -0,0 +1,90 @@
+import numpy as np
+from algorithm.construction import greedy_edge
+from algorithm.distance_matrix import DistanceMatrix
+from algorithm.local_search import LocalSearch
+from algorithm.reoptimize import apply_diff, diff_cities, remap_pheromones, repair_tour, warm_params
+from algorithm.runner import reoptimize
+
+# ==============
+# FR: Retire, déplace et ajoute quelques villes à un ensemble.
+#
+# EN: Removes, moves and adds a few cities to a set.
+# =========
+def edit(cities):
+    return apply_diff(cities, removed=[3, 10], moved={5: (500.0, 500.0)}, added=[(1.0, 2.0), (900.0, 10.0)])
+
+# ==============
+# FR: La correspondance suit les villes conservées; diff_cities retrouve la même correspondance depuis les coordonnées.
+#
+# EN: The mapping follows the kept cities; diff_cities finds the same mapping from the coordinates.
+# =========
+def test_apply_diff_and_diff_cities_agree(cities):
+    new_cities, mapping, dirty = edit(cities)
+    assert len(new_cities) == len(cities) - 2 + 2
+    assert mapping[3] is None and mapping[10] is None
+    assert all(new_cities[mapping[i]] == cities[i] for i in range(len(cities)) if mapping[i] is not None and i != 5)
+    assert new_cities[mapping[5]] == (500.0, 500.0)
+    inferred, reinserted = diff_cities(cities, new_cities)
+    assert reinserted == sorted(dirty)
+    assert all(inferred[i] == mapping[i] for i in range(len(cities)) if i != 5)
+
+# ==============
+# FR: La réparation donne un tour valide des nouvelles villes, avec sa longueur exacte, qui reste proche de l'ancien.
+#
+# EN: The repair gives a valid tour of the new cities, with its exact length, that stays close to the old one.
+# =========
+def test_repair_tour_is_valid(cities):
+    old_tour = greedy_edge(DistanceMatrix(cities))
+    new_cities, mapping, dirty = edit(cities)
+    dm = DistanceMatrix(new_cities)
+    for local_search in (None, LocalSearch(dm)):
+        tour, length = repair_tour(old_tour, mapping, dirty, dm, local_search)
+        assert tour[0] == 0
+        assert sorted(tour) == list(range(len(new_cities)))
+        assert np.isclose(length, dm.tour_length(tour))
+
+# ==============
+# FR: Les phéromones des villes conservées suivent la correspondance; les villes réinsérées repartent du niveau moyen.
+#
+# EN: The kept cities' pheromones follow the mapping; reinserted cities restart from the mean level.
+# =========
+def test_remap_pheromones(cities):
+    n = len(cities)
+    matrix = np.random.default_rng(0).random((n, n))
+    _, mapping, dirty = edit(cities)
+    remapped = remap_pheromones(matrix, mapping, dirty, n)
+    assert remapped[mapping[1], mapping[2]] == matrix[1, 2]
+    assert np.all(remapped[mapping[5]] == matrix.mean())
+    assert np.all(remapped[:, dirty[-1]] == matrix.mean())
+
+# ==============
+# FR: La reprise à chaud remappe la population GA avec le tour réparé en tête, et part d'un tour jamais pire que lui.
+#
+# EN: The warm restart remaps the GA population with the repaired tour first, and ends never worse than it.
+# =========
+def test_warm_restart(cities):
+    old_dm = DistanceMatrix(cities)
+    state = {"tour": greedy_edge(old_dm), "population": [greedy_edge(old_dm)] * 4, "pheromones": None}
+    new_cities, mapping, dirty = edit(cities)
+    dm = DistanceMatrix(new_cities)
+    tour, length = repair_tour(state["tour"], mapping, dirty, dm)
+    params = warm_params("GA", {"pop_size": 10}, state, mapping, dirty, dm, tour)
+    assert params["initial_population"][0] == tour and len(params["initial_population"]) == 4
+    assert all(sorted(indiv) == list(range(len(new_cities))) for indiv in params["initial_population"])
+
+    path, distance, new_state = reoptimize("GA", new_cities, {"pop_size": 10, "max_gen": 3}, state, mapping, dirty)
+    assert sorted(path) == list(range(len(new_cities)))
+    assert distance <= repair_tour(state["tour"], mapping, dirty, dm, LocalSearch(dm))[1] + 1e-9
+    assert new_state["tour"] == path
+
+# ==============
+# FR: La reprise à chaud d'une décomposition en groupes répare le tour sans matrice n x n.
+#
+# EN: A warm restart of the cluster decomposition repairs the tour without an n x n matrix.
+# =========
+def test_cluster_warm_restart_uses_coordinates(cities):
+    state = {"tour": greedy_edge(DistanceMatrix(cities)), "population": None, "pheromones": None}
+    new_cities, mapping, dirty = edit(cities)
+    params = {"cluster_size": 15, "algo": "GA", "params": {"pop_size": 10, "max_gen": 2}, "workers": 1}
+    path, distance, _ = reoptimize("Cluster", new_cities, params, state, mapping, dirty)
+    assert sorted(path) == list(range(len(new_cities)))
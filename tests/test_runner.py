@@ -0,0 +1,111 @@
+import time
+import pytest
+from algorithm import runner as runner_module
+from algorithm.runner import GAStepper, SolverRunner, solve
+from algorithm.stats_logger import StatsLogger
+
+# ==============
+# FR: Tâche de test: envoie count progressions (distances décroissantes) puis retourne leur nombre.
+#
+# EN: Test job: sends count progress messages (decreasing distances) then returns their number.
+# =========
+def _chatty_job(count, logger=None, progress=None, cancel=None):
+    for step in range(count):
+        progress("GA", step, [0], float(count - step))
+    return count
+
+# ==============
+# FR: Appelle poll jusqu'à ce que toutes les tâches soient signalées (ou délai dépassé).
+#
+# EN: Calls poll until every job has been reported (or the timeout is reached).
+# =========
+def _poll_until_done(runner, timeout=60.0, max_items=500):
+    deadline = time.monotonic() + timeout
+    while runner.jobs and time.monotonic() < deadline:
+        runner.poll(max_items=max_items)
+        time.sleep(0.01)
+    assert not runner.jobs
+
+@pytest.fixture
+def runner():
+    runner = SolverRunner(workers=1)
+    yield runner
+    runner.shutdown()
+
+# ==============
+# FR: Tous les messages d'une tâche sont relayés avant son on_done, même avec une petite limite par appel de poll.
+#
+# EN: Every message of a job is relayed before its on_done, even with a small per-poll limit.
+# =========
+def test_progress_is_drained_before_on_done(runner):
+    events = []
+    runner.submit(_chatty_job, 200, on_progress=lambda *payload: events.append("progress"),
+                  on_done=lambda result: events.append(("done", result)))
+    _poll_until_done(runner, max_items=5)
+    assert events == ["progress"] * 200 + [("done", 200)]
+
+# ==============
+# FR: Une tâche de résolution retourne un tour valide et un état réutilisable.
+#
+# EN: A solve job returns a valid tour and a reusable state.
+# =========
+def test_solve_job_returns_tour_and_state(runner, cities):
+    results = []
+    runner.submit(solve, "GA", cities, {"max_gen": 3}, on_done=results.append)
+    _poll_until_done(runner)
+    path, distance, state = results[0]
+    assert sorted(path) == list(range(len(cities))) and distance > 0
+    assert state["tour"] == path and len(state["population"]) == 100
+
+# ==============
+# FR: Une fois la tâche terminée, un seul appel de poll relaie tous ses messages puis son on_done, malgré la limite.
+#
+# EN: Once the job has finished, a single poll call relays all its messages then its on_done, despite the limit.
+# =========
+def test_finished_job_is_reported_in_one_poll(runner):
+    events = []
+    job_id = runner.submit(_chatty_job, 50, on_progress=lambda *payload: events.append("progress"),
+                           on_done=lambda result: events.append(("done", result)))
+    runner.jobs[job_id]["future"].result(timeout=60)
+    runner.poll(max_items=5)
+    assert events == ["progress"] * 50 + [("done", 50)]
+
+# ==============
+# FR: Une tâche Cluster ne construit pas la matrice n x n du processus: le solveur calcule ses distances depuis les
+# coordonnées.
+#
+# EN: A Cluster job does not build the process' n x n matrix: the solver computes its distances from the coordinates.
+# =========
+def test_cluster_job_skips_the_distance_matrix(make_cities, monkeypatch):
+    monkeypatch.setattr(runner_module, "_worker_matrix", None)
+    cities = make_cities(60)
+    params = {"cluster_size": 20, "algo": "GA", "params": {"pop_size": 10, "max_gen": 2}, "workers": 1}
+    path, distance, state = solve("Cluster", cities, params)
+    assert sorted(path) == list(range(len(cities)))
+    assert runner_module._worker_matrix is None
+
+# ==============
+# FR: Le GA pas à pas avance dans le thread du runner: le même algorithme (et son cache) sert à chaque pas, et son
+# journal est relayé comme celui d'une tâche en processus.
+#
+# EN: The step-by-step GA advances in the runner's thread: the same algorithm (and its cache) serves every step, and
+# its log is relayed like a process job's.
+# =========
+def test_ga_stepper_keeps_its_algorithm_between_steps(tmp_path, cities):
+    logger = StatsLogger(str(tmp_path / "stats.jsonl"))
+    runner = SolverRunner(logger=logger, workers=1)
+    stepper = GAStepper(cities, {"pop_size": 20, "elitism_count": 4}, max_gen=4)
+    ga = stepper.ga
+    outputs = []
+    try:
+        for _ in range(5):
+            runner.submit(stepper.step, thread=True, on_done=outputs.append)
+            _poll_until_done(runner)
+            assert stepper.ga is ga and len(ga.fitness_cache.entries) > 0
+    finally:
+        runner.shutdown()
+        logger.close()
+    assert [result["generation"] for result, _ in outputs[:4]] == [1, 2, 3, 4]
+    assert outputs[4] == (None, outputs[3][1])
+    assert all(sorted(indiv) == list(range(len(cities))) for indiv in outputs[3][1])
+    assert logger.get("GA")["steps"].tolist() == [0, 1, 2, 3]
@@ -0,0 +1,58 @@
+import functools
+import multiprocessing
+import numpy as np
+from algorithm import shared_arrays
+from algorithm.shared_arrays import SharedArray, attach, detach, detach_at_exit
+
+# ==============
+# FR: Libération d'un processus fils: marque le résultat pour montrer qu'elle a eu lieu avant la fermeture.
+#
+# EN: Child process release: marks the result to show that it ran before the closing.
+# =========
+def _mark_released(result_spec):
+    attach(result_spec)[1] = 1.0
+
+# ==============
+# FR: Processus fils: ouvre le tableau partagé, écrit sa somme, puis programme sa libération et sa fermeture à la sortie.
+#
+# EN: Child process: opens the shared array, writes its sum, then schedules its release and closing at exit.
+# =========
+def _attach_in_child(spec, result_spec):
+    attach(result_spec)[0] = attach(spec).sum()
+    detach_at_exit(functools.partial(_mark_released, result_spec))
+
+# ==============
+# FR: detach ferme les segments ouverts par attach; un nouvel attach rouvre le segment, qui existe toujours.
+#
+# EN: detach closes the segments opened by attach; a new attach reopens the segment, which still exists.
+# =========
+def test_detach_closes_attached_segments():
+    shared = SharedArray(np.arange(6.0))
+    try:
+        assert attach(shared.spec).sum() == 15.0
+        assert shared.spec[0] in shared_arrays._attached
+        detach()
+        assert shared.spec[0] not in shared_arrays._attached
+        assert attach(shared.spec)[5] == 5.0
+        detach([shared.spec[0]])
+        assert not shared_arrays._attached
+    finally:
+        shared.close()
+
+# ==============
+# FR: Un processus de travail qui programme detach_at_exit se libère puis ferme ses segments à sa sortie.
+#
+# EN: A worker process that schedules detach_at_exit releases itself then closes its segments at exit.
+# =========
+def test_worker_detaches_at_exit():
+    shared = SharedArray(np.arange(4.0))
+    result = SharedArray(np.zeros(2))
+    try:
+        process = multiprocessing.Process(target=_attach_in_child, args=(shared.spec, result.spec))
+        process.start()
+        process.join(timeout=60)
+        assert process.exitcode == 0 and result.array.tolist() == [6.0, 1.0]
+        assert not shared_arrays._attached
+    finally:
+        shared.close()
+        result.close()
@@ -0,0 +1,49 @@
+import math
+import random
+from algorithm.spatial import SegmentGrid, SpatialGrid, _point_segment_d2, build_neighbour_lists
+
+# ==============
+# FR: Les k plus proches voisins de la grille égalent ceux d'un tri par force brute.
+#
+# EN: The grid's k nearest neighbours equal those of a brute-force sort.
+# =========
+def test_k_nearest_matches_brute_force(cities):
+    grid = SpatialGrid(cities)
+    for _ in range(30):
+        x, y = random.uniform(-100, 1100), random.uniform(-100, 1100)
+        expected = sorted(range(len(cities)), key=lambda i: (math.dist((x, y), cities[i]), i))[:6]
+        assert grid.k_nearest(x, y, 6) == expected
+    lists = build_neighbour_lists(cities, 4)
+    assert all(i not in row and len(row) == 4 for i, row in enumerate(lists))
+
+# ==============
+# FR: La recherche dans un rayon retourne le point le plus proche s'il est assez près, sinon None; un point retiré
+# n'est plus trouvé.
+#
+# EN: The radius search returns the closest point when near enough, else None; a removed point is no longer found.
+# =========
+def test_nearest_within_matches_brute_force(cities):
+    grid = SpatialGrid(cities)
+    for _ in range(50):
+        x, y = random.uniform(0, 1000), random.uniform(0, 1000)
+        radius = random.uniform(5, 80)
+        distance, closest = min((math.dist((x, y), city), i) for i, city in enumerate(cities))
+        assert grid.nearest_within(x, y, radius) == (closest if distance <= radius else None)
+    x, y = cities[7]
+    grid.remove(7)
+    assert grid.nearest_within(x, y, 1e-6) is None
+
+# ==============
+# FR: Le segment trouvé dans un rayon est le plus proche par force brute.
+#
+# EN: The segment found within a radius is the closest one by brute force.
+# =========
+def test_segment_nearest_within_matches_brute_force(cities):
+    grid = SegmentGrid(SpatialGrid(cities))
+    segments = [(i - 1, i) for i in range(len(cities))]
+    for a, b in segments:
+        grid.add(a, b)
+    for _ in range(50):
+        x, y = random.uniform(0, 1000), random.uniform(0, 1000)
+        d2, segment = min((_point_segment_d2(x, y, cities[a], cities[b]), (a, b)) for a, b in segments)
+        assert grid.nearest_within(x, y, 40) == (segment if d2 <= 40 ** 2 else None)
@@ -0,0 +1,210 @@
+import gc
+import json
+import weakref
+import numpy as np
+import pytest
+from algorithm.HybridTSP import HybridTSP
+from algorithm.stats_logger import StatsLogger
+
+# ==============
+# FR: Le temps de journalisation mesuré est écrit dans le journal et retrouvé au rechargement, en mode tampon ou
+# avec le thread d'écriture.
+#
+# EN: The measured logging time is written to the log and found again on reload, in buffered mode or with the
+# writer thread.
+# =========
+@pytest.mark.parametrize("asynchronous", [False, True])
+def test_log_time_survives_reload(tmp_path, asynchronous):
+    path = str(tmp_path / "stats.jsonl")
+    logger = StatsLogger(path, flush_every=3, asynchronous=asynchronous)
+    for gen in range(7):
+        logger.log("GA", 100.0 - gen, 0.01, generation=gen)
+    logger.close()
+    log_times = logger.get("GA")["log_times"]
+    assert not np.isnan(log_times).any() and (log_times > 0).all()
+
+    reloaded = StatsLogger(path).get("GA")
+    assert np.array_equal(reloaded["log_times"], log_times)
+    assert np.array_equal(reloaded["distances"], 100.0 - np.arange(7))
+
+# ==============
+# FR: Le surcoût de journalisation côté solveur est enregistré: chaque itération ACO porte celui de la précédente, et
+# l'entrée hybride la somme de ses deux phases.
+#
+# EN: The solver-side logging overhead is recorded: each ACO iteration carries the previous one's, and the hybrid
+# entry the sum of its two phases.
+# =========
+def test_solver_log_overhead_is_recorded(tmp_path):
+    cities = [(float(x), float((x * 7) % 11)) for x in range(12)]
+    logger = StatsLogger(str(tmp_path / "stats.jsonl"))
+    hybrid = HybridTSP(cities, logger=logger, ga_params={"pop_size": 10, "max_gen": 3, "elitism_count": 4},
+                       aco_params={"ant_count": 5, "iterations": 4})
+    hybrid.run()
+    logger.close()
+    aco = logger.get("ACO")["log_overheads"]
+    assert aco[0] == 0.0 and (aco[1:] > 0).all()
+    assert hybrid.aco.log_overhead == pytest.approx(hybrid.aco.log_overhead_total - aco.sum())
+    expected = hybrid.ga.log_overhead_total + hybrid.aco.log_overhead_total
+    assert logger.get("Hybride")["log_overheads"].tolist() == [pytest.approx(expected)]
+
+# ==============
+# FR: Après close, le thread d'écriture est arrêté: les entrées suivantes sont écrites aussitôt (sans bloquer sur la file
+# pleine), et le logger n'est plus retenu par atexit.
+#
+# EN: After close, the writer thread is stopped: later entries are written straight away (without blocking on the full
+# queue), and the logger is no longer kept alive by atexit.
+# =========
+def test_log_after_close_is_written(tmp_path):
+    path = tmp_path / "stats.jsonl"
+    logger = StatsLogger(str(path), asynchronous=True, queue_size=2)
+    logger.log("GA", 10.0, 0.1, generation=0)
+    logger.close()
+    assert not logger.writer.is_alive()
+    for gen in range(1, 6):
+        logger.log("GA", 10.0 - gen, 0.1, generation=gen)
+    logger.flush()
+    assert [json.loads(line)["distance"] for line in path.read_text().splitlines()] == [10.0, 9.0, 8.0, 7.0, 6.0, 5.0]
+    reference = weakref.ref(logger)
+    del logger
+    gc.collect()
+    assert reference() is None
+
+# ==============
+# FR: Lecture JSON stricte (comme JSON.parse): NaN et Infinity sont refusés.
+#
+# EN: Strict JSON parsing (like JSON.parse): NaN and Infinity are rejected.
+# =========
+def _strict_json(text):
+    def reject(constant):
+        raise ValueError(f"constante JSON invalide: {constant}")
+    return json.loads(text, parse_constant=reject)
+
+# ==============
+# FR: Le format JSON historique reste du JSON strict (valeurs absentes en null) et garde les extras de chaque ligne.
+#
+# EN: The legacy JSON format stays strict JSON (missing values as null) and keeps each row's extras.
+# =========
+def test_legacy_json_is_strict_and_keeps_extras(tmp_path):
+    path = tmp_path / "stats.json"
+    logger = StatsLogger(str(path))
+    logger.log("GA", 120.0, 0.5, generation=0, evaluations=90)
+    logger.log("GA", None, 0.4, generation=1)
+    logger.log("ACO", 99.0, None)
+    logger.flush()
+    content = _strict_json(path.read_text())
+    assert content["GA"]["distances"] == [120.0, None]
+    assert content["GA"]["extra"] == [{"generation": 0, "evaluations": 90}, {"generation": 1}]
+    assert content["ACO"]["times"] == [None] and content["ACO"]["steps"] == [None]
+
+    reloaded = StatsLogger(str(path))
+    assert reloaded.get("GA")["steps"].tolist() == [0, 1]
+    assert list(reloaded.extras["GA"]) == content["GA"]["extra"]
+    reloaded.log("GA", 110.0, 0.3, generation=2)
+    reloaded.flush()
+    assert _strict_json(path.read_text())["GA"]["extra"][-1] == {"generation": 2}
+
+# ==============
+# FR: Le format JSON historique n'est plus réécrit à chaque entrée mais par lots, comme le journal; le mode asynchrone
+# y est refusé.
+#
+# EN: The legacy JSON format is no longer rewritten on every entry but in batches, like the log; the asynchronous mode
+# is rejected for it.
+# =========
+def test_legacy_json_is_buffered(tmp_path):
+    path = tmp_path / "stats.json"
+    logger = StatsLogger(str(path), flush_every=3, flush_interval=60)
+    logger.log("GA", 10.0, 0.1, generation=0)
+    logger.log("GA", 9.0, 0.1, generation=1)
+    assert not path.exists()
+    logger.log("GA", 8.0, 0.1, generation=2)
+    logger.log("GA", 7.0, 0.1, generation=3)
+    assert _strict_json(path.read_text())["GA"]["distances"] == [10.0, 9.0, 8.0]
+    logger.close()
+    assert _strict_json(path.read_text())["GA"]["distances"] == [10.0, 9.0, 8.0, 7.0]
+    with pytest.raises(ValueError):
+        StatsLogger(str(path), asynchronous=True)
+
+# ==============
+# FR: Un stats.json historique à côté d'un journal stats.jsonl absent est converti une fois, avec un message, et
+# l'ancien fichier est conservé.
+#
+# EN: A legacy stats.json next to a missing stats.jsonl log is converted once, with a message, and the old file is
+# kept.
+# =========
+def test_legacy_json_is_migrated_to_the_log(tmp_path, capsys):
+    legacy = tmp_path / "stats.json"
+    legacy.write_text(json.dumps({"GA": {"distances": [5.0, 4.0], "times": [0.1, 0.1], "run_ids": [1, 2],
+                                         "extra": [{"generation": 0}, {"generation": 0}]}}))
+    logger = StatsLogger(str(tmp_path / "stats.jsonl"))
+    assert "stats.jsonl" in capsys.readouterr().out
+    stats = logger.get("GA")
+    assert stats["distances"].tolist() == [5.0, 4.0] and stats["steps"].tolist() == [0, 0]
+    assert stats["run_ids"].tolist() == [1, 2] and logger.new_run() == 3
+    assert legacy.exists()
+    StatsLogger(str(tmp_path / "stats.jsonl"))
+    assert capsys.readouterr().out == ""
+
+# ==============
+# FR: Un fichier au format d'origine (sans steps ni log_times) se charge, les étapes étant tirées des extras.
+#
+# EN: A file in the original format (without steps or log_times) loads, the steps being taken from the extras.
+# =========
+def test_original_json_format_loads(tmp_path):
+    path = tmp_path / "stats.json"
+    path.write_text(json.dumps({"GA": {"distances": [5.0, 4.0], "times": [0.1, 0.1],
+                                       "extra": [{"generation": 0}, {"generation": 1}]}}))
+    stats = StatsLogger(str(path)).get("GA")
+    assert stats["distances"].tolist() == [5.0, 4.0] and stats["steps"].tolist() == [0, 1]
+
+# ==============
+# FR: Le journal JSON Lines n'est écrit que par lots (flush_every), puis rejoué à l'identique; une dernière ligne
+# tronquée par un arrêt brutal est ignorée et la suite du journal repart sur une nouvelle ligne.
+#
+# EN: The JSON Lines log is only written in batches (flush_every), then replayed identically; a last line truncated
+# by an abrupt stop is skipped and the rest of the log starts on a new line.
+# =========
+def test_append_only_log_round_trip_and_truncated_line(tmp_path):
+    path = tmp_path / "stats.jsonl"
+    logger = StatsLogger(str(path), flush_every=4, flush_interval=60)
+    for gen in range(3):
+        logger.log("ACO", 50.0 - gen, 0.1, iteration=gen)
+    assert not path.exists() or path.read_text() == ""
+    logger.log("ACO", 47.0, 0.1, iteration=3)
+    logger.log("ACO", 46.0, 0.1, iteration=4)
+    assert len(path.read_text().splitlines()) == 4
+    logger.close()
+
+    with open(path, "a") as f:
+        f.write('{"algo": "ACO", "dist')
+    reloaded = StatsLogger(str(path))
+    assert np.array_equal(reloaded.get("ACO")["distances"], 50.0 - np.arange(5))
+    assert np.array_equal(reloaded.get("ACO")["steps"], np.arange(5))
+    reloaded.log("ACO", 45.0, 0.1, iteration=5)
+    reloaded.close()
+    assert len(StatsLogger(str(path)).get("ACO")["distances"]) == 6
+
+# ==============
+# FR: Les numéros d'exécution viennent de new_run et non des étapes: une reprise à chaud qui continue la numérotation
+# ouvre bien une nouvelle exécution; ils sont conservés au rechargement et la suite reçoit un nouveau numéro.
+#
+# EN: Run numbers come from new_run, not from the steps: a warm restart that continues the numbering does open a new
+# run; they are kept on reload and the next run gets a new number.
+# =========
+@pytest.mark.parametrize("name", ["stats.jsonl", "stats.json"])
+def test_run_ids_are_explicit(tmp_path, name):
+    path = str(tmp_path / name)
+    logger = StatsLogger(path)
+    first = logger.new_run()
+    for gen in range(2):
+        logger.log("GA", 10.0 - gen, 0.1, generation=gen)
+    second = logger.new_run()
+    for gen in range(2, 4):
+        logger.log("GA", 8.0 - gen, 0.1, generation=gen)
+    logger.log("GA", 3.0, 0.1, generation=0)
+    logger.close()
+    expected = [first, first, second, second, second]
+    assert logger.get("GA")["run_ids"].tolist() == expected
+
+    reloaded = StatsLogger(path)
+    assert reloaded.get("GA")["run_ids"].tolist() == expected
+    assert reloaded.new_run() == second + 1
@@ -0,0 +1,74 @@
+import random
+import numpy as np
+import pytest
+
+pytest.importorskip("matplotlib")
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from algorithm.stats_logger import StatsLogger
+from algorithm.stats_plot import LiveStatsPlot
+
+# ==============
+# FR: Page de statistiques sur un canevas Agg hors écran, journal limité à 30 lignes pour faire tourner le tampon.
+#
+# EN: Stats page on an off-screen Agg canvas, log capped at 30 rows so that the ring buffer wraps.
+# =========
+@pytest.fixture
+def plot(tmp_path):
+    logger = StatsLogger(str(tmp_path / "stats.jsonl"), max_records=30)
+    figure = Figure()
+    plot = LiveStatsPlot(figure, FigureCanvasAgg(figure), logger)
+    yield plot
+    logger.close()
+
+# ==============
+# FR: Une fois le tampon circulaire plein, l'histogramme reste incrémental: pas de rendu complet tant que les classes
+# ne changent pas, et il compte exactement les distances conservées.
+#
+# EN: Once the ring buffer has wrapped, the histogram stays incremental: no full draw while the bins do not change,
+# and it counts exactly the retained distances.
+# =========
+def test_histogram_stays_incremental_after_wrap(plot):
+    rng = random.Random(0)
+    logger = plot.logger
+    for gen in range(30):
+        logger.log("GA", 1000.0 + 100.0 * (gen % 2), 0.01, generation=gen)
+    plot.refresh("GA")
+    plot.canvas.draw()
+    for gen in range(30, 200):
+        logger.log("GA", rng.uniform(1000.0, 1100.0), 0.01, generation=gen)
+        if gen % 3 == 0:
+            logger.log("GA", None, 0.01, generation=gen + 1000)
+        changed, full = plot._update_histograms()
+        assert changed and not full
+        state = plot.histograms["GA"]
+        values = logger.get("GA")["distances"]
+        assert state["counts"].tolist() == np.histogram(values[~np.isnan(values)], state["edges"])[0].tolist()
+
+# ==============
+# FR: Une distance hors des classes les recalcule sur toute la fenêtre (rendu complet).
+#
+# EN: A distance outside the bins recomputes them over the whole window (full draw).
+# =========
+def test_histogram_rebuilds_when_edges_change(plot):
+    for gen in range(10):
+        plot.logger.log("GA", 500.0 + gen, 0.01, generation=gen)
+    plot.refresh("GA")
+    plot.logger.log("GA", 5000.0, 0.01, generation=10)
+    changed, full = plot._update_histograms()
+    state = plot.histograms["GA"]
+    assert changed and full and state["edges"][-1] >= 5000.0
+    assert int(state["counts"].sum()) == 11
+
+# ==============
+# FR: Le surcoût de journalisation côté solveur est tracé sur l'axe des temps, à côté du calcul et de la journalisation.
+#
+# EN: The solver-side logging overhead is plotted on the time axis, next to the computation and the logging.
+# =========
+def test_solver_overhead_is_plotted(plot):
+    for gen in range(5):
+        plot.logger.log("ACO", 100.0 - gen, 0.01, iteration=gen, log_overhead=0.001 * gen)
+    plot.refresh("ACO")
+    x, overheads = plot.overhead_line.get_data()
+    assert list(x) == [1, 2, 3, 4, 5]
+    assert np.allclose(overheads, 0.001 * np.arange(5))
@@ -0,0 +1,57 @@
+import contextlib
+import io
+import time
+import pytest
+from algorithm.aco import AntColony
+from algorithm.ga import GeneticAlgorithm
+from algorithm.stopping import StoppingCriteria
+
+# ==============
+# FR: La stagnation compte les tours sans amélioration relative supérieure à epsilon; le premier tour passe toujours.
+#
+# EN: Stagnation counts the rounds without a relative improvement above epsilon; the first round always runs.
+# =========
+def test_stagnation_rounds_and_epsilon():
+    criteria = StoppingCriteria(stagnation_rounds=2, stagnation_eps=0.01)
+    assert not criteria.should_stop()
+    for distance in (100.0, 99.5, 99.2):
+        criteria.update(distance)
+    assert criteria.should_stop() and criteria.reason == "stagnation"
+    criteria.start()
+    for distance in (100.0, 98.0, 97.9):
+        criteria.update(distance)
+    assert not criteria.should_stop()
+
+# ==============
+# FR: Le budget arrête avant un tour qui le dépasserait; sans critère, un nombre de tours illimité est refusé.
+#
+# EN: The budget stops before a round that would exceed it; without a criterion, unbounded rounds are refused.
+# =========
+def test_time_budget_and_unbounded_rounds():
+    criteria = StoppingCriteria(time_budget=0.05)
+    time.sleep(0.03)
+    criteria.update(10.0)
+    assert criteria.should_stop() and criteria.reason == "budget"
+    assert criteria.remaining() < 0.05
+    assert list(StoppingCriteria().rounds(2, 3)) == [2, 3, 4]
+    with pytest.raises(ValueError):
+        StoppingCriteria().rounds(0, None)
+
+# ==============
+# FR: Sans limite de générations, le GA et l'ACO s'arrêtent sur stagnation ou budget avec un tour valide.
+#
+# EN: Without a generation limit, the GA and ACO stop on stagnation or budget with a valid tour.
+# =========
+def test_solvers_stop_early(cities):
+    ga = GeneticAlgorithm(cities, pop_size=20, max_gen=None, stagnation_rounds=3)
+    steps = list(ga.run_step_by_step())
+    assert ga.stopping.reason == "stagnation" and len(steps) >= 4
+    assert sorted(steps[-1]["best_path"]) == list(range(len(cities)))
+
+    colony = AntColony(cities, ant_count=5, iterations=None, time_budget=0.2)
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        path, _ = colony.run()
+    assert time.perf_counter() - start < 1.0
+    assert colony.stopping.reason == "budget"
+    assert sorted(path) == list(range(len(cities)))